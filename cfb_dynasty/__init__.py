@@ -24,6 +24,11 @@ from .config.constants import (
 )
 from .utils.file_utils import load_roster, export_files
 from .utils.validator import validate_player_data, validate_roster_columns
+from .utils.instrumentation import (
+    enable_instrumentation,
+    disable_instrumentation,
+    get_instrumentation_report
+)
 
 __all__ = [
     'Player',
@@ -40,4 +45,7 @@ __all__ = [
     'export_files',
     'validate_player_data',
     'validate_roster_columns',
+    'enable_instrumentation',
+    'disable_instrumentation',
+    'get_instrumentation_report',
 ]
\ No newline at end of file
@@ -10,6 +10,11 @@ from ..config.constants import (
     DEFAULT_POSITION_REQUIREMENTS,
     STARTERS_COUNT
 )
+from ..config.schema import ROSTER_SCHEMA
+from ..utils.file_utils import ingest_csv, output_name
+from ..utils.instrumentation import instrument
+from ..utils.manifest import InputManifest
+from ..utils.memory import memory_stage
 
 
 def calculate_player_value(row, dev_trait_multipliers=None, rs_discount_rate=None):
@@ -27,6 +32,8 @@ def calculate_player_value(row, dev_trait_multipliers=None, rs_discount_rate=Non
     
     # Handle both 'BASE RATING' and 'BASE OVERALL' column names for backward compatibility
     base_rating = row.get('BASE RATING', row.get('BASE OVERALL', 0))
+    if pd.isna(base_rating):
+        return float('nan')
     
     value = round(
         base_rating * dev_multiplier * (1 + remaining_dev_years / 4) * (1 - discount), 2
@@ -92,6 +99,7 @@ def calculate_blended_measure(df, position):
     return blended_value
 
 
+@instrument('scheme_fit')
 def scheme_fit(roster_df, position_requirements=None):
     """
     Determine the scheme fit for each position group for recruiting purposes.
@@ -112,8 +120,8 @@ def scheme_fit(roster_df, position_requirements=None):
         archetypes = requirements['archetypes']
 
         # Calculate scheme fit for each player
-        position_df.loc[:, 'SCHEME FIT'] = position_df['ARCHETYPE'].apply(
-            lambda archetype: archetypes.get(archetype, 0)
+        position_df.loc[:, 'SCHEME FIT'] = (
+            position_df['ARCHETYPE'].map(archetypes).astype(float).fillna(0)
         )
 
         # Identify players with weak or non-scheme fits
@@ -151,6 +159,7 @@ def scheme_fit(roster_df, position_requirements=None):
     return roster_df, scheme_fit_df
 
 
+@instrument('process_roster_and_create_recruiting_plan')
 def process_roster_and_create_recruiting_plan(roster_path, position_requirements=None):
     """
     Main function to process the roster and create recruiting plan.
@@ -165,7 +174,9 @@ def process_roster_and_create_recruiting_plan(roster_path, position_requirements
     if position_requirements is None:
         position_requirements = DEFAULT_POSITION_REQUIREMENTS
     
-    roster_df = pd.read_csv(roster_path)
+    with memory_stage('recruiting_plan.read'):
+        # Every column is kept: the valuation export carries the user's extra columns through
+        roster_df = ingest_csv(roster_path, schema=ROSTER_SCHEMA)
 
     # Ensure the required columns are present
     required_columns = [
@@ -182,27 +193,33 @@ def process_roster_and_create_recruiting_plan(roster_path, position_requirements
         raise ValueError(f"CSV file is missing required columns: {missing_columns}")
 
     # Calculate player values
-    roster_df['VALUE'] = roster_df.apply(calculate_player_value, axis=1)
+    with memory_stage('recruiting_plan.value'):
+        roster_df['VALUE'] = roster_df.apply(calculate_player_value, axis=1)
 
     # Fill missing archetype values
-    roster_df['ARCHETYPE'] = roster_df['ARCHETYPE'].fillna('')
+    archetypes = roster_df['ARCHETYPE']
+    if isinstance(archetypes.dtype, pd.CategoricalDtype) and '' not in archetypes.cat.categories:
+        archetypes = archetypes.cat.add_categories('')
+    roster_df['ARCHETYPE'] = archetypes.fillna('')
 
     # Scheme fit analysis
-    roster_df, scheme_fit_df = scheme_fit(roster_df, position_requirements)
+    with memory_stage('recruiting_plan.scheme_fit'):
+        roster_df, scheme_fit_df = scheme_fit(roster_df, position_requirements)
 
     # Determine the best player at each position
-    roster_df['Best at Position'] = roster_df.groupby('POSITION')['RATING'].transform(
+    roster_df['Best at Position'] = roster_df.groupby('POSITION', observed=True)['RATING'].transform(
         lambda x: x == x.max()
     )
 
     # Apply player status function
-    roster_df['STATUS'] = roster_df.apply(player_status, axis=1)
+    with memory_stage('recruiting_plan.status'):
+        roster_df['STATUS'] = roster_df.apply(player_status, axis=1)
 
     # Drop the temporary 'Best at Position' column
     roster_df.drop(columns=['Best at Position'], inplace=True)
 
     # Calculate the number of players at each position for the next season
-    next_season_counts = roster_df[roster_df['STATUS'] != 'GRADUATING'].groupby('POSITION').size()
+    next_season_counts = roster_df[roster_df['STATUS'] != 'GRADUATING'].groupby('POSITION', observed=True).size()
 
     # Calculate the blended measure for each position
     blended_values = {
@@ -219,7 +236,8 @@ def process_roster_and_create_recruiting_plan(roster_path, position_requirements
     roster_df['POSITION'] = pd.Categorical(
         roster_df['POSITION'], categories=position_order, ordered=True
     )
-    roster_df.sort_values(by=['POSITION', 'RATING'], ascending=[True, False], inplace=True)
+    with memory_stage('recruiting_plan.sort'):
+        roster_df.sort_values(by=['POSITION', 'RATING'], ascending=[True, False], inplace=True)
 
     # Create the recruiting plan DataFrame
     recruiting_plan = pd.DataFrame({
@@ -255,15 +273,23 @@ def main():
         os.mkdir(data_folder)
     
     roster_files = glob.glob(os.path.join(downloads_folder, '*[Rr]oster.csv'))
+    manifest = InputManifest(data_folder)
+    params = {'position_requirements': DEFAULT_POSITION_REQUIREMENTS}
     
     for roster_path in roster_files:
+        if manifest.is_current('analysis', [roster_path], params):
+            print(f"⏭️  Unchanged since last run, keeping previous results for {roster_path}")
+            continue
+
         roster_df, recruiting_plan = process_roster_and_create_recruiting_plan(roster_path)
         
-        player_values_path = os.path.join(data_folder, 'player_values_corrected.csv')
-        recruiting_plan_path = os.path.join(data_folder, 'recruiting_plan.csv')
+        player_values_path = os.path.join(data_folder, output_name(roster_path, 'player_values_corrected.csv'))
+        recruiting_plan_path = os.path.join(data_folder, output_name(roster_path, 'recruiting_plan.csv'))
         
         roster_df.to_csv(player_values_path, index=False)
         recruiting_plan.to_csv(recruiting_plan_path, index=False)
+        manifest.record('analysis', [roster_path], [player_values_path, recruiting_plan_path], params)
+        manifest.save()
         
         print(f"Processed {roster_path}")
         print("Player valuations and statuses have been recalculated and saved to CSV.")
@@ -0,0 +1,11 @@
+"""
+CFB Dynasty Benchmark Package
+
+Contains the benchmark suite for the roster, analysis, export and geography
+hot paths. Run it with ``python -m cfb_dynasty.bench`` or ``cfb-dynasty-bench``.
+"""
+
+from .suite import run_suite, main
+from .regression import compare_to_baseline, scaling_exponent
+
+__all__ = ['run_suite', 'main', 'compare_to_baseline', 'scaling_exponent']
@@ -0,0 +1,6 @@
+"""Entry point for ``python -m cfb_dynasty.bench``."""
+
+from .suite import main
+
+if __name__ == "__main__":
+    main()
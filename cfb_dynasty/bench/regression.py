@@ -0,0 +1,120 @@
+"""Performance budget checks against stored benchmark baselines."""
+
+import json
+import math
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TOLERANCE = 0.25
+
+# Benchmarks faster than this are dominated by timer noise and never fail the gate
+MIN_GATED_SECONDS = 0.05
+
+
+def load_results(path: str) -> dict:
+    """Load benchmark results or a baseline written by the benchmark suite."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(results: dict, path: str) -> None:
+    """Store benchmark results as the baseline for later comparisons."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
+    logger.info(f"Saved performance baseline to {path}")
+
+
+def _index(results: dict) -> Dict[Tuple[str, int], dict]:
+    return {(r['benchmark'], r['teams']): r for r in results['results']}
+
+
+def compare_to_baseline(results: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE,
+                        metric: str = 'min_s') -> List[dict]:
+    """
+    Find benchmarks that got slower than the baseline allows.
+
+    Only benchmarks present in both result sets are compared.
+
+    Args:
+        results (dict): Current benchmark suite output
+        baseline (dict): Stored benchmark suite output
+        tolerance (float): Allowed slowdown as a fraction (0.25 = 25% slower)
+        metric (str): Timing field to compare; the fastest run is the least noisy
+
+    Returns:
+        list: One dict per regression with ``benchmark``, ``teams``,
+        ``baseline``, ``current`` and ``ratio``; empty if within budget
+    """
+    baseline_index = _index(baseline)
+    regressions = []
+
+    for key, current in _index(results).items():
+        reference = baseline_index.get(key)
+        if reference is None or reference.get(metric) is None:
+            continue
+
+        allowed = max(reference[metric], MIN_GATED_SECONDS) * (1 + tolerance)
+        if current[metric] > allowed:
+            regressions.append({
+                'benchmark': key[0],
+                'teams': key[1],
+                'baseline': reference[metric],
+                'current': current[metric],
+                'ratio': current[metric] / reference[metric],
+            })
+
+    return regressions
+
+
+def scaling_exponent(func_for_size: Callable[[int], Callable], sizes: Sequence[int],
+                     repeat: int = 3) -> float:
+    """
+    Estimate how runtime grows with input size.
+
+    Each size is timed ``repeat`` times and the fastest run is kept. The
+    exponent is the slope of log(time) against log(size): about 1 for linear
+    work and 2 for quadratic work.
+
+    Args:
+        func_for_size (callable): Takes a size and returns a zero-argument callable
+            that does the work for that size (setup happens outside the timing)
+        sizes (sequence): Input sizes, e.g. (n, 2n)
+        repeat (int): Timed runs per size
+
+    Returns:
+        float: Fitted scaling exponent
+    """
+    points = []
+    for size in sizes:
+        work = func_for_size(size)
+        best = math.inf
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            work()
+            best = min(best, time.perf_counter() - start_time)
+        points.append((math.log(size), math.log(best)))
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    return numerator / denominator
+
+
+def format_regressions(regressions: List[dict], tolerance: Optional[float] = None) -> str:
+    """Format regressions as one line each for logs and test failures."""
+    header = "Performance regressions"
+    if tolerance is not None:
+        header += f" (tolerance {tolerance:.0%})"
+    lines = [header + ":"]
+    for r in regressions:
+        lines.append(
+            f"  {r['benchmark']} @ {r['teams']} teams: {r['current']:.4f}s vs "
+            f"{r['baseline']:.4f}s baseline ({r['ratio']:.2f}x)"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,235 @@
+"""Benchmark suite for CFB Dynasty Data hot paths."""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..analysis.roster_analysis import process_roster_and_create_recruiting_plan, scheme_fit
+from ..config.constants import DEFAULT_POSITION_REQUIREMENTS
+from ..data.roster_generator import generate_roster
+from ..data.synthetic import FBS_SCHOOLS, generate_league
+from ..utils.file_utils import export_files
+from ..utils.instrumentation import (
+    instrument,
+    enable_instrumentation,
+    disable_instrumentation,
+    reset_instrumentation,
+    get_instrumentation_report
+)
+from ..utils.log import get_logger
+from ..utils.performance import analysis_cache, optimized_value_calculation
+from .regression import (
+    DEFAULT_TOLERANCE,
+    compare_to_baseline,
+    format_regressions,
+    load_results,
+    save_baseline
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_SCALES = [1, 10, 134]
+
+
+def build_league_inputs(teams: int, seed: int = 0) -> Dict[str, pd.DataFrame]:
+    """
+    Build a league-wide roster and recruiting board for benchmarking.
+
+    Args:
+        teams (int): Number of teams in the league
+        seed (int): Random seed
+
+    Returns:
+        dict: ``roster`` (with player values filled in) and ``recruits``
+        DataFrames; ``school`` is the first team, which the rollover
+        benchmark uses
+    """
+    league = generate_league(teams=teams, seasons=1, seed=seed)
+    roster_df = league['roster'].drop(columns=['SEASON'])
+    roster_df['VALUE'] = optimized_value_calculation(roster_df)['VALUE']
+    analysis_cache.clear()
+
+    return {
+        'roster': roster_df,
+        'recruits': league['recruits'].drop(columns=['SEASON']),
+        'school': FBS_SCHOOLS[0],
+    }
+
+
+def _benchmarks(inputs: Dict[str, pd.DataFrame], work_dir: str) -> Dict[str, Callable]:
+    """Return benchmark name -> zero-argument callable for one scale."""
+    roster_df = inputs['roster']
+    recruits_df = inputs['recruits']
+    roster_path = os.path.join(work_dir, 'Bench_Roster.csv')
+    roster_df.to_csv(roster_path, index=False)
+
+    # generate_roster maps every column onto Player, which has no RATING field
+    rollover_df = roster_df.drop(columns=['RATING'])
+
+    def run_value_calculation():
+        analysis_cache.clear()
+        return optimized_value_calculation(roster_df)
+
+    return {
+        'generate_roster': lambda: generate_roster(rollover_df, recruits_df, inputs['school']),
+        'process_roster_and_create_recruiting_plan': lambda: process_roster_and_create_recruiting_plan(roster_path),
+        'scheme_fit': lambda: scheme_fit(roster_df),
+        'optimized_value_calculation': run_value_calculation,
+        'export_files': lambda: export_files(
+            folder=work_dir, roster_df=roster_df, position_requirements=DEFAULT_POSITION_REQUIREMENTS
+        ),
+    }
+
+
+def _geography_benchmark() -> Optional[Tuple[Callable, int]]:
+    """Return a benchmark of cached city lookups and its lookup count, or None if unavailable."""
+    try:
+        from geography.geocoding import get_city_coordinates
+        from geography.simple_cache import load_coordinates
+    except ImportError as e:
+        logger.warning(f"Skipping geography benchmark: {e}")
+        return None
+
+    pairs = [(city, state) for state, cities in load_coordinates().items() for city in cities]
+
+    def run_lookups():
+        for city, state in pairs:
+            get_city_coordinates(city, state)
+        return len(pairs)
+
+    return (run_lookups, len(pairs)) if pairs else None
+
+
+def _measure(name: str, func: Callable, repeat: int, trace_memory: bool, rows: int) -> dict:
+    """Run one benchmark ``repeat`` times and summarize it."""
+    reset_instrumentation()
+    enable_instrumentation(trace_memory=trace_memory)
+    timed = instrument(f"bench.{name}", count_rows=lambda args, kwargs, result: rows)(func)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(repeat):
+                timed()
+        stats = get_instrumentation_report()[f"bench.{name}"]
+    finally:
+        disable_instrumentation()
+        reset_instrumentation()
+
+    return {
+        'benchmark': name,
+        'rows': rows,
+        'repeat': repeat,
+        'min_s': stats['min_s'],
+        'p50_s': stats['p50_s'],
+        'p95_s': stats['p95_s'],
+        'mean_s': stats['mean_s'],
+        'max_s': stats['max_s'],
+        'rows_per_sec': stats['rows_per_sec'],
+        'peak_memory_bytes': stats['peak_memory_bytes'],
+    }
+
+
+def run_suite(scales: Optional[List[int]] = None, repeat: int = 3, trace_memory: bool = True,
+              benchmarks: Optional[List[str]] = None, seed: int = 0) -> dict:
+    """
+    Run every benchmark at each league scale.
+
+    Args:
+        scales (list): Team counts to benchmark (default: 1, 10 and 134)
+        repeat (int): Timed runs per benchmark and scale
+        trace_memory (bool): Record tracemalloc peak memory (slows the runs)
+        benchmarks (list): Only run benchmarks with these names
+        seed (int): Random seed for the generated league
+
+    Returns:
+        dict: ``meta`` describing the environment and ``results``, one entry
+        per benchmark and scale
+    """
+    scales = scales or DEFAULT_SCALES
+    results = []
+
+    for teams in scales:
+        logger.info(f"Benchmarking {teams}-team league")
+        inputs = build_league_inputs(teams, seed=seed)
+
+        with tempfile.TemporaryDirectory() as work_dir:
+            suite = _benchmarks(inputs, work_dir)
+            rows = {name: len(inputs['roster']) for name in suite}
+            rows['generate_roster'] += len(inputs['recruits'])
+
+            # Geography lookups don't depend on league size; run them once
+            geography = _geography_benchmark() if teams == scales[0] else None
+            if geography is not None:
+                suite['geography_lookup'], rows['geography_lookup'] = geography
+
+            for name, func in suite.items():
+                if benchmarks and name not in benchmarks:
+                    continue
+                result = _measure(name, func, repeat, trace_memory, rows[name])
+                result['teams'] = teams
+                results.append(result)
+                logger.info(f"{name} @ {teams} teams: p50 {result['p50_s']:.4f}s")
+
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point for the benchmark suite."""
+    parser = argparse.ArgumentParser(description="Benchmark CFB Dynasty Data hot paths")
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES,
+                        help="League sizes in teams (default: 1 10 134)")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per benchmark")
+    parser.add_argument('--benchmark', action='append', dest='benchmarks',
+                        help="Only run the named benchmark (repeatable)")
+    parser.add_argument('--no-memory', action='store_true', help="Skip tracemalloc peak memory")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for generated data")
+    parser.add_argument('--output', help="Write JSON results to this file instead of stdout")
+    parser.add_argument('--baseline', help="Fail if any benchmark is slower than this baseline JSON")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown against the baseline (default: 0.25)")
+    parser.add_argument('--save-baseline', help="Store the results as a new baseline JSON")
+    args = parser.parse_args(argv)
+
+    results = run_suite(
+        scales=args.scales,
+        repeat=args.repeat,
+        trace_memory=not args.no_memory,
+        benchmarks=args.benchmarks,
+        seed=args.seed,
+    )
+
+    payload = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(payload + '\n')
+    else:
+        sys.stdout.write(payload + '\n')
+
+    if args.save_baseline:
+        save_baseline(results, args.save_baseline)
+
+    if args.baseline:
+        regressions = compare_to_baseline(results, load_results(args.baseline), args.tolerance)
+        if regressions:
+            sys.stderr.write(format_regressions(regressions, args.tolerance) + '\n')
+            sys.exit(1)
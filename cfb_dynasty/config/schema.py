@@ -0,0 +1,50 @@
+# COLUMN SCHEMAS
+# dtype plans passed to pd.read_csv so roster and recruit frames are compact
+# on arrival instead of being converted after an object-dtype read.
+
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    STRING_DTYPE = 'string'
+
+# Low-cardinality text columns
+CATEGORICAL_COLUMNS = ['POSITION', 'YEAR', 'DEV TRAIT', 'ARCHETYPE', 'STATUS', 'STATE']
+
+# Ratings fit in 0-255; nullable so blank ratings in generated rosters still load
+RATING_COLUMNS = ['OVERALL', 'BASE OVERALL', 'BASE RATING', 'RATING']
+
+NAME_COLUMNS = ['FIRST NAME', 'LAST NAME', 'CITY']
+
+ROSTER_SCHEMA = {
+    **{col: STRING_DTYPE for col in NAME_COLUMNS},
+    **{col: 'category' for col in CATEGORICAL_COLUMNS},
+    **{col: 'UInt8' for col in RATING_COLUMNS},
+}
+
+RECRUIT_SCHEMA = {
+    **ROSTER_SCHEMA,
+    'COMMITTED TO': 'category',
+    'GEM STATUS': 'category',
+    'STARS': 'UInt8',
+    'NATIONAL RANKING': 'UInt16',
+}
+
+# HEADER ALIASES
+# Headers are upper-cased with underscores read as spaces before lookup, so
+# 'national_rank' and 'National Ranking' both resolve here.
+HEADER_ALIASES = {
+    'BASE RATING': 'BASE OVERALL',
+    'NATIONAL RANK': 'NATIONAL RANKING',
+}
+
+# CONSUMER COLUMN SETS
+# Columns each reader actually uses; ingest_csv projects to these at parse time.
+
+# Fields accepted by Player, which generate_roster builds from every column
+GENERATION_COLUMNS = [
+    'FIRST NAME', 'LAST NAME', 'POSITION', 'YEAR', 'OVERALL', 'BASE OVERALL',
+    'CITY', 'STATE', 'ARCHETYPE', 'DEV TRAIT', 'CUT', 'DRAFTED', 'REDSHIRT',
+    'VALUE', 'STATUS', 'TEAM', 'NATIONAL RANKING', 'STARS', 'GEM STATUS',
+    'COMMITTED TO', 'TRANSFER', 'TRANSFER OUT',
+]
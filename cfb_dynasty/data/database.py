@@ -0,0 +1,336 @@
+"""SQLite dynasty database for multi-season history and ad-hoc queries.
+
+Players are keyed by ``Player.player_id``; season rosters, recruits,
+valuations and recruiting plans are keyed by season and team. Loads replace
+the season/team they cover inside a single transaction, so re-running a
+season's analysis never duplicates rows.
+"""
+
+import contextlib
+import os
+import queue
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import pandas as pd
+
+from ..models.player import player_ids
+from ..utils.file_utils import DEFAULT_FOLDER
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_DATABASE_PATH = os.path.join(DEFAULT_FOLDER, 'cfb_dynasty_data', 'dynasty.db')
+
+# Rows per executemany call during bulk loads
+BATCH_SIZE = 5000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    player_id TEXT PRIMARY KEY,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    position TEXT NOT NULL,
+    city TEXT,
+    state TEXT
+);
+CREATE TABLE IF NOT EXISTS season_rosters (
+    season INTEGER NOT NULL,
+    team TEXT NOT NULL,
+    player_id TEXT NOT NULL REFERENCES players (player_id),
+    year TEXT,
+    overall INTEGER,
+    base_overall INTEGER,
+    archetype TEXT,
+    dev_trait TEXT,
+    redshirt INTEGER,
+    cut INTEGER,
+    transfer_out INTEGER,
+    drafted TEXT,
+    PRIMARY KEY (season, team, player_id)
+);
+CREATE TABLE IF NOT EXISTS recruits (
+    season INTEGER NOT NULL,
+    team TEXT NOT NULL,
+    player_id TEXT NOT NULL REFERENCES players (player_id),
+    year TEXT,
+    overall INTEGER,
+    base_overall INTEGER,
+    archetype TEXT,
+    dev_trait TEXT,
+    stars INTEGER,
+    national_ranking INTEGER,
+    gem_status TEXT,
+    committed_to TEXT,
+    PRIMARY KEY (season, team, player_id)
+);
+CREATE TABLE IF NOT EXISTS valuations (
+    season INTEGER NOT NULL,
+    team TEXT NOT NULL,
+    player_id TEXT NOT NULL REFERENCES players (player_id),
+    value REAL,
+    status TEXT,
+    PRIMARY KEY (season, team, player_id)
+);
+CREATE TABLE IF NOT EXISTS plans (
+    season INTEGER NOT NULL,
+    team TEXT NOT NULL,
+    position TEXT NOT NULL,
+    current_count INTEGER,
+    min_required INTEGER,
+    blended_value REAL,
+    grade TEXT,
+    priority TEXT,
+    PRIMARY KEY (season, team, position)
+);
+CREATE INDEX IF NOT EXISTS idx_players_position ON players (position);
+CREATE INDEX IF NOT EXISTS idx_season_rosters_team ON season_rosters (team, season);
+CREATE INDEX IF NOT EXISTS idx_season_rosters_player ON season_rosters (player_id);
+CREATE INDEX IF NOT EXISTS idx_recruits_team ON recruits (team, season);
+CREATE INDEX IF NOT EXISTS idx_recruits_player ON recruits (player_id);
+CREATE INDEX IF NOT EXISTS idx_valuations_team ON valuations (team, season);
+CREATE INDEX IF NOT EXISTS idx_valuations_player ON valuations (player_id);
+CREATE INDEX IF NOT EXISTS idx_plans_position ON plans (position, season);
+"""
+
+# DataFrame column -> table column for each table
+PLAYER_COLUMNS = {
+    'FIRST NAME': 'first_name', 'LAST NAME': 'last_name', 'POSITION': 'position',
+    'CITY': 'city', 'STATE': 'state',
+}
+ROSTER_COLUMNS = {
+    'YEAR': 'year', 'OVERALL': 'overall', 'BASE OVERALL': 'base_overall',
+    'ARCHETYPE': 'archetype', 'DEV TRAIT': 'dev_trait', 'REDSHIRT': 'redshirt',
+    'CUT': 'cut', 'TRANSFER OUT': 'transfer_out', 'DRAFTED': 'drafted',
+}
+RECRUIT_COLUMNS = {
+    'YEAR': 'year', 'OVERALL': 'overall', 'BASE OVERALL': 'base_overall',
+    'ARCHETYPE': 'archetype', 'DEV TRAIT': 'dev_trait', 'STARS': 'stars',
+    'NATIONAL RANKING': 'national_ranking', 'GEM STATUS': 'gem_status',
+    'COMMITTED TO': 'committed_to',
+}
+VALUATION_COLUMNS = {'VALUE': 'value', 'STATUS': 'status'}
+PLAN_COLUMNS = {
+    'Position': 'position', 'Current Count': 'current_count', 'Min Required': 'min_required',
+    'Blended Value': 'blended_value', 'Grade': 'grade', 'Priority': 'priority',
+}
+
+NUMERIC_COLUMNS = {
+    'overall', 'base_overall', 'stars', 'national_ranking', 'value',
+    'current_count', 'min_required', 'blended_value',
+}
+
+
+def _column_values(df: pd.DataFrame, columns: Dict[str, str]) -> Dict[str, list]:
+    """Convert the mapped columns of a frame into SQLite-bindable Python lists."""
+    values = {}
+    for source, target in columns.items():
+        if source not in df.columns:
+            values[target] = [None] * len(df)
+            continue
+        series = df[source]
+        if target in NUMERIC_COLUMNS:
+            series = pd.to_numeric(series, errors='coerce')
+        series = series.astype(object)
+        values[target] = series.where(series.notna(), None).tolist()
+    return values
+
+
+class _ConnectionPool:
+    """Fixed-size pool of SQLite connections shared between threads."""
+
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        conn.execute('PRAGMA foreign_keys = ON')
+        if self.path != ':memory:':
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('PRAGMA synchronous = NORMAL')
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                conn = self._connect()
+                self._all.append(conn)
+                return conn
+        return self._idle.get()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        self._idle.put(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+            self._created = 0
+            self._idle = queue.LifoQueue()
+
+
+class DynastyDatabase:
+    """Embedded SQLite store for players, season rosters, recruits, valuations and plans."""
+
+    def __init__(self, path: Optional[str] = None, pool_size: int = 4):
+        """
+        Args:
+            path (str): Database file (default: ~/Downloads/cfb_dynasty_data/dynasty.db);
+                ':memory:' keeps the database in memory with a single connection
+            pool_size (int): Maximum number of pooled connections
+        """
+        self.path = path or DEFAULT_DATABASE_PATH
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        else:
+            # Every in-memory connection would be a separate database
+            pool_size = 1
+        self._pool = _ConnectionPool(self.path, pool_size)
+
+        with self.connection() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextlib.contextmanager
+    def connection(self):
+        """Borrow a pooled connection for the enclosed block."""
+        conn = self._pool.acquire()
+        try:
+            yield conn
+        finally:
+            self._pool.release(conn)
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self._pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _insert(self, conn: sqlite3.Connection, sql: str, rows: Iterable[tuple]) -> None:
+        """Run executemany in BATCH_SIZE chunks."""
+        rows = list(rows)
+        for start in range(0, len(rows), BATCH_SIZE):
+            conn.executemany(sql, rows[start:start + BATCH_SIZE])
+
+    def _upsert_players(self, conn: sqlite3.Connection, df: pd.DataFrame, ids: List[str]) -> None:
+        values = _column_values(df, PLAYER_COLUMNS)
+        self._insert(
+            conn,
+            'INSERT OR IGNORE INTO players (player_id, first_name, last_name, position, city, state) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            zip(ids, *values.values()),
+        )
+
+    def _load_player_table(self, table: str, df: pd.DataFrame, columns: Dict[str, str],
+                           season: int, team: str) -> int:
+        ids = player_ids(df).tolist()
+        values = _column_values(df, columns)
+        names = ['season', 'team', 'player_id', *values.keys()]
+        sql = (f"INSERT OR REPLACE INTO {table} ({', '.join(names)}) "
+               f"VALUES ({', '.join('?' * len(names))})")
+
+        with self.connection() as conn, conn:
+            conn.execute(f'DELETE FROM {table} WHERE season = ? AND team = ?', (season, team))
+            self._upsert_players(conn, df, ids)
+            self._insert(conn, sql, zip([season] * len(df), [team] * len(df), ids, *values.values()))
+
+        logger.debug(f"Loaded {len(df)} rows into {table} for {team} {season}")
+        return len(df)
+
+    def load_roster(self, roster_df: pd.DataFrame, season: int, team: str) -> int:
+        """
+        Load a team's roster for one season, replacing any roster stored for it.
+
+        Args:
+            roster_df (pd.DataFrame): Roster with the standard roster columns
+            season (int): Season the roster belongs to
+            team (str): Team name
+
+        Returns:
+            int: Number of rows loaded
+        """
+        return self._load_player_table('season_rosters', roster_df, ROSTER_COLUMNS, season, team)
+
+    def load_recruits(self, recruits_df: pd.DataFrame, season: int, team: str) -> int:
+        """Load a team's recruiting board for one season, replacing any stored board."""
+        return self._load_player_table('recruits', recruits_df, RECRUIT_COLUMNS, season, team)
+
+    def load_valuations(self, roster_df: pd.DataFrame, season: int, team: str) -> int:
+        """Load player VALUE and STATUS from a processed roster for one season."""
+        return self._load_player_table('valuations', roster_df, VALUATION_COLUMNS, season, team)
+
+    def load_plan(self, recruiting_plan: pd.DataFrame, season: int, team: str) -> int:
+        """Load a recruiting plan for one season, replacing any stored plan."""
+        values = _column_values(recruiting_plan, PLAN_COLUMNS)
+        names = ['season', 'team', *values.keys()]
+        sql = (f"INSERT OR REPLACE INTO plans ({', '.join(names)}) "
+               f"VALUES ({', '.join('?' * len(names))})")
+        count = len(recruiting_plan)
+
+        with self.connection() as conn, conn:
+            conn.execute('DELETE FROM plans WHERE season = ? AND team = ?', (season, team))
+            self._insert(conn, sql, zip([season] * count, [team] * count, *values.values()))
+        return count
+
+    def query(self, sql: str, params: Sequence = ()) -> pd.DataFrame:
+        """Run a read query on a pooled connection and return the result as a DataFrame."""
+        with self.connection() as conn:
+            return pd.read_sql_query(sql, conn, params=params)
+
+    def position_history(self, position: str, team: Optional[str] = None,
+                         seasons: Optional[Sequence[int]] = None) -> pd.DataFrame:
+        """
+        Return every rostered player at a position across seasons with their valuations.
+
+        Args:
+            position (str): Position code, e.g. 'QB'
+            team (str): Only this team (default: all teams)
+            seasons (list): Only these seasons (default: all seasons)
+
+        Returns:
+            pd.DataFrame: One row per player-season, ordered by season and value
+        """
+        sql = """
+            SELECT r.season, r.team, p.player_id, p.first_name, p.last_name, p.position,
+                   r.year, r.overall, r.base_overall, r.dev_trait, v.value, v.status
+            FROM players p
+            JOIN season_rosters r ON r.player_id = p.player_id
+            LEFT JOIN valuations v
+                ON v.season = r.season AND v.team = r.team AND v.player_id = r.player_id
+            WHERE p.position = ?
+        """
+        params: list = [position]
+        if team is not None:
+            sql += ' AND r.team = ?'
+            params.append(team)
+        if seasons:
+            sql += f" AND r.season IN ({', '.join('?' * len(seasons))})"
+            params.extend(seasons)
+        sql += ' ORDER BY r.season, v.value DESC'
+        return self.query(sql, params)
+
+    def player_history(self, player_id: str) -> pd.DataFrame:
+        """Return one player's season-by-season roster rows and valuations."""
+        return self.query("""
+            SELECT r.*, v.value, v.status
+            FROM season_rosters r
+            LEFT JOIN valuations v
+                ON v.season = r.season AND v.team = r.team AND v.player_id = r.player_id
+            WHERE r.player_id = ?
+            ORDER BY r.season
+        """, (player_id,))
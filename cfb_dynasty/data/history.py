@@ -0,0 +1,256 @@
+"""Event-sourced roster history.
+
+Each recorded roster becomes a version holding only what changed since the
+previous one, keyed by ``Player.player_id``:
+
+* ``add`` - a player joined; carries every column
+* ``remove`` - a player left
+* ``update`` - only the columns whose values changed (YEAR, OVERALL, STATUS, ...)
+
+Events are appended to ``events.jsonl`` and never rewritten. Every
+``snapshot_every`` versions the full roster is also written as a snapshot, so
+reconstructing any week or season reads one snapshot and replays at most
+``snapshot_every - 1`` versions of events, located by byte offset.
+"""
+
+import gzip
+import json
+import math
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from ..models.player import player_ids
+from ..utils.export_writer import write_json_atomic
+from ..utils.file_utils import DEFAULT_FOLDER
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_HISTORY_FOLDER = os.path.join(DEFAULT_FOLDER, 'cfb_dynasty_data', 'history')
+
+DEFAULT_SNAPSHOT_EVERY = 10
+
+EVENTS_FILE = 'events.jsonl'
+INDEX_FILE = 'versions.json'
+SNAPSHOT_FOLDER = 'snapshots'
+
+
+def _clean(value: Any) -> Any:
+    """Convert a cell to a JSON value, with every kind of missing value as None."""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if hasattr(value, 'item'):
+        return _clean(value.item())
+    return value
+
+
+def _roster_state(roster_df: pd.DataFrame) -> Tuple[List[str], Dict[str, dict]]:
+    """Key a roster by player_id, returning (columns, player_id -> row dict)."""
+    columns = [col for col in roster_df.columns if col != 'Best at Position']
+    ids = player_ids(roster_df)
+    duplicated = ids.duplicated()
+    if duplicated.any():
+        logger.warning(f"Ignoring {int(duplicated.sum())} duplicate player(s) when recording history")
+
+    values = roster_df.loc[~duplicated.to_numpy(), columns].astype(object).to_numpy().tolist()
+    state = {
+        pid: {col: _clean(value) for col, value in zip(columns, row)}
+        for pid, row in zip(ids[~duplicated], values)
+    }
+    return columns, state
+
+
+def _diff(previous: Dict[str, dict], current: Dict[str, dict]) -> List[dict]:
+    events = []
+    for pid, row in current.items():
+        before = previous.get(pid)
+        if before is None:
+            events.append({'op': 'add', 'player_id': pid, 'fields': row})
+            continue
+        changed = {col: value for col, value in row.items() if before.get(col) != value}
+        changed.update({col: None for col in before if col not in row and before[col] is not None})
+        if changed:
+            events.append({'op': 'update', 'player_id': pid, 'fields': changed})
+    for pid in previous:
+        if pid not in current:
+            events.append({'op': 'remove', 'player_id': pid})
+    return events
+
+
+def _apply(state: Dict[str, dict], events: List[dict]) -> None:
+    for event in events:
+        if event['op'] == 'add':
+            state[event['player_id']] = dict(event['fields'])
+        elif event['op'] == 'update':
+            state[event['player_id']].update(event['fields'])
+        else:
+            state.pop(event['player_id'], None)
+
+
+class RosterHistory:
+    """Append-only roster history with periodic snapshots and time travel."""
+
+    def __init__(self, folder: Optional[str] = None, snapshot_every: int = DEFAULT_SNAPSHOT_EVERY):
+        """
+        Args:
+            folder (str): History directory (default: ~/Downloads/cfb_dynasty_data/history)
+            snapshot_every (int): Write a full snapshot every this many versions
+        """
+        self.folder = folder or DEFAULT_HISTORY_FOLDER
+        self.snapshot_every = max(1, snapshot_every)
+        os.makedirs(os.path.join(self.folder, SNAPSHOT_FOLDER), exist_ok=True)
+
+        try:
+            with open(os.path.join(self.folder, INDEX_FILE), 'r', encoding='utf-8') as f:
+                self._versions: List[dict] = json.load(f)['versions']
+        except (OSError, ValueError):
+            self._versions = []
+
+        self._latest: Optional[Dict[str, dict]] = None
+        self._columns: List[str] = self._versions[-1]['columns'] if self._versions else []
+
+    # Storage helpers
+
+    def _snapshot_path(self, version: int) -> str:
+        return os.path.join(self.folder, SNAPSHOT_FOLDER, f"v{version:06d}.json.gz")
+
+    def _write_snapshot(self, version: int, state: Dict[str, dict]) -> None:
+        temp_path = self._snapshot_path(version) + '.tmp'
+        with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temp_path, self._snapshot_path(version))
+
+    def _read_snapshot(self, version: int) -> Dict[str, dict]:
+        with gzip.open(self._snapshot_path(version), 'rt', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _read_events(self, entry: dict) -> List[dict]:
+        with open(os.path.join(self.folder, EVENTS_FILE), 'rb') as f:
+            f.seek(entry['offset'])
+            data = f.read(entry['length'])
+        return [json.loads(line) for line in data.splitlines() if line]
+
+    def _state_at(self, version: int) -> Dict[str, dict]:
+        """Rebuild the roster at a version from the nearest snapshot at or before it."""
+        base = max(v['version'] for v in self._versions[:version] if v['snapshot'])
+        state = self._read_snapshot(base)
+        for entry in self._versions[base:version]:
+            _apply(state, self._read_events(entry))
+        return state
+
+    def _latest_state(self) -> Dict[str, dict]:
+        if self._latest is None:
+            self._latest = self._state_at(len(self._versions)) if self._versions else {}
+        return self._latest
+
+    # Public API
+
+    def record(self, roster_df: pd.DataFrame, season: int, week: Optional[int] = None) -> dict:
+        """
+        Append a roster as a new version.
+
+        Args:
+            roster_df (pd.DataFrame): Roster for this point in time
+            season (int): Season
+            week (int): Week within the season (None for a season-level roster,
+                which sorts before week 0)
+
+        Returns:
+            dict: Version entry with ``version``, ``season``, ``week`` and counts of
+            ``adds``, ``removes`` and ``updates``
+        """
+        key = (season, -1 if week is None else week)
+        if self._versions:
+            last = self._versions[-1]
+            if key < (last['season'], -1 if last['week'] is None else last['week']):
+                raise ValueError(f"Season {season} week {week} is earlier than the latest recorded version")
+
+        columns, current = _roster_state(roster_df)
+        previous = self._latest_state()
+        events = _diff(previous, current)
+        version = len(self._versions) + 1
+
+        payload = ''.join(json.dumps(event) + '\n' for event in events).encode('utf-8')
+        events_path = os.path.join(self.folder, EVENTS_FILE)
+        with open(events_path, 'ab') as f:
+            offset = f.tell()
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+        snapshot = version == 1 or (version - 1) % self.snapshot_every == 0
+        if snapshot:
+            self._write_snapshot(version, current)
+
+        entry = {
+            'version': version,
+            'season': season,
+            'week': week,
+            'recorded': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'offset': offset,
+            'length': len(payload),
+            'snapshot': snapshot,
+            'columns': columns,
+            'adds': sum(e['op'] == 'add' for e in events),
+            'removes': sum(e['op'] == 'remove' for e in events),
+            'updates': sum(e['op'] == 'update' for e in events),
+        }
+        self._versions.append(entry)
+        write_json_atomic(os.path.join(self.folder, INDEX_FILE), {'versions': self._versions})
+
+        self._latest = current
+        self._columns = columns
+        logger.info(f"Recorded history version {version} (season {season}, week {week}): "
+                    f"{entry['adds']} added, {entry['removes']} removed, {entry['updates']} updated")
+        return {k: entry[k] for k in ('version', 'season', 'week', 'adds', 'removes', 'updates')}
+
+    def versions(self) -> pd.DataFrame:
+        """Return the recorded versions with their change counts."""
+        return pd.DataFrame(self._versions, columns=[
+            'version', 'season', 'week', 'recorded', 'snapshot', 'adds', 'removes', 'updates'
+        ])
+
+    def at_version(self, version: int) -> pd.DataFrame:
+        """Reconstruct the roster as recorded in a version (1-based)."""
+        if not 1 <= version <= len(self._versions):
+            raise ValueError(f"Unknown history version: {version}")
+        state = self._state_at(version)
+        frame = pd.DataFrame.from_dict(state, orient='index', columns=self._versions[version - 1]['columns'])
+        return frame.rename_axis('player_id')
+
+    def as_of(self, season: int, week: Optional[int] = None) -> pd.DataFrame:
+        """
+        Reconstruct the roster as of a season (and week).
+
+        Returns the latest version recorded at or before that point.
+
+        Args:
+            season (int): Season
+            week (int): Week (default: the end of the season)
+
+        Returns:
+            pd.DataFrame: Roster indexed by player_id
+        """
+        target = (season, math.inf if week is None else week)
+        eligible = [
+            v['version'] for v in self._versions
+            if (v['season'], -1 if v['week'] is None else v['week']) <= target
+        ]
+        if not eligible:
+            raise ValueError(f"No history recorded on or before season {season} week {week}")
+        return self.at_version(eligible[-1])
+
+    def player_changes(self, player_id: str) -> List[dict]:
+        """Return every event for one player, tagged with its version, season and week."""
+        changes = []
+        for entry in self._versions:
+            for event in self._read_events(entry):
+                if event['player_id'] == player_id:
+                    changes.append({'version': entry['version'], 'season': entry['season'],
+                                    'week': entry['week'], **event})
+        return changes
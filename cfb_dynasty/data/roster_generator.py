@@ -6,12 +6,19 @@ import os
 import glob
 from typing import Optional
 from ..utils.log import setup_logging, get_logger
+from ..utils.instrumentation import instrument
+from ..utils.memory import memory_stage, record_copy
+from ..utils.export_writer import write_exports
+from ..utils.file_utils import ingest_csv, output_name
+from ..utils.manifest import InputManifest
+from ..config.schema import GENERATION_COLUMNS, ROSTER_SCHEMA, RECRUIT_SCHEMA
 from ..models.player import Player
 
 # Create logger for this module
 logger = get_logger(__name__)
 
 
+@instrument('generate_roster', count_rows=lambda args, kwargs, result: len(result))
 def generate_roster(roster_df: pd.DataFrame, recruits_df: pd.DataFrame, school_name: Optional[str] = None) -> pd.DataFrame:
     """
     Generate a new roster by combining existing roster with recruits.
@@ -52,8 +59,11 @@ def generate_roster(roster_df: pd.DataFrame, recruits_df: pd.DataFrame, school_n
     logger.debug("Input validation completed successfully")
 
     # Work with copies to avoid modifying original data
-    roster_copy = roster_df.copy()
-    recruits_copy = recruits_df.copy()
+    with memory_stage('generate_roster.copy_inputs'):
+        roster_copy = roster_df.copy()
+        recruits_copy = recruits_df.copy()
+        record_copy('generate_roster.roster_copy', roster_copy)
+        record_copy('generate_roster.recruits_copy', recruits_copy)
 
     # Apply the function to advance the year for each player
     logger.info("Advancing years for current roster players")
@@ -78,16 +88,19 @@ def generate_roster(roster_df: pd.DataFrame, recruits_df: pd.DataFrame, school_n
         player = Player(**normalized_dict)
         return player.advance_year()
 
-    roster_copy['YEAR'] = roster_copy.apply(advance_player_year, axis=1)
+    with memory_stage('generate_roster.advance_years'):
+        roster_copy['YEAR'] = roster_copy.apply(advance_player_year, axis=1)
 
     # Filter the roster data to include only players who are not graduating or drafted or cut
     initial_count = len(roster_copy)
-    filtered_roster_df = roster_copy[
-        (roster_copy['STATUS'] != 'GRADUATING') &
-        (roster_copy['CUT'] != True) &
-        ((roster_copy['DRAFTED'].isna()) | (roster_copy['DRAFTED'] == '')) &
-        (roster_copy['TRANSFER OUT'] != True)
-    ].copy()
+    with memory_stage('generate_roster.filter_roster'):
+        filtered_roster_df = roster_copy[
+            (roster_copy['STATUS'] != 'GRADUATING') &
+            (roster_copy['CUT'] != True) &
+            ((roster_copy['DRAFTED'].isna()) | (roster_copy['DRAFTED'] == '')) &
+            (roster_copy['TRANSFER OUT'] != True)
+        ].copy()
+        record_copy('generate_roster.filtered_roster', filtered_roster_df)
 
     filtered_count = len(filtered_roster_df)
     removed_count = initial_count - filtered_count
@@ -99,9 +112,10 @@ def generate_roster(roster_df: pd.DataFrame, recruits_df: pd.DataFrame, school_n
         logger.info(f"User entered school name: {school_name}")
 
     initial_recruit_count = len(recruits_copy)
-    recruits_filtered = recruits_copy[
-        recruits_copy['COMMITTED TO'] == school_name.upper()
-    ].copy()
+    with memory_stage('generate_roster.filter_recruits'):
+        recruits_filtered = recruits_copy[
+            recruits_copy['COMMITTED TO'] == school_name.upper()
+        ].copy()
 
     commit_count = len(recruits_filtered)
     logger.info(f"Found {commit_count} recruits committed to {school_name} out of {initial_recruit_count} total recruits")
@@ -119,11 +133,12 @@ def generate_roster(roster_df: pd.DataFrame, recruits_df: pd.DataFrame, school_n
         }
         return year_mapping.get(year, year)
 
-    recruits_filtered.loc[:, 'YEAR'] = recruits_filtered['YEAR'].apply(advance_recruit_year)
+    recruits_filtered['YEAR'] = recruits_filtered['YEAR'].map(advance_recruit_year).astype(object)
 
     # Combine the filtered roster data with the recruits
     logger.info("Combining roster with incoming recruits")
-    new_roster_df = pd.concat([filtered_roster_df, recruits_filtered], ignore_index=True)
+    with memory_stage('generate_roster.combine'):
+        new_roster_df = pd.concat([filtered_roster_df, recruits_filtered], ignore_index=True)
 
     final_count = len(new_roster_df)
     logger.info(f"Combined roster size: {final_count} players ({filtered_count} returning + {commit_count} recruits)")
@@ -151,7 +166,8 @@ def generate_roster(roster_df: pd.DataFrame, recruits_df: pd.DataFrame, school_n
     else:
         logger.debug("Sorting by position only (no overall rating data available)")
 
-    new_roster_df.sort_values(by=sort_cols, ascending=sort_ascending, inplace=True)
+    with memory_stage('generate_roster.sort'):
+        new_roster_df.sort_values(by=sort_cols, ascending=sort_ascending, inplace=True)
 
     # Helper function to ensure columns exist and set default values
     def ensure_columns_exist(df, column_defaults):
@@ -181,7 +197,9 @@ def generate_roster(roster_df: pd.DataFrame, recruits_df: pd.DataFrame, school_n
             logger.debug(f"Added missing column '{col}' with default value")
 
     # Select only the desired columns in the specified order
-    new_roster_df = new_roster_df[final_column_order].copy()
+    with memory_stage('generate_roster.select_columns'):
+        new_roster_df = new_roster_df[final_column_order].copy()
+        record_copy('generate_roster.final_roster', new_roster_df)
 
     # Reset specific columns to desired default values
     logger.debug("Resetting columns to default values")
@@ -207,14 +225,19 @@ def generate_roster(roster_df: pd.DataFrame, recruits_df: pd.DataFrame, school_n
     return new_roster_df
 
 
-def save_roster_to_csv(data_path: str, data_folder: str, new_path: str = 'New_Roster.csv') -> None:
+def save_roster_to_csv(data_path: str, data_folder: str, new_path: str = 'New_Roster.csv',
+                       incremental: bool = True, school_name: Optional[str] = None) -> None:
     """
     Process roster and recruiting CSV files and generate new roster.
 
     Args:
         data_path (str): Path to search for input CSV files
         data_folder (str): Output directory for new roster
-        new_path (str): Output filename
+        new_path (str): Output filename, prefixed with each roster's file name
+            (e.g. Week1_Roster_New_Roster.csv)
+        incremental (bool): Skip roster files whose inputs, school and output
+            are unchanged since the last run (tracked in input_manifest.json)
+        school_name (str, optional): School to roll over; asked for once if not given
     """
     logger.info(f"Starting CSV processing: searching in {data_path}")
 
@@ -236,22 +259,41 @@ def save_roster_to_csv(data_path: str, data_folder: str, new_path: str = 'New_Ro
             logger.info(f"Creating output directory: {data_folder}")
             os.makedirs(data_folder)
 
+        # The school decides which recruits join, so it is part of the manifest check
+        if not school_name:
+            school_name = input("Enter the name of your school: ")
+            logger.info(f"User entered school name: {school_name}")
+
         processed_count = 0
+        skipped_count = 0
         error_count = 0
+        recruiting_df = None
+        manifest = InputManifest(data_folder)
+        params = {'school': school_name}
 
         for roster_path in roster_files:
+            inputs = [roster_path, recruiting_files[0]]
+            if incremental and manifest.is_current('rollover', inputs, params):
+                logger.info(f"Skipping unchanged roster file: {os.path.basename(roster_path)}")
+                skipped_count += 1
+                continue
+
             try:
                 logger.info(f"Processing roster file: {os.path.basename(roster_path)}")
 
-                roster_df = pd.read_csv(roster_path)
-                recruiting_df = pd.read_csv(recruiting_files[0])
+                roster_df = ingest_csv(roster_path, GENERATION_COLUMNS, ROSTER_SCHEMA)
+                if recruiting_df is None:
+                    recruiting_df = ingest_csv(recruiting_files[0], GENERATION_COLUMNS, RECRUIT_SCHEMA)
 
                 logger.debug(f"Loaded roster with {len(roster_df)} rows")
                 logger.debug(f"Loaded recruiting data with {len(recruiting_df)} rows")
 
-                new_roster_df = generate_roster(roster_df, recruiting_df)
-                output_path = os.path.join(data_folder, new_path)
-                new_roster_df.to_csv(output_path, index=False)
+                new_roster_df = generate_roster(roster_df, recruiting_df, school_name)
+                new_name = output_name(roster_path, new_path)
+                output_path = os.path.join(data_folder, new_name)
+                write_exports({new_name: new_roster_df}, data_folder)
+                manifest.record('rollover', inputs, [output_path], params)
+                manifest.save()
 
                 logger.info(f"Successfully processed {os.path.basename(roster_path)}")
                 logger.info(f"New roster saved to: {output_path}")
@@ -265,7 +307,8 @@ def save_roster_to_csv(data_path: str, data_folder: str, new_path: str = 'New_Ro
                 logger.debug(f"Full error details for {roster_path}:", exc_info=True)
                 continue
 
-        logger.info(f"Processing complete: {processed_count} files processed successfully, {error_count} errors")
+        logger.info(f"Processing complete: {processed_count} files processed successfully, "
+                    f"{skipped_count} unchanged, {error_count} errors")
 
     except Exception as e:
         logger.error(f"Fatal error in save_roster_to_csv: {str(e)}")
@@ -0,0 +1,207 @@
+"""Memory-mapped Arrow snapshots of processed roster analysis.
+
+A snapshot stores the processed roster, recruiting plan and position summary
+for one source CSV as uncompressed Arrow IPC (Feather v2) files next to a
+``snapshot.json`` describing the source file. Loading memory-maps the files,
+so reopening a notebook session skips CSV parsing and the analysis entirely.
+A snapshot is ignored once the source file's size, mtime or SHA-256 changes.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Optional
+
+import pandas as pd
+
+from ..analysis.roster_analysis import process_roster_and_create_recruiting_plan
+from ..config.constants import DEFAULT_POSITION_REQUIREMENTS
+from ..utils.file_utils import DEFAULT_FOLDER, build_position_analysis, file_fingerprint
+from ..utils.log import get_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    pa = feather = None
+
+logger = get_logger(__name__)
+
+DEFAULT_SNAPSHOT_FOLDER = os.path.join(DEFAULT_FOLDER, 'cfb_dynasty_data', 'snapshots')
+
+SNAPSHOT_VERSION = 1
+
+META_FILE = 'snapshot.json'
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Snapshots require pyarrow: pip install pyarrow")
+
+
+def snapshot_folder(source_path: str, folder: Optional[str] = None) -> str:
+    """
+    Return the snapshot directory for a source file.
+
+    The name is the file's stem plus a short hash of its absolute path, so
+    same-named exports in different folders get separate snapshots.
+    """
+    source = os.path.abspath(source_path)
+    name = os.path.splitext(os.path.basename(source))[0]
+    digest = hashlib.sha256(source.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(folder or DEFAULT_SNAPSHOT_FOLDER, f"{name}-{digest}")
+
+
+def save_snapshot(source_path: str, frames: Dict[str, pd.DataFrame], folder: Optional[str] = None,
+                  params: Optional[dict] = None) -> str:
+    """
+    Save DataFrames derived from a source file as a snapshot.
+
+    Files are written uncompressed so they can be memory-mapped on load.
+
+    Args:
+        source_path (str): File the frames were computed from
+        frames (dict): Frame name -> DataFrame (e.g. ``roster``, ``plan``)
+        folder (str): Base snapshot folder (default: ~/Downloads/cfb_dynasty_data/snapshots)
+        params (dict): JSON-serializable settings the frames depend on; a
+            snapshot only loads for the same params
+
+    Returns:
+        str: Snapshot directory
+    """
+    _require_pyarrow()
+    target = snapshot_folder(source_path, folder)
+    os.makedirs(target, exist_ok=True)
+
+    # Drop the old metadata first so a half-written snapshot is never considered valid
+    meta_path = os.path.join(target, META_FILE)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    for name, df in frames.items():
+        df = df.drop(columns=['Best at Position'], errors='ignore').reset_index(drop=True)
+        feather.write_feather(df, os.path.join(target, f"{name}.arrow"), compression='uncompressed')
+
+    meta = {
+        'version': SNAPSHOT_VERSION,
+        'source': os.path.abspath(source_path),
+        'fingerprint': file_fingerprint(source_path),
+        'params': params or {},
+        'frames': list(frames),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+
+    logger.debug(f"Saved snapshot of {os.path.basename(source_path)} to {target}")
+    return target
+
+
+def _read_meta(target: str) -> Optional[dict]:
+    try:
+        with open(os.path.join(target, META_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_snapshot_valid(source_path: str, folder: Optional[str] = None, params: Optional[dict] = None,
+                      verify_hash: bool = True) -> bool:
+    """
+    Check whether a snapshot still matches its source file.
+
+    Size and mtime are compared first; the SHA-256 is only computed when they
+    match, which catches edits that preserve both.
+
+    Args:
+        source_path (str): Source file
+        folder (str): Base snapshot folder
+        params (dict): Settings the snapshot must have been saved with
+        verify_hash (bool): Also compare the content hash
+
+    Returns:
+        bool: True if the snapshot can be used
+    """
+    meta = _read_meta(snapshot_folder(source_path, folder))
+    if meta is None or meta.get('version') != SNAPSHOT_VERSION:
+        return False
+    if meta.get('source') != os.path.abspath(source_path):
+        return False
+    # Compare through JSON so tuples and lists in params match what was stored
+    if meta.get('params') != json.loads(json.dumps(params or {})):
+        return False
+    if not os.path.exists(source_path):
+        return False
+
+    stored = meta['fingerprint']
+    current = file_fingerprint(source_path, include_hash=False)
+    if current['size'] != stored['size'] or current['mtime_ns'] != stored['mtime_ns']:
+        return False
+    if verify_hash:
+        return file_fingerprint(source_path)['sha256'] == stored['sha256']
+    return True
+
+
+def load_snapshot(source_path: str, folder: Optional[str] = None, params: Optional[dict] = None,
+                  verify_hash: bool = True) -> Optional[Dict[str, pd.DataFrame]]:
+    """
+    Load a snapshot by memory-mapping its Arrow files.
+
+    Args:
+        source_path (str): Source file the snapshot was saved for
+        folder (str): Base snapshot folder
+        params (dict): Settings the snapshot must have been saved with
+        verify_hash (bool): Compare the source file's SHA-256 as well as size and mtime
+
+    Returns:
+        dict or None: Frame name -> DataFrame, or None if the snapshot is
+        missing or stale
+    """
+    _require_pyarrow()
+    if not is_snapshot_valid(source_path, folder, params, verify_hash):
+        return None
+
+    target = snapshot_folder(source_path, folder)
+    frames = {}
+    for name in _read_meta(target)['frames']:
+        with pa.memory_map(os.path.join(target, f"{name}.arrow"), 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+        # split_blocks keeps columns unconsolidated, so numeric columns without
+        # nulls can stay views onto the mapped file
+        frames[name] = table.to_pandas(split_blocks=True)
+
+    logger.debug(f"Loaded snapshot of {os.path.basename(source_path)} from {target}")
+    return frames
+
+
+def load_or_build_analysis(roster_path: str, position_requirements: Optional[dict] = None,
+                           folder: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Return the processed roster, recruiting plan and position summary for a
+    roster file, from a snapshot when the file is unchanged.
+
+    Args:
+        roster_path (str): Roster CSV
+        position_requirements (dict): Position requirements (default: DEFAULT_POSITION_REQUIREMENTS)
+        folder (str): Base snapshot folder
+
+    Returns:
+        dict: ``roster``, ``plan`` and ``positions`` DataFrames
+    """
+    position_requirements = position_requirements or DEFAULT_POSITION_REQUIREMENTS
+    params = {'position_requirements': position_requirements}
+
+    frames = load_snapshot(roster_path, folder, params)
+    if frames is not None:
+        print(f"⚡ Loaded snapshot for {os.path.basename(roster_path)}")
+        return frames
+
+    roster_df, recruiting_plan = process_roster_and_create_recruiting_plan(roster_path, position_requirements)
+    frames = {
+        'roster': roster_df,
+        'plan': recruiting_plan,
+        'positions': build_position_analysis(roster_df, position_requirements),
+    }
+    save_snapshot(roster_path, frames, folder, params)
+    return frames
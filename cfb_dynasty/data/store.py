@@ -0,0 +1,191 @@
+"""Columnar dynasty data store.
+
+Rosters, recruits, valuations and recruiting plans are stored as
+zstd-compressed Parquet files in a hive-partitioned layout::
+
+    <root>/<table>/SEASON=2025/TEAM=TEXAS%20TECH/part-0.parquet
+
+Reads prune partitions and columns before any data is loaded, so loading one
+position across ten seasons only opens the files for those seasons and only
+decodes the requested columns.
+"""
+
+import os
+from typing import Any, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from ..config.schema import RECRUIT_SCHEMA, ROSTER_SCHEMA
+from ..utils.file_utils import DEFAULT_FOLDER
+from ..utils.log import get_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = ds = pq = None
+
+logger = get_logger(__name__)
+
+TABLES = ('rosters', 'recruits', 'valuations', 'plans')
+
+PARTITION_COLUMNS = ['SEASON', 'TEAM']
+
+DEFAULT_STORE_FOLDER = os.path.join(DEFAULT_FOLDER, 'cfb_dynasty_data', 'store')
+
+COMPRESSION = 'zstd'
+
+
+def _normalize_table(table: 'pa.Table') -> 'pa.Table':
+    """
+    Store every file with the same physical types so partitions written from
+    differently-typed frames still read back as one dataset. Categories become
+    plain strings (Parquet dictionary-encodes them on disk anyway) and all
+    integer widths become int64; dtypes are narrowed again on read.
+    """
+    fields = []
+    for field in table.schema:
+        field_type = field.type
+        if pa.types.is_dictionary(field_type):
+            field_type = field_type.value_type
+        if pa.types.is_large_string(field_type) or pa.types.is_string(field_type):
+            field_type = pa.string()
+        elif pa.types.is_integer(field_type):
+            field_type = pa.int64()
+        elif pa.types.is_floating(field_type):
+            field_type = pa.float64()
+        fields.append(pa.field(field.name, field_type))
+    return table.cast(pa.schema(fields))
+
+
+# Rating and ranking columns, stored as numbers whatever dtype the frame had
+NUMERIC_COLUMNS = [col for col, dtype in RECRUIT_SCHEMA.items() if dtype.startswith('UInt')]
+
+
+def _coerce_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert rating columns held as text (e.g. generate_roster's '' for new
+    recruits) to numbers, with blanks and other non-numbers as missing.
+    """
+    coerced = {
+        col: pd.to_numeric(df[col], errors='coerce')
+        for col in NUMERIC_COLUMNS
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col])
+    }
+    return df.assign(**coerced) if coerced else df
+
+
+class DynastyStore:
+    """Season- and team-partitioned Parquet store for dynasty data."""
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Args:
+            root (str): Store directory (default: ~/Downloads/cfb_dynasty_data/store)
+        """
+        if pa is None:
+            raise ImportError("DynastyStore requires pyarrow: pip install pyarrow")
+        self.root = root or DEFAULT_STORE_FOLDER
+        self.partitioning = ds.partitioning(
+            pa.schema([('SEASON', pa.int16()), ('TEAM', pa.string())]), flavor='hive'
+        )
+
+    def _table_path(self, table: str) -> str:
+        if table not in TABLES:
+            raise ValueError(f"Unknown table '{table}'. Expected one of: {', '.join(TABLES)}")
+        return os.path.join(self.root, table)
+
+    def write(self, table: str, df: pd.DataFrame, season: Optional[int] = None,
+              team: Optional[str] = None) -> int:
+        """
+        Write a DataFrame into the store, replacing the partitions it covers.
+
+        Args:
+            table (str): 'rosters', 'recruits', 'valuations' or 'plans'
+            df (pd.DataFrame): Data to store
+            season (int): Season for every row (default: the frame's SEASON column)
+            team (str): Team for every row (default: the frame's TEAM column)
+
+        Returns:
+            int: Number of rows written
+        """
+        path = self._table_path(table)
+        df = df.drop(columns=['Best at Position'], errors='ignore')
+
+        partition_values = {'SEASON': season, 'TEAM': team}
+        missing = [col for col, value in partition_values.items() if value is None and col not in df.columns]
+        if missing:
+            raise ValueError(f"Pass {' and '.join(c.lower() for c in missing)} or include "
+                             f"{', '.join(missing)} column(s) to write to the store")
+
+        # Only the partition columns are added, so the caller's frame is not copied
+        assignments = {col: value for col, value in partition_values.items() if value is not None}
+        if assignments:
+            df = df.assign(**assignments)
+        if df.empty:
+            return 0
+
+        df = _coerce_numeric(df)
+        arrow_table = _normalize_table(pa.Table.from_pandas(df, preserve_index=False))
+        ds.write_dataset(
+            arrow_table,
+            path,
+            format='parquet',
+            partitioning=self.partitioning,
+            basename_template='part-{i}.parquet',
+            existing_data_behavior='delete_matching',
+            file_options=ds.ParquetFileFormat().make_write_options(compression=COMPRESSION),
+        )
+        logger.debug(f"Wrote {len(df)} rows to {table} store at {path}")
+        return len(df)
+
+    def _dataset(self, table: str) -> Optional['ds.Dataset']:
+        path = self._table_path(table)
+        if not os.path.isdir(path):
+            return None
+        return ds.dataset(path, format='parquet', partitioning=self.partitioning)
+
+    def read(self, table: str, columns: Optional[Sequence[str]] = None,
+             filters: Union[List[Any], 'ds.Expression', None] = None) -> pd.DataFrame:
+        """
+        Read from the store with column pruning and predicate filtering.
+
+        Filters on SEASON and TEAM skip whole partitions without opening
+        their files; other filters are applied while scanning.
+
+        Args:
+            table (str): 'rosters', 'recruits', 'valuations' or 'plans'
+            columns (list): Columns to load (default: all, including SEASON and TEAM)
+            filters: pyarrow expression, or a list of ``(column, op, value)``
+                tuples ANDed together (a list of such lists is ORed), e.g.
+                ``[('POSITION', '==', 'QB'), ('SEASON', '>=', 2025)]``
+
+        Returns:
+            pd.DataFrame: Matching rows with the package's roster/recruit dtypes
+        """
+        dataset = self._dataset(table)
+        if dataset is None:
+            return pd.DataFrame(columns=list(columns) if columns else [])
+
+        if isinstance(filters, list):
+            filters = pq.filters_to_expression(filters) if filters else None
+
+        df = dataset.to_table(columns=list(columns) if columns else None, filter=filters).to_pandas()
+
+        # Files written before ratings were coerced may hold them as text
+        df = _coerce_numeric(df)
+        schema = RECRUIT_SCHEMA if table == 'recruits' else ROSTER_SCHEMA
+        dtypes = {col: dtype for col, dtype in schema.items() if col in df.columns}
+        if dtypes:
+            df = df.astype(dtypes)
+        return df
+
+    def seasons(self, table: str) -> List[int]:
+        """Return the seasons stored for a table, read from the directory layout only."""
+        path = self._table_path(table)
+        if not os.path.isdir(path):
+            return []
+        return sorted(
+            int(name.split('=', 1)[1]) for name in os.listdir(path) if name.startswith('SEASON=')
+        )
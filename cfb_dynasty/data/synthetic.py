@@ -0,0 +1,252 @@
+"""Seeded synthetic league data for scale and load testing."""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..config.constants import DEFAULT_POSITION_REQUIREMENTS, STATE_ABBREVIATIONS
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
+
+FBS_SCHOOLS = [
+    'AIR FORCE', 'AKRON', 'ALABAMA', 'APPALACHIAN STATE', 'ARIZONA', 'ARIZONA STATE',
+    'ARKANSAS', 'ARKANSAS STATE', 'ARMY', 'AUBURN', 'BALL STATE', 'BAYLOR',
+    'BOISE STATE', 'BOSTON COLLEGE', 'BOWLING GREEN', 'BUFFALO', 'BYU', 'CAL',
+    'CENTRAL MICHIGAN', 'CHARLOTTE', 'CINCINNATI', 'CLEMSON', 'COASTAL CAROLINA', 'COLORADO',
+    'COLORADO STATE', 'DUKE', 'EAST CAROLINA', 'EASTERN MICHIGAN', 'FAU', 'FIU',
+    'FLORIDA', 'FLORIDA STATE', 'FRESNO STATE', 'GEORGIA', 'GEORGIA SOUTHERN', 'GEORGIA STATE',
+    'GEORGIA TECH', 'HAWAII', 'HOUSTON', 'ILLINOIS', 'INDIANA', 'IOWA',
+    'IOWA STATE', 'JACKSONVILLE STATE', 'JAMES MADISON', 'KANSAS', 'KANSAS STATE', 'KENNESAW STATE',
+    'KENT STATE', 'KENTUCKY', 'LIBERTY', 'LOUISIANA', 'LOUISIANA TECH', 'LOUISVILLE',
+    'LSU', 'MARSHALL', 'MARYLAND', 'MEMPHIS', 'MIAMI', 'MIAMI (OH)',
+    'MICHIGAN', 'MICHIGAN STATE', 'MIDDLE TENNESSEE', 'MINNESOTA', 'MISSISSIPPI STATE', 'MISSOURI',
+    'NAVY', 'NC STATE', 'NEBRASKA', 'NEVADA', 'NEW MEXICO', 'NEW MEXICO STATE',
+    'NORTH CAROLINA', 'NORTH TEXAS', 'NORTHERN ILLINOIS', 'NORTHWESTERN', 'NOTRE DAME', 'OHIO',
+    'OHIO STATE', 'OKLAHOMA', 'OKLAHOMA STATE', 'OLD DOMINION', 'OLE MISS', 'OREGON',
+    'OREGON STATE', 'PENN STATE', 'PITTSBURGH', 'PURDUE', 'RICE', 'RUTGERS',
+    'SAM HOUSTON', 'SAN DIEGO STATE', 'SAN JOSE STATE', 'SMU', 'SOUTH ALABAMA', 'SOUTH CAROLINA',
+    'SOUTH FLORIDA', 'SOUTHERN MISS', 'STANFORD', 'SYRACUSE', 'TCU', 'TEMPLE',
+    'TENNESSEE', 'TEXAS', 'TEXAS A&M', 'TEXAS STATE', 'TEXAS TECH', 'TOLEDO',
+    'TROY', 'TULANE', 'TULSA', 'UAB', 'UCF', 'UCLA',
+    'UCONN', 'UL MONROE', 'UMASS', 'UNLV', 'USC', 'UTAH',
+    'UTAH STATE', 'UTEP', 'UTSA', 'VANDERBILT', 'VIRGINIA', 'VIRGINIA TECH',
+    'WAKE FOREST', 'WASHINGTON', 'WASHINGTON STATE', 'WEST VIRGINIA', 'WESTERN KENTUCKY', 'WESTERN MICHIGAN',
+    'WISCONSIN', 'WYOMING',
+]
+
+FIRST_NAMES = [
+    'AARON', 'ANDRE', 'BRANDON', 'CALEB', 'CAMERON', 'CHASE', 'CHRISTIAN', 'DARIUS',
+    'DEANDRE', 'DEVON', 'DYLAN', 'ELIJAH', 'ETHAN', 'GABRIEL', 'ISAIAH', 'JACKSON',
+    'JALEN', 'JAMES', 'JAYDEN', 'JORDAN', 'JOSHUA', 'JUSTIN', 'KALLUM', 'KEVIN',
+    'LOGAN', 'MALIK', 'MARCUS', 'MASON', 'MICHAEL', 'NATHAN', 'NOAH', 'ORION',
+    'QUINN', 'RILEY', 'SAM', 'TRAVIS', 'TREVOR', 'TYLER', 'WYATT', 'XAVIER',
+]
+
+LAST_NAMES = [
+    'ADAMS', 'ALLEN', 'BAKER', 'BROOKS', 'BROWN', 'CARTER', 'CHILDERS', 'DAVIS',
+    'EDWARDS', 'EVANS', 'GREEN', 'GREENWOOD', 'GRIFFIN', 'HARRIS', 'HILL', 'JACKSON',
+    'JOHNSON', 'JONES', 'KING', 'LEWIS', 'MARTIN', 'MILLER', 'MITCHELL', 'MOORE',
+    'NELSON', 'PARKER', 'ROBINSON', 'SMITH', 'TAYLOR', 'THOMAS', 'THOMPSON', 'TURNER',
+    'VEGA', 'WALKER', 'WASHINGTON', 'WHITE', 'WILLIAMS', 'WILSON', 'WRIGHT', 'YOUNG',
+]
+
+# Share of a roster in each eligibility year
+YEAR_DISTRIBUTION = {
+    'FR': 0.24, 'SO': 0.18, 'JR': 0.16, 'SR': 0.12,
+    'FR (RS)': 0.08, 'SO (RS)': 0.08, 'JR (RS)': 0.07, 'SR (RS)': 0.07,
+}
+
+DEV_TRAIT_DISTRIBUTION = {'NORMAL': 0.60, 'IMPACT': 0.25, 'STAR': 0.10, 'ELITE': 0.05}
+
+GEM_STATUS_DISTRIBUTION = {'NORMAL': 0.80, 'GEM': 0.10, 'BUST': 0.10}
+
+STAR_DISTRIBUTION = {1: 0.10, 2: 0.25, 3: 0.35, 4: 0.22, 5: 0.08}
+
+PLAYERS_PER_TEAM = 85
+RECRUITS_PER_TEAM = 25
+
+
+def load_hometowns(coordinates_path: Optional[str] = None) -> pd.DataFrame:
+    """
+    Load the cities in the coordinate cache as a CITY/STATE frame.
+
+    Args:
+        coordinates_path (str): Path to city_coordinates.json (default: the
+            bundled ``data/city_coordinates.json``)
+
+    Returns:
+        pd.DataFrame: One row per city with a two-letter STATE abbreviation
+    """
+    if coordinates_path is None:
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        coordinates_path = os.path.join(project_root, 'data', 'city_coordinates.json')
+
+    with open(coordinates_path, 'r', encoding='utf-8') as f:
+        coordinates = json.load(f)
+
+    state_codes = {name: code for code, name in STATE_ABBREVIATIONS.items()}
+    rows = [
+        (city, state_codes[state])
+        for state, cities in coordinates.items() if state in state_codes
+        for city in cities
+    ]
+    return pd.DataFrame(rows, columns=['CITY', 'STATE'])
+
+
+def _choice(rng, distribution: Dict, size: int) -> np.ndarray:
+    """Draw ``size`` keys from a {value: probability} mapping."""
+    values = np.array(list(distribution))
+    probabilities = np.array(list(distribution.values()), dtype=float)
+    return values[rng.choice(len(values), size, p=probabilities / probabilities.sum())]
+
+
+def _players(rng, count: int, hometowns: pd.DataFrame) -> pd.DataFrame:
+    """Draw the columns shared by roster players and recruits."""
+    # Positions are weighted by their ideal roster count
+    positions = [pos for pos, reqs in DEFAULT_POSITION_REQUIREMENTS.items() if reqs['ideal'] > 0]
+    weights = np.array([DEFAULT_POSITION_REQUIREMENTS[pos]['ideal'] for pos in positions], dtype=float)
+    position_idx = rng.choice(len(positions), count, p=weights / weights.sum())
+
+    # Archetypes: pad each position's archetypes into one table and index it
+    archetype_lists = [list(DEFAULT_POSITION_REQUIREMENTS[pos]['archetypes']) for pos in positions]
+    archetype_counts = np.array([len(a) for a in archetype_lists])
+    archetype_table = np.array([a + [''] * (archetype_counts.max() - len(a)) for a in archetype_lists])
+    archetype_idx = (rng.random(count) * archetype_counts[position_idx]).astype(int)
+
+    hometown_idx = rng.integers(0, len(hometowns), count)
+    base_overall = np.clip(rng.normal(72, 9, count).round(), 40, 99).astype(int)
+
+    return pd.DataFrame({
+        'FIRST NAME': np.array(FIRST_NAMES)[rng.integers(0, len(FIRST_NAMES), count)],
+        'LAST NAME': np.array(LAST_NAMES)[rng.integers(0, len(LAST_NAMES), count)],
+        'POSITION': np.array(positions)[position_idx],
+        'OVERALL': np.minimum(base_overall + rng.integers(0, 6, count), 99),
+        'BASE OVERALL': base_overall,
+        'CITY': hometowns['CITY'].to_numpy()[hometown_idx],
+        'STATE': hometowns['STATE'].to_numpy()[hometown_idx],
+        'ARCHETYPE': archetype_table[position_idx, archetype_idx],
+        'DEV TRAIT': _choice(rng, DEV_TRAIT_DISTRIBUTION, count),
+    })
+
+
+def generate_league(teams: int = 134, seasons: int = 1, seed: int = 0, start_season: int = 2025,
+                    players_per_team: int = PLAYERS_PER_TEAM,
+                    recruits_per_team: int = RECRUITS_PER_TEAM,
+                    hometowns: Optional[pd.DataFrame] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Generate seeded roster and recruiting data for a whole league.
+
+    Every column is drawn with vectorized NumPy sampling, so a 134-team,
+    multi-season league takes well under a second.
+
+    Args:
+        teams (int): Number of teams (at most len(FBS_SCHOOLS))
+        seasons (int): Number of seasons to generate
+        seed (int): Random seed; the same seed always gives the same league
+        start_season (int): First season number
+        players_per_team (int): Roster size per team
+        recruits_per_team (int): Recruits on the board per team
+        hometowns (pd.DataFrame): CITY/STATE pool (default: ``load_hometowns()``)
+
+    Returns:
+        dict: ``roster`` and ``recruits`` DataFrames, each with SEASON and
+        TEAM (roster) or COMMITTED TO (recruits) columns, laid out like the
+        game's CSV exports
+    """
+    if not 1 <= teams <= len(FBS_SCHOOLS):
+        raise ValueError(f"teams must be between 1 and {len(FBS_SCHOOLS)}")
+
+    rng = np.random.default_rng(seed)
+    if hometowns is None:
+        hometowns = load_hometowns()
+    schools = np.array(FBS_SCHOOLS[:teams])
+    season_numbers = np.arange(start_season, start_season + seasons)
+
+    # Current rosters
+    roster_count = teams * players_per_team * seasons
+    roster_df = _players(rng, roster_count, hometowns)
+    year = _choice(rng, YEAR_DISTRIBUTION, roster_count)
+    senior = np.char.startswith(year.astype(str), 'SR')
+    drafted = senior & (roster_df['OVERALL'].to_numpy() >= 85) & (rng.random(roster_count) < 0.5)
+    draft_round = rng.integers(1, 8, roster_count).astype(str)
+
+    roster_df.insert(0, 'REDSHIRT', rng.random(roster_count) < 0.10)
+    roster_df.insert(3, 'YEAR', year)
+    roster_df['CUT'] = rng.random(roster_count) < 0.02
+    roster_df['TRANSFER OUT'] = rng.random(roster_count) < 0.03
+    roster_df['DRAFTED'] = np.where(drafted, np.char.add('ROUND ', draft_round), '')
+    roster_df['VALUE'] = ''
+    roster_df['STATUS'] = np.where(senior, 'GRADUATING', '')
+    roster_df['RATING'] = roster_df['OVERALL']
+    roster_df['TEAM'] = np.tile(np.repeat(schools, players_per_team), seasons)
+    roster_df['SEASON'] = np.repeat(season_numbers, teams * players_per_team)
+
+    # Recruiting boards
+    board_size = teams * recruits_per_team
+    recruit_count = board_size * seasons
+    recruits_df = _players(rng, recruit_count, hometowns)
+    stars = _choice(rng, STAR_DISTRIBUTION, recruit_count)
+    committed = rng.random(recruit_count) < 0.85
+
+    recruits_df.insert(0, 'REDSHIRT', False)
+    recruits_df.insert(3, 'YEAR', 'HS')
+    recruits_df['CUT'] = False
+    recruits_df['TRANSFER OUT'] = False
+    recruits_df['DRAFTED'] = ''
+    recruits_df['VALUE'] = ''
+    recruits_df['STATUS'] = ''
+    recruits_df['STARS'] = stars
+    recruits_df['GEM STATUS'] = _choice(rng, GEM_STATUS_DISTRIBUTION, recruit_count)
+    recruits_df['COMMITTED TO'] = np.where(committed, schools[rng.integers(0, teams, recruit_count)], '')
+    # Rank by star rating with random tie-breaks, restarting at 1 each season
+    rank_key = stars * 10.0 + rng.random(recruit_count) + np.repeat(np.arange(seasons), board_size) * -100.0
+    order = np.argsort(-rank_key, kind='stable')
+    ranks = np.empty(recruit_count, dtype=int)
+    ranks[order] = np.arange(recruit_count) % board_size + 1
+    recruits_df['NATIONAL RANKING'] = ranks
+    recruits_df['SEASON'] = np.repeat(season_numbers, board_size)
+
+    logger.debug(f"Generated {roster_count} roster rows and {recruit_count} recruits "
+                 f"for {teams} teams over {seasons} season(s)")
+
+    return {'roster': roster_df, 'recruits': recruits_df}
+
+
+def write_league(league: Dict[str, pd.DataFrame], folder: str, file_format: str = 'csv') -> List[str]:
+    """
+    Write a generated league to one roster and one recruiting file per season.
+
+    Files are named ``<SEASON>_Roster`` and ``<SEASON>_Recruiting_Hub`` so the
+    package's roster/recruiting file discovery picks them up.
+
+    Args:
+        league (dict): Output of ``generate_league``
+        folder (str): Output directory
+        file_format (str): 'csv', 'parquet' or 'feather' (columnar formats need pyarrow)
+
+    Returns:
+        list: Paths of the written files
+    """
+    if file_format not in ('csv', 'parquet', 'feather'):
+        raise ValueError(f"Unsupported file format: {file_format}")
+    os.makedirs(folder, exist_ok=True)
+
+    written = []
+    for kind, suffix in (('roster', 'Roster'), ('recruits', 'Recruiting_Hub')):
+        for season, season_df in league[kind].groupby('SEASON', sort=True):
+            path = os.path.join(folder, f"{season}_{suffix}.{file_format}")
+            season_df = season_df.reset_index(drop=True)
+            if file_format == 'csv':
+                season_df.to_csv(path, index=False)
+            elif file_format == 'parquet':
+                season_df.to_parquet(path, index=False)
+            else:
+                season_df.to_feather(path)
+            written.append(path)
+
+    logger.info(f"Wrote {len(written)} synthetic league files to {folder}")
+    return written
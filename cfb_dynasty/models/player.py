@@ -1,5 +1,27 @@
 from hashlib import md5
 
+import pandas as pd
+
+# Columns that identify a player across seasons, in ID order
+ID_COLUMNS = ('FIRST NAME', 'LAST NAME', 'POSITION', 'CITY', 'STATE')
+
+
+def make_player_id(first_name, last_name, position, city='', state='') -> str:
+    """
+    Hash a player's identity fields, ignoring case and spaces.
+
+    Missing values (None, NaN, pd.NA) count as empty, so a blank hometown gives
+    the same ID whether it was read as '' or as NaN.
+
+    Returns:
+        str: MD5 hex digest used as ``Player.player_id``
+    """
+    parts = ('' if pd.api.types.is_scalar(value) and pd.isna(value) else str(value)
+             for value in (first_name, last_name, position, city, state))
+    id_vars = ''.join(parts).lower().replace(' ', '')
+    return md5(id_vars.encode()).hexdigest()
+
+
 class Player:
     """
     Represents a player in the CFB Dynasty Data system.
@@ -34,8 +56,7 @@ class Player:
         self.transfer_out = transfer_out
 
         # Generate a unique ID based on player attributes, ignoring case and spaces
-        id_vars = f"{first_name}{last_name}{position}{city}{state}".lower().replace(" ", "")
-        self.player_id = md5(id_vars.encode()).hexdigest()
+        self.player_id = make_player_id(first_name, last_name, position, city, state)
 
     def __str__(self):
         return f"{self.first_name} {self.last_name} - {self.position} ({self.year})"
@@ -133,3 +154,20 @@ class Player:
             self.year = year_mapping.get(self.year, self.year)
 
         return self.year
+
+
+def player_ids(df: pd.DataFrame) -> pd.Series:
+    """
+    Compute ``Player.player_id`` for every row of a roster or recruit DataFrame.
+
+    Hashes each row's identity fields with ``make_player_id``, without
+    constructing a Player per row.
+
+    Args:
+        df (pd.DataFrame): Frame with FIRST NAME, LAST NAME and POSITION (CITY and STATE optional)
+
+    Returns:
+        pd.Series: Player IDs aligned with ``df``'s index
+    """
+    fields = [df[col] if col in df.columns else [''] * len(df) for col in ID_COLUMNS]
+    return pd.Series([make_player_id(*row) for row in zip(*fields)], index=df.index, dtype=object)
@@ -0,0 +1,198 @@
+"""Atomic, concurrent CSV export writer for CFB Dynasty Data system.
+
+Every artifact is written to a temporary file in the destination folder, in
+parallel. Only when all of them have been written and flushed to disk are they
+renamed into place with ``os.replace`` (atomic on the same filesystem), and
+the export manifest is updated last. A crash mid-export leaves the previous
+files untouched and at worst some ``.tmp`` files behind, never a truncated CSV.
+"""
+
+import hashlib
+import json
+import os
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from .log import get_logger
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+logger = get_logger(__name__)
+
+MANIFEST_FILE = 'export_manifest.json'
+
+COMPRESSION_SUFFIXES = {None: '', 'gzip': '.gz', 'zstd': '.zst'}
+
+# Requested mode for new files; the OS applies the process umask to it
+FILE_MODE = 0o666
+
+
+def _create_temp(folder: str, prefix: str) -> Tuple[int, str]:
+    """
+    Create a uniquely named temporary file in ``folder``.
+
+    Unlike ``tempfile.mkstemp`` (always 0600), the file gets the mode a plain
+    ``open()`` would give it, so renamed exports keep the usual permissions.
+
+    Returns:
+        tuple: (open file descriptor, path)
+    """
+    flags = os.O_RDWR | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    while True:
+        path = os.path.join(folder, f"{prefix}{secrets.token_hex(6)}.tmp")
+        try:
+            return os.open(path, flags, FILE_MODE), path
+        except FileExistsError:
+            continue
+
+
+def _sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_temp(folder: str, name: str, df: pd.DataFrame, compression: Optional[str]) -> Tuple[str, dict]:
+    """
+    Write one DataFrame to a temporary file next to its destination.
+
+    Returns:
+        tuple: (temp path, manifest entry)
+    """
+    fd, temp_path = _create_temp(folder, f".{name}.")
+    os.close(fd)
+    try:
+        if compression == 'zstd':
+            # pandas needs the zstandard package for zstd; pyarrow ships its own codec
+            with pa.CompressedOutputStream(temp_path, 'zstd') as stream:
+                df.to_csv(stream, index=False, mode='wb')
+        else:
+            df.to_csv(temp_path, index=False, compression=compression)
+        with open(temp_path, 'rb+') as f:
+            os.fsync(f.fileno())
+        entry = {
+            'rows': len(df),
+            'bytes': os.path.getsize(temp_path),
+            'sha256': _sha256(temp_path),
+            'compression': compression,
+        }
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return temp_path, entry
+
+
+def _read_manifest(folder: str) -> dict:
+    try:
+        with open(os.path.join(folder, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'files': {}}
+
+
+def write_json_atomic(path: str, payload: dict, ensure_ascii: bool = True) -> None:
+    """
+    Write a JSON file through a flushed temporary file and an atomic rename.
+
+    Readers see either the previous file or the complete new one. On failure
+    the temporary file is removed and the error re-raised.
+
+    Args:
+        path (str): Destination path; its folder must exist
+        payload (dict): JSON-serializable content
+        ensure_ascii (bool): Escape non-ASCII characters (False keeps them as UTF-8)
+    """
+    fd, temp_path = _create_temp(os.path.dirname(path) or '.', f".{os.path.basename(path)}.")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2, ensure_ascii=ensure_ascii)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def write_exports(outputs: Dict[str, pd.DataFrame], folder: str, compression: Optional[str] = None,
+                  max_workers: Optional[int] = None) -> Dict[str, dict]:
+    """
+    Write several DataFrames as CSV files concurrently and atomically.
+
+    Args:
+        outputs (dict): File name (e.g. 'player_values_analysis.csv') -> DataFrame
+        folder (str): Destination folder (created if missing)
+        compression (str): None, 'gzip' or 'zstd'; adds '.gz' / '.zst' to the file names
+        max_workers (int): Writer threads (default: one per output)
+
+    Returns:
+        dict: Final file name -> manifest entry with ``rows``, ``bytes``,
+        ``sha256`` and ``compression``
+    """
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression: {compression}. Use None, 'gzip' or 'zstd'")
+    if compression == 'zstd' and pa is None:
+        raise ImportError("zstd export compression requires pyarrow: pip install pyarrow")
+    if not outputs:
+        return {}
+
+    os.makedirs(folder, exist_ok=True)
+    suffix = COMPRESSION_SUFFIXES[compression]
+
+    # Stage every file; nothing is renamed unless all of them succeed
+    with ThreadPoolExecutor(max_workers=max_workers or len(outputs)) as executor:
+        futures = {
+            name: executor.submit(_write_temp, folder, name, df, compression)
+            for name, df in outputs.items()
+        }
+        staged, errors = {}, []
+        for name, future in futures.items():
+            try:
+                staged[name] = future.result()
+            except Exception as e:
+                errors.append((name, e))
+
+    if errors:
+        for temp_path, _ in staged.values():
+            os.remove(temp_path)
+        name, error = errors[0]
+        logger.error(f"Export failed while writing {name}: {error}")
+        raise error
+
+    # Commit: atomic renames, then the manifest
+    entries = {}
+    for name, (temp_path, entry) in staged.items():
+        os.replace(temp_path, os.path.join(folder, name + suffix))
+        entries[name + suffix] = entry
+
+    manifest = _read_manifest(folder)
+    manifest['files'].update(entries)
+    manifest['updated'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+    write_json_atomic(os.path.join(folder, MANIFEST_FILE), manifest)
+
+    logger.debug(f"Wrote {len(entries)} export file(s) to {folder}")
+    return entries
+
+
+def verify_exports(folder: str) -> Dict[str, bool]:
+    """
+    Check the files listed in a folder's export manifest against their checksums.
+
+    Returns:
+        dict: File name -> True if the file exists and matches its recorded SHA-256
+    """
+    results = {}
+    for name, entry in _read_manifest(folder)['files'].items():
+        path = os.path.join(folder, name)
+        results[name] = os.path.exists(path) and _sha256(path) == entry['sha256']
+    return results
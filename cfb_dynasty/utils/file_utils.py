@@ -2,12 +2,124 @@
 
 import os
 import glob
+import hashlib
 import pandas as pd
+from .export_writer import COMPRESSION_SUFFIXES, write_exports
+from .instrumentation import instrument
+from .log import get_logger
+from ..config.schema import HEADER_ALIASES, ROSTER_SCHEMA
+
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+logger = get_logger(__name__)
 
 
 DEFAULT_FOLDER = os.path.expanduser('~/Downloads')
 
 
+def canonical_column_name(header):
+    """
+    Map a CSV header to the package's column name.
+
+    Headers are stripped, upper-cased and underscores read as spaces, then
+    known variants are aliased (e.g. ``national_rank`` -> ``NATIONAL RANKING``).
+    """
+    name = _normalize_header(header)
+    return HEADER_ALIASES.get(name, name)
+
+
+def _normalize_header(header):
+    return ' '.join(str(header).replace('_', ' ').upper().split())
+
+
+def ingest_csv(path, columns=None, schema=None):
+    """
+    Read a CSV file with the fastest available parser, keeping only the columns
+    a consumer needs.
+
+    The header is read first so header variants can be resolved and only the
+    wanted columns are parsed. An alias is only applied when the file doesn't
+    also contain the canonical column. Uses the multithreaded Arrow CSV parser
+    when pyarrow is installed.
+
+    Args:
+        path (str): CSV file path
+        columns (list): Canonical column names to keep (default: all)
+        schema (dict): Canonical column name to dtype mapping (e.g. ROSTER_SCHEMA)
+
+    Returns:
+        pd.DataFrame: DataFrame with canonical column names
+    """
+    headers = list(pd.read_csv(path, nrows=0).columns)
+
+    renames = {}
+    taken = set()
+    # Canonical headers win over aliases that would map onto the same name
+    for header in sorted(headers, key=lambda h: _normalize_header(h) in HEADER_ALIASES):
+        name = canonical_column_name(header)
+        if name not in taken:
+            renames[header] = name
+            taken.add(name)
+
+    wanted = set(columns) if columns is not None else None
+    usecols = [h for h in headers if h in renames and (wanted is None or renames[h] in wanted)]
+    dtype = {h: schema[renames[h]] for h in usecols if schema and renames[h] in schema}
+
+    read_kwargs = {'usecols': usecols, 'engine': CSV_ENGINE}
+    try:
+        df = pd.read_csv(path, dtype=dtype or None, **read_kwargs)
+    except (ValueError, TypeError) as e:
+        logger.warning(f"{os.path.basename(path)} does not match the column schema ({e}); using inferred dtypes")
+        df = pd.read_csv(path, **read_kwargs)
+
+    return df.rename(columns=renames)
+
+
+def file_fingerprint(path, include_hash=True, chunk_size=1 << 20):
+    """
+    Describe a file's identity for cache invalidation.
+
+    Args:
+        path (str): File path
+        include_hash (bool): Also compute the SHA-256 of the contents
+        chunk_size (int): Bytes read per hashing step
+
+    Returns:
+        dict: ``size``, ``mtime_ns`` and (if requested) ``sha256``
+    """
+    stat = os.stat(path)
+    fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    if include_hash:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        fingerprint['sha256'] = digest.hexdigest()
+    return fingerprint
+
+
+def output_name(input_path, name):
+    """
+    Name an output after the input it was derived from.
+
+    Each input gets its own files, so processing one roster export never
+    overwrites the outputs recorded for another in the input manifest.
+
+    Args:
+        input_path (str): Input file, e.g. '~/Downloads/Week1_Roster.csv'
+        name (str): Output file name, e.g. 'New_Roster.csv'
+
+    Returns:
+        str: File name such as 'Week1_Roster_New_Roster.csv'
+    """
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    return f"{stem}_{name}"
+
+
 def load_roster(folder=None):
     """
     Load roster CSV file from specified folder.
@@ -38,7 +150,7 @@ def load_roster(folder=None):
         print(f"\n📊 Loading: {os.path.basename(roster_path)}")
 
         try:
-            roster_df = pd.read_csv(roster_path)
+            roster_df = ingest_csv(roster_path, schema=ROSTER_SCHEMA)
             print(f"✅ Successfully loaded {len(roster_df)} players")
             print(f"📋 Columns: {list(roster_df.columns)}")
 
@@ -55,15 +167,76 @@ def load_roster(folder=None):
             return None
 
 
-def export_files(folder=None, roster_df=None, recruiting_plan=None, position_requirements=None):
+def build_position_analysis(roster_df, position_requirements):
+    """
+    Summarize a processed roster by position in a single grouped pass.
+
+    Args:
+        roster_df (pd.DataFrame): Processed roster with VALUE and STATUS
+        position_requirements (dict): Positions to summarize, in output order
+
+    Returns:
+        pd.DataFrame: One row per position that has players
+    """
+    positions = list(position_requirements.keys())
+    in_scope = roster_df['POSITION'].isin(positions)
+
+    # Flags are computed once for the whole roster and summed per position
+    frame = pd.DataFrame({
+        'POSITION': roster_df['POSITION'].astype(object),
+        'BASE OVERALL': pd.to_numeric(roster_df['BASE OVERALL'], errors='coerce').astype(float),
+        'VALUE': pd.to_numeric(roster_df['VALUE'], errors='coerce').astype(float),
+        'ELITE': roster_df['DEV TRAIT'] == 'ELITE',
+        'STAR': roster_df['DEV TRAIT'] == 'STAR',
+        'GRADUATING': roster_df['STATUS'] == 'GRADUATING',
+        'CUT': roster_df['STATUS'] == 'CUT',
+        'AT RISK': roster_df['STATUS'] == 'AT RISK',
+    })[in_scope]
+    if frame.empty:
+        return pd.DataFrame()
+
+    grouped = frame.groupby('POSITION', sort=False)
+    summary = grouped.agg(
+        Total_Players=('POSITION', 'size'),
+        Avg_Rating=('BASE OVERALL', 'mean'),
+        Avg_Value=('VALUE', 'mean'),
+        Top_Player_Value=('VALUE', 'max'),
+        Elite_Dev_Count=('ELITE', 'sum'),
+        Star_Dev_Count=('STAR', 'sum'),
+        Graduating_Count=('GRADUATING', 'sum'),
+        Cut_Candidates=('CUT', 'sum'),
+        At_Risk_Count=('AT RISK', 'sum'),
+    )
+
+    # One idxmax over every position resolves all top players at once
+    top_index = frame['VALUE'].dropna().groupby(frame['POSITION']).idxmax()
+    top_names = (roster_df.loc[top_index, 'FIRST NAME'].astype(str) + ' ' +
+                 roster_df.loc[top_index, 'LAST NAME'].astype(str))
+    summary.insert(4, 'Top_Player_Name', pd.Series(top_names.to_numpy(), index=top_index.index))
+    summary['Top_Player_Name'] = summary['Top_Player_Name'].fillna('')
+
+    summary = summary.reindex([pos for pos in positions if pos in summary.index])
+    return summary.rename_axis('Position').reset_index()
+
+
+@instrument('export_files')
+def export_files(folder=None, roster_df=None, recruiting_plan=None, position_requirements=None,
+                 compression=None, source_path=None):
     """
     Export comprehensive analysis results to CSV files.
 
+    Files are written concurrently to temporary files and renamed into place
+    only once all of them succeed; ``export_manifest.json`` records each
+    file's row count and SHA-256.
+
     Args:
         folder (str): Base folder for exports (default: ~/Downloads)
         roster_df (pd.DataFrame): Processed roster DataFrame with player values and status
         recruiting_plan (pd.DataFrame): DataFrame with recruiting priorities
         position_requirements (dict): Dictionary with position requirements for detailed analysis
+        compression (str): None, 'gzip' or 'zstd'
+        source_path (str): Roster the results came from; file names are then
+            prefixed with its name (see ``output_name``)
         
     Returns:
         bool: True if export successful, False otherwise
@@ -81,41 +254,32 @@ def export_files(folder=None, roster_df=None, recruiting_plan=None, position_req
         os.makedirs(data_folder)
 
     try:
+        # Build every output first, then write them in one batch
+        outputs = {}
+        suffix = COMPRESSION_SUFFIXES.get(compression, '')
+
+        def name(base):
+            return output_name(source_path, base) if source_path else base
+
         # Export processed roster with player values
         roster_export = roster_df.drop('Best at Position', axis=1, errors='ignore')
-        player_values_path = os.path.join(data_folder, 'player_values_analysis.csv')
-        roster_export.to_csv(player_values_path, index=False)
+        player_values_path = os.path.join(data_folder, name('player_values_analysis.csv') + suffix)
+        outputs[name('player_values_analysis.csv')] = roster_export
 
         # Export recruiting plan if provided
         if recruiting_plan is not None:
-            recruiting_plan_path = os.path.join(data_folder, 'recruiting_plan_analysis.csv')
-            recruiting_plan.to_csv(recruiting_plan_path, index=False)
+            recruiting_plan_path = os.path.join(data_folder, name('recruiting_plan_analysis.csv') + suffix)
+            outputs[name('recruiting_plan_analysis.csv')] = recruiting_plan
 
         # Export detailed position analysis if position requirements provided
+        position_analysis_df = pd.DataFrame()
         if position_requirements is not None:
-            position_analysis = []
-            for pos in position_requirements.keys():
-                pos_data = roster_df[roster_df['POSITION'] == pos]
-                if len(pos_data) > 0:
-                    analysis = {
-                        'Position': pos,
-                        'Total_Players': len(pos_data),
-                        'Avg_Rating': pos_data['BASE OVERALL'].mean(),
-                        'Avg_Value': pos_data['VALUE'].mean(),
-                        'Top_Player_Value': pos_data['VALUE'].max(),
-                        'Top_Player_Name': f"{pos_data.loc[pos_data['VALUE'].idxmax(), 'FIRST NAME']} {pos_data.loc[pos_data['VALUE'].idxmax(), 'LAST NAME']}",
-                        'Elite_Dev_Count': len(pos_data[pos_data['DEV TRAIT'] == 'ELITE']),
-                        'Star_Dev_Count': len(pos_data[pos_data['DEV TRAIT'] == 'STAR']),
-                        'Graduating_Count': len(pos_data[pos_data['STATUS'] == 'GRADUATING']),
-                        'Cut_Candidates': len(pos_data[pos_data['STATUS'] == 'CUT']),
-                        'At_Risk_Count': len(pos_data[pos_data['STATUS'] == 'AT RISK'])
-                    }
-                    position_analysis.append(analysis)
-
-            if position_analysis:
-                position_analysis_df = pd.DataFrame(position_analysis)
-                position_analysis_path = os.path.join(data_folder, 'position_analysis_detailed.csv')
-                position_analysis_df.to_csv(position_analysis_path, index=False)
+            position_analysis_df = build_position_analysis(roster_df, position_requirements)
+            if not position_analysis_df.empty:
+                position_analysis_path = os.path.join(data_folder, name('position_analysis_detailed.csv') + suffix)
+                outputs[name('position_analysis_detailed.csv')] = position_analysis_df
+
+        write_exports(outputs, data_folder, compression=compression)
 
         print("💾 Export completed successfully!")
         print(f"📁 Files saved to: {data_folder}")
@@ -124,7 +288,7 @@ def export_files(folder=None, roster_df=None, recruiting_plan=None, position_req
         if recruiting_plan is not None:
             print(f"  🎯 Recruiting Plan: {os.path.basename(recruiting_plan_path)}")
 
-        if position_requirements is not None and position_analysis:
+        if position_requirements is not None and not position_analysis_df.empty:
             print(f"  📋 Position Analysis: {os.path.basename(position_analysis_path)}")
 
         # Show summary of what was exported
@@ -134,7 +298,7 @@ def export_files(folder=None, roster_df=None, recruiting_plan=None, position_req
         if recruiting_plan is not None:
             print(f"  • {len(recruiting_plan)} position recruiting priorities")
 
-        if position_requirements is not None and position_analysis:
+        if position_requirements is not None and not position_analysis_df.empty:
             print(f"  • {len(position_analysis_df)} detailed position breakdowns")
 
         return True
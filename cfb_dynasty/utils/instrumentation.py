@@ -0,0 +1,240 @@
+"""Hot-path instrumentation for CFB Dynasty Data system.
+
+Instrumentation is off by default. While disabled, an instrumented function
+costs one attribute check per call. Enable it with ``enable_instrumentation()``
+(or by setting the ``CFB_DYNASTY_INSTRUMENT`` environment variable) to collect
+latency percentiles, rows per second and tracemalloc peak memory per call.
+"""
+
+import functools
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .log import get_logger
+
+logger = get_logger(__name__)
+
+# Maximum number of latency samples kept per function
+MAX_SAMPLES = 10000
+
+
+class _InstrumentationState:
+    """Process-wide instrumentation switches and collected samples."""
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_memory = False
+        self.started_tracemalloc = False
+        self.lock = threading.Lock()
+        self.samples: Dict[str, Dict[str, Any]] = {}
+        self.local = threading.local()
+
+
+_state = _InstrumentationState()
+
+
+def enable_instrumentation(trace_memory: bool = True) -> None:
+    """
+    Start collecting metrics for instrumented functions.
+
+    Args:
+        trace_memory (bool): Record tracemalloc peak memory per call. Starts
+            tracemalloc if it is not already running.
+    """
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _state.started_tracemalloc = True
+    _state.trace_memory = trace_memory
+    _state.enabled = True
+    logger.debug(f"Instrumentation enabled (trace_memory={trace_memory})")
+
+
+def disable_instrumentation() -> None:
+    """Stop collecting metrics. Collected data is kept until reset."""
+    _state.enabled = False
+    if _state.started_tracemalloc:
+        tracemalloc.stop()
+        _state.started_tracemalloc = False
+    _state.trace_memory = False
+    logger.debug("Instrumentation disabled")
+
+
+def is_instrumentation_enabled() -> bool:
+    """Return True if instrumentation is currently collecting metrics."""
+    return _state.enabled
+
+
+def reset_instrumentation() -> None:
+    """Discard all collected metrics."""
+    with _state.lock:
+        _state.samples.clear()
+
+
+def begin_peak_window() -> List[int]:
+    """
+    Start measuring peak traced memory for a block of code.
+
+    Windows nest: tracemalloc has a single peak counter, so the running peak
+    of each enclosing window is carried on a per-thread stack while an inner
+    window resets the counter.
+
+    Returns:
+        list: Window state to pass to ``end_peak_window``
+    """
+    stack = getattr(_state.local, 'stack', None)
+    if stack is None:
+        stack = _state.local.stack = []
+    current, peak_so_far = tracemalloc.get_traced_memory()
+    if stack:
+        stack[-1][1] = max(stack[-1][1], peak_so_far)
+    tracemalloc.reset_peak()
+    window = [current, current]
+    stack.append(window)
+    return window
+
+
+def end_peak_window(window: List[int]) -> Tuple[int, int]:
+    """
+    Finish a window started with ``begin_peak_window``.
+
+    Returns:
+        tuple: (peak bytes above the memory traced at the start, memory traced now)
+    """
+    stack = _state.local.stack
+    del stack[next(i for i in range(len(stack) - 1, -1, -1) if stack[i] is window)]
+    current, peak_now = tracemalloc.get_traced_memory()
+    peak_abs = max(window[1], peak_now)
+    if stack:
+        stack[-1][1] = max(stack[-1][1], peak_abs)
+    return peak_abs - window[0], current
+
+
+def _default_row_count(args, kwargs, result) -> Optional[int]:
+    """Count rows in the first DataFrame found in the result or arguments."""
+    candidates = result if isinstance(result, tuple) else (result,)
+    for value in (*candidates, *args, *kwargs.values()):
+        if isinstance(value, pd.DataFrame):
+            return len(value)
+    return None
+
+
+def _record(name: str, elapsed: float, rows: Optional[int], peak: Optional[int]) -> None:
+    with _state.lock:
+        entry = _state.samples.get(name)
+        if entry is None:
+            entry = {
+                'latencies': deque(maxlen=MAX_SAMPLES),
+                'peaks': deque(maxlen=MAX_SAMPLES),
+                'calls': 0,
+                'total_time': 0.0,
+                'rows': 0,
+                'row_time': 0.0,
+            }
+            _state.samples[name] = entry
+        entry['latencies'].append(elapsed)
+        entry['calls'] += 1
+        entry['total_time'] += elapsed
+        if rows is not None:
+            entry['rows'] += rows
+            entry['row_time'] += elapsed
+        if peak is not None:
+            entry['peaks'].append(peak)
+
+
+def instrument(name: Optional[str] = None, count_rows: Optional[Callable] = None):
+    """
+    Decorator that records latency, throughput and peak memory for a function.
+
+    Args:
+        name (str): Metric name (default: the function's qualified name)
+        count_rows (callable): ``count_rows(args, kwargs, result)`` returning the
+            number of rows processed. Defaults to the length of the first
+            DataFrame in the result or arguments.
+
+    Returns:
+        callable: Decorator
+    """
+    def decorator(func):
+        metric_name = name or f"{func.__module__}.{func.__qualname__}"
+        row_counter = count_rows or _default_row_count
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return func(*args, **kwargs)
+
+            trace = _state.trace_memory and tracemalloc.is_tracing()
+            if trace:
+                window = begin_peak_window()
+
+            start_time = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start_time
+                peak = end_peak_window(window)[0] if trace else None
+
+            try:
+                rows = row_counter(args, kwargs, result)
+            except Exception:
+                rows = None
+            _record(metric_name, elapsed, rows, peak)
+            return result
+
+        wrapper.metric_name = metric_name
+        return wrapper
+    return decorator
+
+
+def get_instrumentation_report() -> Dict[str, Dict[str, Any]]:
+    """
+    Return the metrics collected for every instrumented function.
+
+    Returns:
+        dict: Mapping of metric name to a dict with ``calls``, ``total_s``,
+        ``mean_s``, ``min_s``, ``p50_s``, ``p95_s``, ``p99_s``, ``max_s``, ``rows``,
+        ``rows_per_sec``, ``peak_memory_bytes`` and ``mean_peak_memory_bytes``.
+        Percentiles cover the most recent ``MAX_SAMPLES`` calls.
+    """
+    with _state.lock:
+        snapshot = {
+            name: (np.fromiter(entry['latencies'], dtype=float),
+                   np.fromiter(entry['peaks'], dtype=float),
+                   entry['calls'], entry['total_time'], entry['rows'], entry['row_time'])
+            for name, entry in _state.samples.items()
+        }
+
+    report = {}
+    for name, (latencies, peaks, calls, total_time, rows, row_time) in snapshot.items():
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        report[name] = {
+            'calls': calls,
+            'total_s': total_time,
+            'mean_s': total_time / calls,
+            'min_s': float(latencies.min()),
+            'p50_s': float(p50),
+            'p95_s': float(p95),
+            'p99_s': float(p99),
+            'max_s': float(latencies.max()),
+            'rows': rows,
+            'rows_per_sec': rows / row_time if row_time > 0 else None,
+            'peak_memory_bytes': int(peaks.max()) if len(peaks) else None,
+            'mean_peak_memory_bytes': float(peaks.mean()) if len(peaks) else None,
+        }
+    return report
+
+
+def get_instrumentation_frame() -> pd.DataFrame:
+    """Return the instrumentation report as a DataFrame indexed by metric name."""
+    return pd.DataFrame.from_dict(get_instrumentation_report(), orient='index')
+
+
+if os.environ.get('CFB_DYNASTY_INSTRUMENT', '').lower() in ('1', 'true', 'yes'):
+    enable_instrumentation()
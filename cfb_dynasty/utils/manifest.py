@@ -0,0 +1,124 @@
+"""Input manifest for skipping unchanged work.
+
+The manifest remembers, per pipeline stage, the fingerprint (size, mtime and
+SHA-256) of every input a run consumed, a hash of the parameters it ran with
+and the outputs it produced. A later run can ask whether a stage is current
+for its inputs and skip it when none of them or its parameters changed and
+its outputs are still in place.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List, Optional, Sequence
+
+from .export_writer import write_json_atomic
+from .file_utils import file_fingerprint
+from .log import get_logger
+
+logger = get_logger(__name__)
+
+MANIFEST_FILE = 'input_manifest.json'
+
+
+def params_hash(params: Optional[dict]) -> Optional[str]:
+    """Return a stable SHA-256 of JSON-serializable stage parameters (None for none)."""
+    if params is None:
+        return None
+    encoded = json.dumps(params, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class InputManifest:
+    """Records input fingerprints and derived outputs per pipeline stage."""
+
+    def __init__(self, folder: str, filename: str = MANIFEST_FILE):
+        """
+        Args:
+            folder (str): Folder holding the manifest (usually the pipeline's output folder)
+            filename (str): Manifest file name
+        """
+        self.path = os.path.join(folder, filename)
+        self.entries: Dict[str, dict] = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('entries', {})
+        except (OSError, ValueError):
+            self.entries = {}
+
+    @staticmethod
+    def _key(stage: str, inputs: Sequence[str]) -> str:
+        return f"{stage}:{os.path.abspath(inputs[0])}"
+
+    def _input_unchanged(self, path: str, recorded: dict) -> bool:
+        """Compare size and mtime first; only hash when they differ (e.g. a re-saved copy)."""
+        if not os.path.exists(path):
+            return False
+        current = file_fingerprint(path, include_hash=False)
+        if current['size'] != recorded['size']:
+            return False
+        if current['mtime_ns'] == recorded['mtime_ns']:
+            return True
+        if file_fingerprint(path)['sha256'] != recorded['sha256']:
+            return False
+        # Same contents with a new mtime: remember it so the next check is cheap
+        recorded['mtime_ns'] = current['mtime_ns']
+        return True
+
+    def is_current(self, stage: str, inputs: Sequence[str], params: Optional[dict] = None) -> bool:
+        """
+        Check whether a stage already ran for these exact inputs and parameters.
+
+        Args:
+            stage (str): Stage name, e.g. 'analysis' or 'rollover'
+            inputs (list): Input file paths; the first identifies the run
+            params (dict): Settings that change the stage's outputs, e.g. the
+                school for a rollover
+
+        Returns:
+            bool: True if every input is unchanged, the parameters match and
+            every recorded output still exists as it was written
+        """
+        entry = self.entries.get(self._key(stage, inputs))
+        if entry is None or entry.get('params') != params_hash(params):
+            return False
+
+        recorded_inputs = entry['inputs']
+        if set(recorded_inputs) != {os.path.abspath(p) for p in inputs}:
+            return False
+        if not all(self._input_unchanged(p, recorded_inputs[p]) for p in recorded_inputs):
+            return False
+
+        for path, recorded in entry['outputs'].items():
+            if not os.path.exists(path) or file_fingerprint(path, include_hash=False) != recorded:
+                return False
+        return True
+
+    def record(self, stage: str, inputs: Sequence[str], outputs: Sequence[str],
+               params: Optional[dict] = None) -> None:
+        """Remember the inputs and parameters a stage ran with and the outputs it wrote."""
+        self.entries[self._key(stage, inputs)] = {
+            'inputs': {os.path.abspath(p): file_fingerprint(p) for p in inputs},
+            'params': params_hash(params),
+            'outputs': {os.path.abspath(p): file_fingerprint(p, include_hash=False) for p in outputs},
+            'processed': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+
+    def outputs(self, stage: str, inputs: Sequence[str]) -> List[str]:
+        """Return the outputs recorded for a stage run, or an empty list."""
+        entry = self.entries.get(self._key(stage, inputs))
+        return list(entry['outputs']) if entry else []
+
+    def forget(self, stage: Optional[str] = None) -> None:
+        """Drop recorded runs for one stage (or all stages) so they are reprocessed."""
+        if stage is None:
+            self.entries.clear()
+        else:
+            self.entries = {k: v for k, v in self.entries.items() if not k.startswith(f"{stage}:")}
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        write_json_atomic(self.path, {'entries': self.entries})
+        logger.debug(f"Saved input manifest with {len(self.entries)} entries to {self.path}")
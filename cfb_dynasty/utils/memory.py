@@ -0,0 +1,187 @@
+"""Per-stage memory accounting for CFB Dynasty Data pipelines.
+
+Pipeline code marks its stages with ``memory_stage`` and its intermediate
+copies with ``record_copy``. Both do nothing unless a ``MemoryAccountant`` is
+active, so the markers can stay in hot paths::
+
+    with track_memory() as accountant:
+        generate_roster(roster_df, recruits_df, 'TEXAS TECH')
+    accountant.stage_frame()
+"""
+
+import contextlib
+import contextvars
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from .instrumentation import begin_peak_window, end_peak_window
+
+_active_accountant: contextvars.ContextVar = contextvars.ContextVar('memory_accountant', default=None)
+
+
+def column_memory(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Report the memory used by each column of a DataFrame.
+
+    Returns:
+        pd.DataFrame: ``column``, ``dtype`` and ``bytes`` per column, largest first
+    """
+    usage = df.memory_usage(deep=True, index=False)
+    return pd.DataFrame({
+        'column': usage.index,
+        'dtype': [str(df[col].dtype) for col in usage.index],
+        'bytes': usage.to_numpy(),
+    }).sort_values('bytes', ascending=False, ignore_index=True)
+
+
+def column_memory_delta(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compare per-column memory of a DataFrame before and after a dtype change.
+
+    Returns:
+        pd.DataFrame: ``column``, ``dtype_before``, ``dtype_after``,
+        ``bytes_before``, ``bytes_after`` and ``bytes_saved`` for columns
+        present in both frames
+    """
+    merged = column_memory(before).merge(
+        column_memory(after), on='column', suffixes=('_before', '_after')
+    )
+    merged['bytes_saved'] = merged['bytes_before'] - merged['bytes_after']
+    return merged.sort_values('bytes_saved', ascending=False, ignore_index=True)
+
+
+class MemoryAccountant:
+    """Collects per-stage, per-copy and per-column memory figures."""
+
+    def __init__(self):
+        self.stages: List[Dict[str, Any]] = []
+        self.copies: List[Dict[str, Any]] = []
+        self.columns: List[pd.DataFrame] = []
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        """Start tracemalloc if nothing else has."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        """Stop tracemalloc if this accountant started it."""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Measure traced memory and time for the enclosed block."""
+        if not tracemalloc.is_tracing():
+            yield
+            return
+
+        start_bytes = tracemalloc.get_traced_memory()[0]
+        window = begin_peak_window()
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            peak_bytes, end_bytes = end_peak_window(window)
+            self.stages.append({
+                'stage': name,
+                'start_bytes': start_bytes,
+                'end_bytes': end_bytes,
+                'retained_bytes': end_bytes - start_bytes,
+                'peak_bytes': peak_bytes,
+                'seconds': time.perf_counter() - start_time,
+            })
+
+    def record_copy(self, label: str, df: pd.DataFrame) -> None:
+        """Record the size of an intermediate DataFrame copy."""
+        self.copies.append({
+            'copy': label,
+            'rows': len(df),
+            'bytes': int(df.memory_usage(deep=True).sum()),
+        })
+
+    def record_columns(self, label: str, before: pd.DataFrame, after: pd.DataFrame) -> None:
+        """Record per-column memory before and after a dtype optimization."""
+        delta = column_memory_delta(before, after)
+        delta.insert(0, 'label', label)
+        self.columns.append(delta)
+
+    def stage_frame(self) -> pd.DataFrame:
+        """Return per-stage memory as a DataFrame, in completion order."""
+        return pd.DataFrame(self.stages, columns=[
+            'stage', 'start_bytes', 'end_bytes', 'retained_bytes', 'peak_bytes', 'seconds'
+        ])
+
+    def copy_frame(self) -> pd.DataFrame:
+        """Return the recorded intermediate copies as a DataFrame."""
+        return pd.DataFrame(self.copies, columns=['copy', 'rows', 'bytes'])
+
+    def column_frame(self) -> pd.DataFrame:
+        """Return all recorded per-column before/after figures as one DataFrame."""
+        if not self.columns:
+            return pd.DataFrame(columns=[
+                'label', 'column', 'dtype_before', 'bytes_before',
+                'dtype_after', 'bytes_after', 'bytes_saved'
+            ])
+        return pd.concat(self.columns, ignore_index=True)
+
+    def report(self) -> Dict[str, Any]:
+        """Return every recorded figure as plain Python data."""
+        return {
+            'stages': list(self.stages),
+            'copies': list(self.copies),
+            'columns': self.column_frame().to_dict('records'),
+        }
+
+
+@contextlib.contextmanager
+def track_memory(accountant: Optional[MemoryAccountant] = None):
+    """
+    Activate memory accounting for the enclosed block.
+
+    Args:
+        accountant (MemoryAccountant): Accountant to fill (default: a new one)
+
+    Yields:
+        MemoryAccountant: The active accountant
+    """
+    accountant = accountant or MemoryAccountant()
+    accountant.start()
+    token = _active_accountant.set(accountant)
+    try:
+        yield accountant
+    finally:
+        _active_accountant.reset(token)
+        accountant.stop()
+
+
+def get_memory_accountant() -> Optional[MemoryAccountant]:
+    """Return the active accountant, or None when memory accounting is off."""
+    return _active_accountant.get()
+
+
+def memory_stage(name: str):
+    """Context manager marking a pipeline stage; a no-op when accounting is off."""
+    accountant = _active_accountant.get()
+    if accountant is None:
+        return contextlib.nullcontext()
+    return accountant.stage(name)
+
+
+def record_copy(label: str, df: pd.DataFrame) -> None:
+    """Record an intermediate copy if memory accounting is active."""
+    accountant = _active_accountant.get()
+    if accountant is not None:
+        accountant.record_copy(label, df)
+
+
+def record_columns(label: str, before: pd.DataFrame, after: pd.DataFrame) -> None:
+    """Record per-column dtype savings if memory accounting is active."""
+    accountant = _active_accountant.get()
+    if accountant is not None:
+        accountant.record_columns(label, before, after)
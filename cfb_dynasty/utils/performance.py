@@ -2,9 +2,15 @@
 
 import pandas as pd
 import functools
+import os
 import time
-from typing import Dict, Any, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from ..utils.log import get_logger
+from .memory import column_memory, memory_stage, record_columns
+from .file_utils import ingest_csv
+from ..config.schema import ROSTER_SCHEMA
 
 logger = get_logger(__name__)
 
@@ -23,47 +29,110 @@ def timer_decorator(func):
 
 class DataFrameOptimizer:
     """Optimize DataFrame operations for better performance."""
-    
+
+    BOOLEAN_VALUES = {True, False, 'True', 'False', 'true', 'false', 1, 0}
+
     @staticmethod
-    def optimize_datatypes(df: pd.DataFrame) -> pd.DataFrame:
-        """Optimize DataFrame column data types for memory efficiency."""
-        optimized_df = df.copy()
-        
-        for col in optimized_df.columns:
+    def plan_datatypes(df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Work out which columns can be stored in a smaller dtype.
+
+        Each integer column is scanned once for its min and max; float columns
+        are downcast only if they have no missing values and survive the
+        conversion unchanged.
+
+        Returns:
+            list: One dict per planned conversion with ``column``,
+            ``from_dtype``, ``to_dtype``, ``bytes_before`` and ``bytes_after``
+        """
+        return [conversion for conversion, _ in DataFrameOptimizer._plan_conversions(df)]
+
+    @staticmethod
+    def _plan_conversions(df: pd.DataFrame) -> List[Tuple[Dict[str, Any], Optional[pd.Series]]]:
+        """Plan conversions, keeping float columns already downcast while planning (None otherwise)."""
+        plan = []
+
+        for col in df.columns:
+            series = df[col]
+            to_dtype = None
+            converted = None
+
             # Convert boolean-like columns
-            if optimized_df[col].dtype == 'object':
-                unique_values = set(optimized_df[col].dropna().unique())
-                if unique_values.issubset({True, False, 'True', 'False', 'true', 'false', 1, 0}):
-                    optimized_df[col] = optimized_df[col].astype('bool')
-                    logger.debug(f"Converted {col} to boolean")
-                
+            if series.dtype == 'object':
+                unique_values = set(series.dropna().unique())
+                if unique_values.issubset(DataFrameOptimizer.BOOLEAN_VALUES):
+                    to_dtype = 'bool'
+
             # Convert numeric columns to more efficient types
-            elif optimized_df[col].dtype in ['int64', 'float64']:
-                if optimized_df[col].dtype == 'int64':
-                    if optimized_df[col].min() >= 0 and optimized_df[col].max() <= 255:
-                        optimized_df[col] = optimized_df[col].astype('uint8')
-                    elif optimized_df[col].min() >= -32768 and optimized_df[col].max() <= 32767:
-                        optimized_df[col] = optimized_df[col].astype('int16')
-                    elif optimized_df[col].min() >= -2147483648 and optimized_df[col].max() <= 2147483647:
-                        optimized_df[col] = optimized_df[col].astype('int32')
-                
-                elif optimized_df[col].dtype == 'float64':
-                    if optimized_df[col].notna().all():  # No NaN values
-                        optimized_df[col] = pd.to_numeric(optimized_df[col], downcast='float')
-        
-        return optimized_df
+            elif series.dtype == 'int64' and len(series):
+                values = series.to_numpy()
+                col_min, col_max = values.min(), values.max()
+                if col_min >= 0 and col_max <= 255:
+                    to_dtype = 'uint8'
+                elif col_min >= -32768 and col_max <= 32767:
+                    to_dtype = 'int16'
+                elif col_min >= -2147483648 and col_max <= 2147483647:
+                    to_dtype = 'int32'
+
+            elif series.dtype == 'float64':
+                if series.notna().all():  # No NaN values
+                    downcast = pd.to_numeric(series, downcast='float')
+                    if downcast.dtype != series.dtype:
+                        to_dtype, converted = str(downcast.dtype), downcast
+
+            if to_dtype is not None:
+                plan.append(({
+                    'column': col,
+                    'from_dtype': str(series.dtype),
+                    'to_dtype': to_dtype,
+                    'bytes_before': int(series.memory_usage(index=False, deep=True)),
+                    'bytes_after': len(series) * pd.api.types.pandas_dtype(to_dtype).itemsize,
+                }, converted))
+
+        return plan
+
+    @staticmethod
+    def optimize_datatypes(df: pd.DataFrame, inplace: bool = False, dry_run: bool = False):
+        """
+        Optimize DataFrame column data types for memory efficiency.
+
+        Args:
+            df (pd.DataFrame): DataFrame to optimize
+            inplace (bool): Convert columns on ``df`` itself instead of a copy
+            dry_run (bool): Only report the planned conversions
+
+        Returns:
+            pd.DataFrame, list or None: The optimized copy, the list of planned
+            conversions when ``dry_run`` is set, or None when ``inplace``
+        """
+        plan = DataFrameOptimizer._plan_conversions(df)
+        if dry_run:
+            return [conversion for conversion, _ in plan]
+
+        optimized_df = df if inplace else df.copy()
+
+        for conversion, converted in plan:
+            col = conversion['column']
+            if converted is not None:
+                # Float columns were already downcast while planning
+                optimized_df[col] = converted
+            else:
+                optimized_df[col] = optimized_df[col].astype(conversion['to_dtype'])
+            logger.debug(f"Converted {col} from {conversion['from_dtype']} to {conversion['to_dtype']}")
+
+        return None if inplace else optimized_df
     
     @staticmethod
-    def create_categorical_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    def create_categorical_columns(df: pd.DataFrame, columns: List[str], inplace: bool = False):
         """Convert specified columns to categorical for memory efficiency."""
-        optimized_df = df.copy()
+        optimized_df = df if inplace else df.copy()
         
         for col in columns:
-            if col in optimized_df.columns:
+            if col in optimized_df.columns and not isinstance(optimized_df[col].dtype, pd.CategoricalDtype):
                 optimized_df[col] = optimized_df[col].astype('category')
                 logger.debug(f"Converted {col} to categorical")
         
-        return optimized_df
+        return None if inplace else optimized_df
 
 
 class AnalysisCache:
@@ -104,24 +173,18 @@ class AnalysisCache:
 analysis_cache = AnalysisCache()
 
 
-@timer_decorator
-def optimized_value_calculation(df: pd.DataFrame) -> pd.DataFrame:
-    """Optimized version of player value calculation for large datasets."""
+def _calculate_values(df: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized player value calculation without caching."""
     from ..config.constants import DEV_TRAIT_MULTIPLIERS, REMAINING_YEARS, RS_DISCOUNT
-    
-    # Cache key based on DataFrame hash
-    cache_key = f"value_calc_{hash(pd.util.hash_pandas_object(df).sum())}"
-    cached_result = analysis_cache.get(cache_key)
-    
-    if cached_result is not None:
-        return cached_result
-    
-    # Optimize DataFrame
-    optimized_df = DataFrameOptimizer.optimize_datatypes(df.copy())
+
+    # Optimize DataFrame (the optimizer makes the only copy)
+    with memory_stage('value_calculation.optimize_datatypes'):
+        optimized_df = DataFrameOptimizer.optimize_datatypes(df)
+    record_columns('value_calculation.optimize_datatypes', df, optimized_df)
     
     # Vectorized operations
-    dev_multipliers = optimized_df['DEV TRAIT'].map(DEV_TRAIT_MULTIPLIERS).fillna(1.0)
-    remaining_years = optimized_df['YEAR'].map(REMAINING_YEARS).fillna(0)
+    dev_multipliers = optimized_df['DEV TRAIT'].map(DEV_TRAIT_MULTIPLIERS).astype(float).fillna(1.0)
+    remaining_years = optimized_df['YEAR'].map(REMAINING_YEARS).astype(float).fillna(0)
     
     # Handle both column name formats
     base_rating = optimized_df.get('BASE RATING', optimized_df.get('BASE OVERALL', 0))
@@ -138,37 +201,104 @@ def optimized_value_calculation(df: pd.DataFrame) -> pd.DataFrame:
     
     optimized_df['VALUE'] = values
     
+    return optimized_df
+
+
+@timer_decorator
+def optimized_value_calculation(df: pd.DataFrame) -> pd.DataFrame:
+    """Optimized version of player value calculation for large datasets."""
+    # Cache key based on DataFrame hash
+    cache_key = f"value_calc_{hash(pd.util.hash_pandas_object(df).sum())}"
+    cached_result = analysis_cache.get(cache_key)
+    
+    if cached_result is not None:
+        return cached_result
+    
+    optimized_df = _calculate_values(df)
+    
     # Cache the result
     analysis_cache.set(cache_key, optimized_df)
     
     return optimized_df
 
 
-def batch_process_rosters(roster_files: List[str], batch_size: int = 10) -> List[pd.DataFrame]:
-    """Process multiple roster files in batches to manage memory."""
-    results = []
-    
-    for i in range(0, len(roster_files), batch_size):
-        batch = roster_files[i:i + batch_size]
-        logger.info(f"Processing batch {i//batch_size + 1} ({len(batch)} files)")
-        
-        batch_results = []
-        for file_path in batch:
+def _process_roster_file(file_path: str, output_dir: Optional[str] = None):
+    """Read and value a single roster file, optionally writing the result to disk."""
+    df = _calculate_values(ingest_csv(file_path, schema=ROSTER_SCHEMA))
+    if output_dir is None:
+        return df
+
+    output_path = os.path.join(output_dir, os.path.basename(file_path))
+    df.to_csv(output_path, index=False)
+    return output_path
+
+
+def stream_process_rosters(roster_files: Iterable[str], max_in_flight: int = 4,
+                           max_workers: Optional[int] = None,
+                           output_dir: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+    """
+    Read and value roster files in a worker pool, yielding results in input order.
+
+    At most ``max_in_flight`` files are read or held in memory at once. A new
+    file is only submitted after the consumer takes a result, so a slow
+    consumer throttles the pool instead of letting results pile up. Results
+    bypass ``analysis_cache`` so memory stays bounded regardless of how many
+    files are processed.
+
+    Args:
+        roster_files (iterable): Roster CSV paths; may be a lazy iterator
+        max_in_flight (int): Maximum number of files submitted but not yet yielded
+        max_workers (int): Worker threads (default: ``max_in_flight``)
+        output_dir (str): If given, write each valued roster to this folder
+            (named after its input file) and yield the output path instead
+            of the DataFrame
+
+    Yields:
+        tuple: (input_path, DataFrame or output_path). Files that fail are
+        logged and skipped.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    files = iter(roster_files)
+    pending = deque()
+
+    with ThreadPoolExecutor(max_workers=max_workers or max_in_flight) as executor:
+        def submit_next() -> bool:
+            file_path = next(files, None)
+            if file_path is None:
+                return False
+            pending.append((file_path, executor.submit(_process_roster_file, file_path, output_dir)))
+            return True
+
+        while len(pending) < max_in_flight and submit_next():
+            pass
+
+        while pending:
+            file_path, future = pending.popleft()
             try:
-                df = pd.read_csv(file_path)
-                df = optimized_value_calculation(df)
-                batch_results.append(df)
+                result = future.result()
             except Exception as e:
                 logger.error(f"Error processing {file_path}: {e}")
-                continue
-        
-        results.extend(batch_results)
-        
-        # Clear memory after each batch
-        if i % (batch_size * 3) == 0:  # Every 3 batches
-            analysis_cache.clear()
-    
-    return results
+                result = None
+
+            # Refill before yielding so workers stay busy while the consumer runs
+            submit_next()
+            if result is not None:
+                yield file_path, result
+            del future, result
+
+
+def batch_process_rosters(roster_files: List[str], batch_size: int = 10) -> List[pd.DataFrame]:
+    """
+    Process multiple roster files and return every valued DataFrame.
+
+    Prefer ``stream_process_rosters`` for large file sets; this function keeps
+    all results in memory.
+    """
+    return [df for _, df in stream_process_rosters(roster_files, max_in_flight=batch_size)]
 
 
 class PerformanceProfiler:
@@ -233,17 +363,17 @@ def optimize_for_large_datasets(df: pd.DataFrame, threshold: int = 1000) -> pd.D
     # Apply optimizations
     optimized_df = DataFrameOptimizer.optimize_datatypes(df)
     
-    # Convert position and other categorical columns
+    # Convert position and other categorical columns on the same copy
     categorical_columns = ['POSITION', 'YEAR', 'DEV TRAIT', 'ARCHETYPE', 'STATUS']
-    optimized_df = DataFrameOptimizer.create_categorical_columns(optimized_df, categorical_columns)
+    DataFrameOptimizer.create_categorical_columns(optimized_df, categorical_columns, inplace=True)
     
     return optimized_df
 
 
 def memory_usage_report(df: pd.DataFrame) -> None:
-    """Print memory usage report for a DataFrame."""
-    memory_usage = df.memory_usage(deep=True)
-    total_memory = memory_usage.sum()
+    """Print memory usage report for a DataFrame (see ``column_memory`` for the data)."""
+    usage = column_memory(df)
+    total_memory = int(df.memory_usage(deep=True).sum())
     
     print(f"\n💾 MEMORY USAGE REPORT")
     print("=" * 30)
@@ -254,10 +384,8 @@ def memory_usage_report(df: pd.DataFrame) -> None:
     
     # Show top memory consuming columns
     print("\nTop memory consuming columns:")
-    sorted_usage = memory_usage.sort_values(ascending=False).head(5)
-    for col, usage in sorted_usage.items():
-        if col != 'Index':
-            print(f"   {col}: {usage / 1024:.1f} KB ({df[col].dtype})")
+    for row in usage.head(5).itertuples(index=False):
+        print(f"   {row.column}: {row.bytes / 1024:.1f} KB ({row.dtype})")
 
 
 # Convenience function to enable all optimizations
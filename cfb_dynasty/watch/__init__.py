@@ -0,0 +1,10 @@
+"""
+CFB Dynasty Watch Package
+
+Long-running watch mode that reprocesses roster and recruiting exports as
+they land. Run it with ``python -m cfb_dynasty.watch`` or ``cfb-dynasty-watch``.
+"""
+
+from .daemon import DirectoryWatcher, DynastyPipeline, watch, main
+
+__all__ = ['DirectoryWatcher', 'DynastyPipeline', 'watch', 'main']
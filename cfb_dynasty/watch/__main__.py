@@ -0,0 +1,6 @@
+"""Entry point for ``python -m cfb_dynasty.watch``."""
+
+from .daemon import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""Watch mode: reprocess roster and recruiting exports as they land."""
+
+import argparse
+import fnmatch
+import logging
+import os
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from ..analysis.roster_analysis import process_roster_and_create_recruiting_plan
+from ..config.constants import DEFAULT_POSITION_REQUIREMENTS
+from ..config.schema import GENERATION_COLUMNS, RECRUIT_SCHEMA, ROSTER_SCHEMA
+from ..data.roster_generator import generate_roster
+from ..utils.export_writer import write_exports
+from ..utils.file_utils import DEFAULT_FOLDER, export_files, file_fingerprint, ingest_csv, output_name
+from ..utils.log import get_logger, setup_logging
+from ..utils.manifest import InputManifest
+
+logger = get_logger(__name__)
+
+ROSTER_PATTERN = '*[Rr]oster.csv'
+RECRUITING_PATTERN = '*[Rr]ecruiting*.csv'
+
+DEFAULT_INTERVAL = 1.0
+DEFAULT_DEBOUNCE = 2.0
+
+# Manifest stage for the watch analysis; its outputs differ from the
+# 'analysis' stage recorded by roster_analysis.main in the same folder
+ANALYSIS_STAGE = 'watch_analysis'
+
+# Files the analysis stage writes under <output>/cfb_dynasty_data
+ANALYSIS_OUTPUTS = ['player_values_analysis.csv', 'recruiting_plan_analysis.csv', 'position_analysis_detailed.csv']
+
+
+class DirectoryWatcher:
+    """
+    Polls a directory for new or modified files matching glob patterns.
+
+    A file is reported once its size and mtime have stayed the same for
+    ``debounce`` seconds, so a file still being written (or saved several
+    times in a row) triggers a single run.
+    """
+
+    def __init__(self, folder: str, patterns: Sequence[str], debounce: float = DEFAULT_DEBOUNCE,
+                 clock: Callable[[], float] = time.monotonic):
+        self.folder = folder
+        self.patterns = list(patterns)
+        self.debounce = debounce
+        self.clock = clock
+        self._pending: Dict[str, Tuple[Tuple[int, int], float]] = {}
+        self._reported: Dict[str, Tuple[int, int]] = {}
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        found = {}
+        try:
+            entries = list(os.scandir(self.folder))
+        except FileNotFoundError:
+            return found
+        for entry in entries:
+            if entry.is_file() and any(fnmatch.fnmatchcase(entry.name, p) for p in self.patterns):
+                stat = entry.stat()
+                found[entry.path] = (stat.st_size, stat.st_mtime_ns)
+        return found
+
+    def poll(self) -> List[str]:
+        """
+        Scan once and return the files that changed and have settled.
+
+        Returns:
+            list: Paths ready for processing, sorted
+        """
+        now = self.clock()
+        current = self._scan()
+
+        for path in set(self._pending) - set(current):
+            del self._pending[path]
+        for path in set(self._reported) - set(current):
+            del self._reported[path]
+
+        ready = []
+        for path, signature in current.items():
+            if self._reported.get(path) == signature:
+                continue
+            pending = self._pending.get(path)
+            if pending is None or pending[0] != signature:
+                self._pending[path] = (signature, now)
+            elif now - pending[1] >= self.debounce:
+                ready.append(path)
+                self._reported[path] = signature
+                del self._pending[path]
+        return sorted(ready)
+
+
+class DynastyPipeline:
+    """
+    Runs only the stages affected by changed inputs, keeping caches warm between runs.
+
+    A changed roster re-runs valuation, the recruiting plan and the export for
+    that roster, then its rollover. A changed recruiting board re-runs the
+    rollover for every roster. Parsed recruiting boards are cached by file
+    fingerprint, and the input manifest skips inputs already processed by an
+    earlier run or process.
+    """
+
+    def __init__(self, input_folder: str, output_folder: Optional[str] = None, school: Optional[str] = None,
+                 position_requirements: Optional[dict] = None, new_path: str = 'New_Roster.csv'):
+        """
+        Args:
+            input_folder (str): Folder receiving roster and recruiting exports
+            output_folder (str): Base folder for outputs (default: the input folder);
+                files go to ``<output_folder>/cfb_dynasty_data``
+            school (str): School for the rollover; without it the rollover stage is skipped
+            position_requirements (dict): Position requirements for the plan
+            new_path (str): Rollover output file name, prefixed with each roster's file name
+        """
+        self.input_folder = input_folder
+        self.output_folder = output_folder or input_folder
+        self.data_folder = os.path.join(self.output_folder, 'cfb_dynasty_data')
+        self.school = school
+        self.position_requirements = position_requirements or DEFAULT_POSITION_REQUIREMENTS
+        self.new_path = new_path
+        self.manifest = InputManifest(self.data_folder)
+        self._recruits_cache: Dict[str, Tuple[dict, pd.DataFrame]] = {}
+
+    def _files(self, pattern: str) -> List[str]:
+        try:
+            names = os.listdir(self.input_folder)
+        except FileNotFoundError:
+            return []
+        return sorted(os.path.join(self.input_folder, n) for n in names if fnmatch.fnmatchcase(n, pattern))
+
+    def _recruits(self, path: str) -> pd.DataFrame:
+        """Return a parsed recruiting board, re-reading it only when the file changed."""
+        fingerprint = file_fingerprint(path, include_hash=False)
+        cached = self._recruits_cache.get(path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        recruits_df = ingest_csv(path, GENERATION_COLUMNS, RECRUIT_SCHEMA)
+        self._recruits_cache[path] = (fingerprint, recruits_df)
+        return recruits_df
+
+    def analyze(self, roster_path: str) -> bool:
+        """Run valuation, the recruiting plan and the export for one roster. Returns True if it ran."""
+        params = {'position_requirements': self.position_requirements}
+        if self.manifest.is_current(ANALYSIS_STAGE, [roster_path], params):
+            return False
+        roster_df, recruiting_plan = process_roster_and_create_recruiting_plan(
+            roster_path, self.position_requirements
+        )
+        if not export_files(self.output_folder, roster_df, recruiting_plan, self.position_requirements,
+                            source_path=roster_path):
+            raise RuntimeError(f"Export failed for {roster_path}")
+        outputs = [os.path.join(self.data_folder, output_name(roster_path, name)) for name in ANALYSIS_OUTPUTS]
+        self.manifest.record(ANALYSIS_STAGE, [roster_path], [p for p in outputs if os.path.exists(p)], params)
+        return True
+
+    def rollover(self, roster_path: str, recruiting_path: str) -> bool:
+        """Generate next season's roster for one roster file. Returns True if it ran."""
+        inputs = [roster_path, recruiting_path]
+        params = {'school': self.school}
+        if self.manifest.is_current('rollover', inputs, params):
+            return False
+        roster_df = ingest_csv(roster_path, GENERATION_COLUMNS, ROSTER_SCHEMA)
+        new_roster_df = generate_roster(roster_df, self._recruits(recruiting_path), self.school)
+        new_name = output_name(roster_path, self.new_path)
+        write_exports({new_name: new_roster_df}, self.data_folder)
+        self.manifest.record('rollover', inputs, [os.path.join(self.data_folder, new_name)], params)
+        return True
+
+    def run(self, changed: Sequence[str]) -> Dict[str, List[str]]:
+        """
+        Process changed input files.
+
+        Args:
+            changed (list): Changed roster and/or recruiting file paths
+
+        Returns:
+            dict: Stage name -> roster files that stage ran for
+        """
+        names = {path: os.path.basename(path) for path in changed}
+        rosters = [p for p in changed if fnmatch.fnmatchcase(names[p], ROSTER_PATTERN)]
+        recruiting_changed = any(fnmatch.fnmatchcase(names[p], RECRUITING_PATTERN) for p in changed)
+
+        ran = {'analysis': [], 'rollover': []}
+        for roster_path in rosters:
+            try:
+                if self.analyze(roster_path):
+                    ran['analysis'].append(roster_path)
+            except Exception as e:
+                logger.error(f"Analysis failed for {os.path.basename(roster_path)}: {e}")
+                logger.debug("Full error details:", exc_info=True)
+
+        recruiting_files = self._files(RECRUITING_PATTERN)
+        if self.school is None:
+            if rosters or recruiting_changed:
+                logger.warning("No school configured; skipping the rollover stage")
+        elif recruiting_files:
+            targets = self._files(ROSTER_PATTERN) if recruiting_changed else rosters
+            for roster_path in targets:
+                try:
+                    if self.rollover(roster_path, recruiting_files[0]):
+                        ran['rollover'].append(roster_path)
+                except Exception as e:
+                    logger.error(f"Rollover failed for {os.path.basename(roster_path)}: {e}")
+                    logger.debug("Full error details:", exc_info=True)
+
+        self.manifest.save()
+        return ran
+
+
+def watch(input_folder: str, output_folder: Optional[str] = None, school: Optional[str] = None,
+          interval: float = DEFAULT_INTERVAL, debounce: float = DEFAULT_DEBOUNCE,
+          max_cycles: Optional[int] = None,
+          on_run: Optional[Callable[[Dict[str, List[str]]], None]] = None) -> None:
+    """
+    Poll a folder and reprocess roster and recruiting exports as they change.
+
+    Args:
+        input_folder (str): Folder to watch
+        output_folder (str): Base folder for outputs (default: the input folder)
+        school (str): School for the rollover stage
+        interval (float): Seconds between polls
+        debounce (float): Seconds a file must stay unchanged before it is processed
+        max_cycles (int): Stop after this many polls (default: run until interrupted)
+        on_run (callable): Called with each run's stage results
+    """
+    pipeline = DynastyPipeline(input_folder, output_folder, school)
+    watcher = DirectoryWatcher(input_folder, [ROSTER_PATTERN, RECRUITING_PATTERN], debounce)
+    logger.info(f"Watching {input_folder} every {interval}s (debounce {debounce}s)")
+
+    cycles = 0
+    try:
+        while max_cycles is None or cycles < max_cycles:
+            changed = watcher.poll()
+            if changed:
+                logger.info(f"Detected {len(changed)} changed file(s): "
+                            f"{', '.join(os.path.basename(p) for p in changed)}")
+                start_time = time.perf_counter()
+                ran = pipeline.run(changed)
+                logger.info(f"Processed in {time.perf_counter() - start_time:.2f}s: "
+                            f"{len(ran['analysis'])} analysis, {len(ran['rollover'])} rollover")
+                if on_run is not None:
+                    on_run(ran)
+            cycles += 1
+            if max_cycles is None or cycles < max_cycles:
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        logger.info("Watch mode stopped")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point for watch mode."""
+    parser = argparse.ArgumentParser(description="Reprocess CFB dynasty exports as they land")
+    parser.add_argument('--input', default=DEFAULT_FOLDER, help="Folder to watch (default: ~/Downloads)")
+    parser.add_argument('--output', help="Base output folder (default: the input folder)")
+    parser.add_argument('--school', help="School for the roster rollover (skipped if not set)")
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL, help="Seconds between polls")
+    parser.add_argument('--debounce', type=float, default=DEFAULT_DEBOUNCE,
+                        help="Seconds a file must be unchanged before processing")
+    args = parser.parse_args(argv)
+
+    setup_logging(log_level=logging.INFO)
+    watch(args.input, args.output, args.school, args.interval, args.debounce)
@@ -7,12 +7,13 @@ This package provides geographic analysis capabilities including:
 - Recruiting territory analysis
 """
 
-from .geocoding import get_city_coordinates, clear_coordinate_cache, get_cache_statistics
+from .geocoding import get_city_coordinates, geocode_many, clear_coordinate_cache, get_cache_statistics
 from .heatmaps import create_geographic_heatmap, create_city_bar_chart
 from .territory_analysis import create_recruiting_territory_map
 
 __all__ = [
     'get_city_coordinates',
+    'geocode_many',
     'clear_coordinate_cache',
     'get_cache_statistics',
     'create_geographic_heatmap',
@@ -0,0 +1,169 @@
+"""
+Recruit-to-school great-circle distances.
+
+Distances are computed with the haversine formula as NumPy broadcasts over
+all recruits x all schools. Recruits are processed in row chunks sized to a
+memory budget, intermediates are float64 and results are stored as float32
+(miles), so a league-wide matrix needs 4 bytes per recruit-school pair.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from cfb_dynasty.utils.instrumentation import instrument
+from .spatial import EARTH_RADIUS_MILES
+
+# Memory budget for one chunk's float64 intermediates
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+# Upper edges of the distance bands, in miles
+DEFAULT_BANDS = (100, 250, 500, 1000, np.inf)
+
+# float64 intermediates alive at once per recruit-school pair
+_TEMPORARIES = 4
+
+
+def _chunk_rows(n_schools: int, chunk_bytes: int) -> int:
+    return max(1, chunk_bytes // (max(1, n_schools) * 8 * _TEMPORARIES))
+
+
+def _radians(latitudes, longitudes) -> Tuple[np.ndarray, np.ndarray]:
+    return (np.radians(np.asarray(latitudes, dtype=np.float64)),
+            np.radians(np.asarray(longitudes, dtype=np.float64)))
+
+
+def _chunks(recruit_lats, recruit_lons, school_lats, school_lons, chunk_bytes: int):
+    """Yield (row slice, float64 distance block) for successive recruit chunks."""
+    lat1, lon1 = _radians(recruit_lats, recruit_lons)
+    lat2, lon2 = _radians(school_lats, school_lons)
+    cos_lat2 = np.cos(lat2)
+    rows = _chunk_rows(len(lat2), chunk_bytes)
+
+    for start in range(0, len(lat1), rows):
+        block = slice(start, start + rows)
+        a_lat, a_lon = lat1[block, None], lon1[block, None]
+        a = np.sin((lat2 - a_lat) / 2) ** 2
+        a += np.cos(a_lat) * cos_lat2 * np.sin((lon2 - a_lon) / 2) ** 2
+        np.clip(a, 0.0, 1.0, out=a)
+        yield block, 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(a))
+
+
+@instrument('haversine_matrix', count_rows=lambda args, kwargs, result: result.shape[0])
+def haversine_matrix(recruit_lats, recruit_lons, school_lats, school_lons,
+                     chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> np.ndarray:
+    """
+    Compute great-circle distances from every recruit to every school.
+
+    Args:
+        recruit_lats (array-like): Recruit latitudes in degrees (NaN if unknown)
+        recruit_lons (array-like): Recruit longitudes in degrees
+        school_lats (array-like): School latitudes in degrees
+        school_lons (array-like): School longitudes in degrees
+        chunk_bytes (int): Memory budget for each chunk's intermediates
+
+    Returns:
+        np.ndarray: float32 miles, shape (n_recruits, n_schools); NaN rows for
+        recruits without coordinates
+    """
+    distances = np.empty((len(recruit_lats), len(school_lats)), dtype=np.float32)
+    for block, miles in _chunks(recruit_lats, recruit_lons, school_lats, school_lons, chunk_bytes):
+        distances[block] = miles
+    return distances
+
+
+def nearest_school(recruit_lats, recruit_lons, school_lats, school_lons,
+                   chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assign every recruit to the closest school without building the full matrix.
+
+    Returns:
+        tuple: (school positions, float32 miles); -1 / NaN for recruits
+        without coordinates
+    """
+    n_recruits = len(recruit_lats)
+    positions = np.full(n_recruits, -1, dtype=np.int64)
+    distances = np.full(n_recruits, np.nan, dtype=np.float32)
+    if not len(school_lats):
+        return positions, distances
+
+    for block, miles in _chunks(recruit_lats, recruit_lons, school_lats, school_lons, chunk_bytes):
+        miles = np.where(np.isnan(miles), np.inf, miles)
+        closest = np.argmin(miles, axis=1)
+        shortest = miles[np.arange(len(miles)), closest]
+        known = np.isfinite(shortest)
+        positions[block] = np.where(known, closest, -1)
+        distances[block] = np.where(known, shortest, np.nan)
+    return positions, distances
+
+
+def band_labels(bands: Sequence[float] = DEFAULT_BANDS) -> list:
+    """Return labels like '0-100', '100-250', ..., '1000+' for band edges."""
+    labels, lower = [], 0
+    for upper in bands:
+        labels.append(f"{lower:g}+" if np.isinf(upper) else f"{lower:g}-{upper:g}")
+        lower = upper
+    return labels
+
+
+def distance_bands(recruit_lats, recruit_lons, school_lats, school_lons, schools: Optional[Sequence] = None,
+                   bands: Sequence[float] = DEFAULT_BANDS, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> pd.DataFrame:
+    """
+    Count recruits in each distance band around every school.
+
+    Args:
+        recruit_lats, recruit_lons (array-like): Recruit coordinates in degrees
+        school_lats, school_lons (array-like): School coordinates in degrees
+        schools (sequence): School names for the index (default: positions)
+        bands (sequence): Increasing upper band edges in miles; recruits beyond
+            the last edge are not counted
+        chunk_bytes (int): Memory budget for each chunk's intermediates
+
+    Returns:
+        pd.DataFrame: Recruit counts, one row per school and one column per band
+    """
+    edges = np.asarray(bands, dtype=np.float64)
+    n_schools, n_bands = len(school_lats), len(edges)
+    counts = np.zeros(n_schools * n_bands, dtype=np.int64)
+    school_offsets = np.arange(n_schools) * n_bands
+
+    for _, miles in _chunks(recruit_lats, recruit_lons, school_lats, school_lons, chunk_bytes):
+        band = np.searchsorted(edges, miles, side='left')
+        counted = (band < n_bands) & ~np.isnan(miles)
+        cells = (school_offsets + band)[counted]
+        counts += np.bincount(cells, minlength=n_schools * n_bands)
+
+    return pd.DataFrame(
+        counts.reshape(n_schools, n_bands),
+        index=pd.Index(schools if schools is not None else range(n_schools), name='SCHOOL'),
+        columns=band_labels(bands),
+    )
+
+
+def assign_nearest_school(recruits_df: pd.DataFrame, schools_df: pd.DataFrame, offline: bool = True,
+                          chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> pd.DataFrame:
+    """
+    Add each recruit's closest school and the distance to it.
+
+    Args:
+        recruits_df (pd.DataFrame): Recruits with 'CITY' and 'STATE' columns
+        schools_df (pd.DataFrame): Schools with 'SCHOOL', 'LATITUDE' and 'LONGITUDE' columns
+        offline (bool): Resolve hometowns without API calls (see ``geocode_many``)
+        chunk_bytes (int): Memory budget for each chunk's intermediates
+
+    Returns:
+        pd.DataFrame: Copy of ``recruits_df`` with 'NEAREST SCHOOL' and
+        'DISTANCE' (miles) columns; both are missing for unresolved hometowns
+    """
+    from .geocoding import geocode_many
+
+    lats, lons = geocode_many(zip(recruits_df['CITY'], recruits_df['STATE']), offline=offline)
+    positions, miles = nearest_school(lats, lons, schools_df['LATITUDE'].to_numpy(),
+                                      schools_df['LONGITUDE'].to_numpy(), chunk_bytes)
+
+    result = recruits_df.copy()
+    school_names = schools_df['SCHOOL'].to_numpy(dtype=object)
+    result['NEAREST SCHOOL'] = np.where(positions >= 0, school_names[np.maximum(positions, 0)], None)
+    result['DISTANCE'] = miles
+    return result
@@ -0,0 +1,206 @@
+"""
+Concurrent, rate-limited geocoding engine.
+
+Requests are spread over a thread pool and paced by a token bucket shared by
+every worker, so throughput tracks the provider's allowed request rate instead
+of fixed sleeps. Backends are pluggable: ``NominatimBackend`` wraps a single,
+reused geopy client and can be pointed at any Nominatim-compatible server,
+including the local stand-in in ``geography.standin``.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+# Nominatim's usage policy allows one request per second
+DEFAULT_RATE = 1.0
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_TIMEOUT = 10
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_BACKOFF = 0.5
+
+USER_AGENT = "cfb_dynasty_analysis"
+
+
+class GeocodeResult(NamedTuple):
+    """Outcome of one lookup: coordinates, or why there are none."""
+    coords: Optional[Tuple[float, float]]
+    reason: Optional[str]
+    detail: str
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, holding at most ``burst``."""
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self.sleep(wait)
+
+
+class NominatimBackend:
+    """Geocodes through one shared geopy Nominatim client (and its HTTP session)."""
+
+    def __init__(self, domain: Optional[str] = None, scheme: Optional[str] = None,
+                 timeout: int = DEFAULT_TIMEOUT, user_agent: str = USER_AGENT):
+        """
+        Args:
+            domain (str): Server host[:port] (default: nominatim.openstreetmap.org)
+            scheme (str): 'https' or 'http' (default: geopy's default, https)
+            timeout (int): Default request timeout in seconds
+            user_agent (str): User agent sent with every request
+        """
+        from geopy.geocoders import Nominatim
+
+        kwargs = {'user_agent': user_agent, 'timeout': timeout}
+        if domain is not None:
+            kwargs['domain'] = domain
+        if scheme is not None:
+            kwargs['scheme'] = scheme
+        self.client = Nominatim(**kwargs)
+
+    def geocode(self, city: str, state: str, timeout: Optional[int] = None) -> Optional[Tuple[float, float]]:
+        kwargs = {'timeout': timeout} if timeout is not None else {}
+        location = self.client.geocode(f"{city}, {state}, USA", **kwargs)
+        return (location.latitude, location.longitude) if location else None
+
+
+def _is_retryable(error: Exception) -> bool:
+    message = str(error).lower()
+    return ('timed out' in message or 'timeout' in message
+            or type(error).__name__ in ('GeocoderRateLimited', 'GeocoderUnavailable'))
+
+
+class GeocodingEngine:
+    """Runs geocoding requests concurrently under a shared rate limit."""
+
+    def __init__(self, backend=None, rate: float = DEFAULT_RATE, burst: int = 1,
+                 max_workers: int = DEFAULT_MAX_WORKERS, max_retries: int = DEFAULT_MAX_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF):
+        """
+        Args:
+            backend: Object with ``geocode(city, state, timeout=None)`` returning
+                (latitude, longitude) or None (default: NominatimBackend())
+            rate (float): Maximum requests per second across all workers
+            burst (int): Requests allowed back to back before the rate applies
+            max_workers (int): Concurrent requests
+            max_retries (int): Retries after a timeout or rate-limit error
+            backoff (float): Base delay before a retry, doubled on each attempt
+        """
+        self._backend = backend
+        self._backend_lock = threading.Lock()
+        self.bucket = TokenBucket(rate, burst)
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+    @property
+    def backend(self):
+        # Created lazily so importing geography does not require geopy
+        if self._backend is None:
+            with self._backend_lock:
+                if self._backend is None:
+                    self._backend = NominatimBackend()
+        return self._backend
+
+    def resolve(self, city: str, state: str, timeout: Optional[int] = None,
+                max_retries: Optional[int] = None) -> GeocodeResult:
+        """
+        Geocode one city, waiting for the rate limiter before every request.
+
+        Returns:
+            GeocodeResult: Coordinates, or the failure reason ('not_found' or
+            'error') and detail
+        """
+        max_retries = self.max_retries if max_retries is None else max_retries
+        for attempt in range(max_retries + 1):
+            if attempt > 0:
+                time.sleep(self.backoff * (2 ** (attempt - 1)))
+                print(f"🔄 Retry {attempt} for {city}, {state}")
+            self.bucket.acquire()
+            try:
+                coords = self.backend.geocode(city, state, timeout=timeout)
+            except Exception as e:
+                if _is_retryable(e) and attempt < max_retries:
+                    continue
+                print(f"⚠️  Failed to geocode {city}, {state} after {attempt + 1} attempt(s): {e}")
+                return GeocodeResult(None, 'error', str(e))
+
+            if coords is None:
+                print(f"⚠️  Could not find coordinates for {city}, {state}")
+                return GeocodeResult(None, 'not_found', '')
+            if attempt > 0:
+                print(f"✅ Successfully geocoded {city}, {state} on retry {attempt}")
+            return GeocodeResult(coords, None, '')
+        return GeocodeResult(None, 'error', 'retries exhausted')
+
+    def resolve_all(self, pairs: Sequence[Tuple[str, str]], timeout: Optional[int] = None,
+                    max_retries: Optional[int] = None) -> List[GeocodeResult]:
+        """
+        Geocode many cities concurrently.
+
+        Args:
+            pairs (list): (city, state) pairs
+            timeout (int): Request timeout in seconds (default: the backend's)
+            max_retries (int): Retries per city (default: the engine's)
+
+        Returns:
+            list: GeocodeResult for each pair, in input order
+        """
+        if not pairs:
+            return []
+        workers = min(self.max_workers, len(pairs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='geocode') as executor:
+            return list(executor.map(lambda pair: self.resolve(pair[0], pair[1], timeout, max_retries), pairs))
+
+    def geocode(self, city: str, state: str, timeout: Optional[int] = None,
+                max_retries: Optional[int] = None) -> Optional[Tuple[float, float]]:
+        """Geocode one city; returns (latitude, longitude) or None."""
+        return self.resolve(city, state, timeout, max_retries).coords
+
+    def geocode_all(self, pairs: Sequence[Tuple[str, str]], timeout: Optional[int] = None,
+                    max_retries: Optional[int] = None) -> List[Optional[Tuple[float, float]]]:
+        """Geocode many cities concurrently; returns (latitude, longitude) or None per pair."""
+        return [result.coords for result in self.resolve_all(pairs, timeout, max_retries)]
+
+
+_engine: Optional[GeocodingEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_geocoding_engine() -> GeocodingEngine:
+    """Return the process-wide geocoding engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = GeocodingEngine()
+    return _engine
+
+
+def set_geocoding_engine(engine: Optional[GeocodingEngine]) -> None:
+    """Replace the process-wide engine (None restores the default on next use)."""
+    global _engine
+    with _engine_lock:
+        _engine = engine
@@ -0,0 +1,205 @@
+"""
+Offline gazetteer of US city coordinates.
+
+The gazetteer is a sorted, fixed-width binary table (``data/gazetteer.bin``)
+memory-mapped with NumPy and searched by binary search, so a lookup touches a
+few pages of the file and needs no network. Keys are ``STATE|CITY`` with the
+full state name and city upper-cased, matching the coordinate cache.
+
+Build or refresh it with::
+
+    python -m geography.gazetteer                      # from data/city_coordinates.json
+    python -m geography.gazetteer --census 2020_Gaz_place_national.txt
+
+The Census Bureau's national places gazetteer covers every incorporated place
+and CDP in the US (about 32,000 rows, ~2.3 MB once built). No table is
+shipped, since one built from the coordinate cache alone adds no cities;
+``get_city_coordinates`` and ``geocode_many`` consult the table once it has
+been built and skip it while the file is absent.
+"""
+
+import argparse
+import csv
+import os
+import re
+import threading
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from cfb_dynasty.config.constants import STATE_ABBREVIATIONS
+from .simple_cache import city_key, get_coordinates_file_path, load_coordinates, normalize_state_name
+
+MAGIC = b'CFBGAZ01'
+KEY_WIDTH = 64
+HEADER_SIZE = 16
+RECORD_DTYPE = np.dtype([('key', f'S{KEY_WIDTH}'), ('lat', '<f4'), ('lon', '<f4')])
+
+# Census place names end with their legal/statistical area description
+_PLACE_SUFFIX = re.compile(
+    r'\s+(city and borough|consolidated government(?: \(balance\))?|metropolitan government(?: \(balance\))?|'
+    r'unified government(?: \(balance\))?|urban county|municipality|city|town|village|borough|CDP|comunidad|'
+    r'zona urbana)$'
+)
+
+
+def get_gazetteer_path() -> str:
+    """Get the path to the gazetteer file."""
+    return os.path.join(os.path.dirname(get_coordinates_file_path()), 'gazetteer.bin')
+
+
+def gazetteer_key(city: str, state: str) -> bytes:
+    """Encode the normalized lookup key for a city."""
+    return f"{normalize_state_name(state).upper()}|{city_key(city)}".encode('utf-8')
+
+
+def build_gazetteer(entries: Iterable[Tuple[str, str, float, float]], path: Optional[str] = None) -> int:
+    """
+    Write a gazetteer file from city coordinates.
+
+    Duplicate keys keep their first entry; names too long for a key are skipped.
+
+    Args:
+        entries (iterable): (city, state, latitude, longitude) tuples
+        path (str): Output file (default: data/gazetteer.bin)
+
+    Returns:
+        int: Number of cities written
+    """
+    path = path or get_gazetteer_path()
+    rows = {}
+    for city, state, latitude, longitude in entries:
+        key = gazetteer_key(city, state)
+        if len(key) <= KEY_WIDTH and key not in rows:
+            rows[key] = (latitude, longitude)
+
+    table = np.empty(len(rows), dtype=RECORD_DTYPE)
+    keys = sorted(rows)
+    table['key'] = keys
+    table['lat'] = [rows[key][0] for key in keys]
+    table['lon'] = [rows[key][1] for key in keys]
+
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(np.array([len(table), KEY_WIDTH], dtype='<u4').tobytes())
+        f.write(table.tobytes())
+    os.replace(temp_path, path)
+    return len(table)
+
+
+class Gazetteer:
+    """Read-only, memory-mapped view of a gazetteer file."""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path (str): Gazetteer file (default: data/gazetteer.bin)
+        """
+        self.path = path or get_gazetteer_path()
+        with open(self.path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE or header[:8] != MAGIC:
+            raise ValueError(f"Not a gazetteer file: {self.path}")
+        count, key_width = np.frombuffer(header[8:], dtype='<u4')
+        if key_width != KEY_WIDTH:
+            raise ValueError(f"Unsupported gazetteer key width {key_width} in {self.path}")
+
+        if count:
+            self._table = np.memmap(self.path, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE, shape=(int(count),))
+        else:
+            self._table = np.empty(0, dtype=RECORD_DTYPE)
+        self._keys = self._table['key']
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def lookup(self, city: str, state: str) -> Optional[Tuple[float, float]]:
+        """Return (latitude, longitude) for a city, or None if it is not in the gazetteer."""
+        key = gazetteer_key(city, state)
+        position = int(np.searchsorted(self._keys, key))
+        if position < len(self._keys) and self._keys[position] == key:
+            record = self._table[position]
+            return (float(record['lat']), float(record['lon']))
+        return None
+
+    def lookup_many(self, pairs: Sequence[Tuple[str, str]]) -> List[Optional[Tuple[float, float]]]:
+        """Look up many (city, state) pairs with one vectorized binary search."""
+        if not pairs or not len(self._keys):
+            return [None] * len(pairs)
+        keys = np.array([gazetteer_key(city, state) for city, state in pairs], dtype=f'S{KEY_WIDTH + 1}')
+        positions = np.minimum(np.searchsorted(self._keys, keys), len(self._keys) - 1)
+        found = self._keys[positions] == keys
+        lats, lons = self._table['lat'][positions], self._table['lon'][positions]
+        return [
+            (float(lat), float(lon)) if hit else None
+            for hit, lat, lon in zip(found, lats, lons)
+        ]
+
+
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_loaded = False
+_gazetteer_lock = threading.Lock()
+
+
+def get_gazetteer() -> Optional[Gazetteer]:
+    """Return the built gazetteer, or None if the file is missing or unreadable."""
+    global _gazetteer, _gazetteer_loaded
+    if not _gazetteer_loaded:
+        with _gazetteer_lock:
+            if not _gazetteer_loaded:
+                try:
+                    _gazetteer = Gazetteer() if os.path.exists(get_gazetteer_path()) else None
+                except (OSError, ValueError) as e:
+                    print(f"⚠️  Offline gazetteer unavailable: {e}")
+                    _gazetteer = None
+                _gazetteer_loaded = True
+    return _gazetteer
+
+
+def read_census_places(path: str) -> Iterator[Tuple[str, str, float, float]]:
+    """
+    Read a Census Bureau places gazetteer file (tab-separated).
+
+    Args:
+        path (str): e.g. 2020_Gaz_place_national.txt
+
+    Yields:
+        tuple: (city, state, latitude, longitude)
+    """
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f, delimiter='\t')
+        reader.fieldnames = [name.strip() for name in reader.fieldnames]
+        for row in reader:
+            state = row['USPS'].strip()
+            if state not in STATE_ABBREVIATIONS:
+                continue
+            city = _PLACE_SUFFIX.sub('', row['NAME'].strip())
+            yield city, state, float(row['INTPTLAT']), float(row['INTPTLONG'])
+
+
+def _cached_entries() -> Iterator[Tuple[str, str, float, float]]:
+    for state, cities in load_coordinates().items():
+        for city, coords in cities.items():
+            yield city, state, coords['latitude'], coords['longitude']
+
+
+def main(argv=None) -> None:
+    """Build the gazetteer from the coordinate cache and optional Census place files."""
+    parser = argparse.ArgumentParser(description="Build the offline city gazetteer")
+    parser.add_argument('--census', nargs='*', default=[], help="Census places gazetteer file(s)")
+    parser.add_argument('--output', help="Output file (default: data/gazetteer.bin)")
+    args = parser.parse_args(argv)
+
+    def entries():
+        # Cached coordinates come first so they win over Census centroids
+        yield from _cached_entries()
+        for census_path in args.census:
+            yield from read_census_places(census_path)
+
+    count = build_gazetteer(entries(), args.output)
+    print(f"📚 Wrote {count} cities to {args.output or get_gazetteer_path()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,17 +2,29 @@
 Geocoding utilities for city coordinate lookup.
 
 This module provides enhanced geocoding functionality with retry logic,
-timeout handling, and simple JSON-based coordinate storage.
+timeout handling, and simple JSON-based coordinate storage. API requests go
+through the shared rate-limited engine in ``geography.engine``.
 """
 
-import time
-from typing import Optional, Tuple
-from .simple_cache import get_city_coordinates_from_json, store_city_coordinates_to_json, get_coordinates_stats, clear_coordinates
+from typing import Dict, Iterable, Optional, Tuple
 
+import numpy as np
 
+from cfb_dynasty.utils.instrumentation import instrument
+from .engine import GeocodingEngine, get_geocoding_engine
+from .gazetteer import get_gazetteer
+from .negative_cache import get_negative_cache
+from .simple_cache import (
+    city_key, clear_coordinates, get_city_coordinates_from_json, get_coordinate_index,
+    get_coordinates_stats, normalize_state_name, store_city_coordinates_to_json
+)
+
+
+@instrument('get_city_coordinates', count_rows=lambda args, kwargs, result: 1)
 def get_city_coordinates(city: str, state: str, cache_legacy=None, timeout: int = 10, max_retries: int = 2) -> Optional[Tuple[float, float]]:
     """
-    Get coordinates for a city using JSON file lookup first, then geopy if needed.
+    Get coordinates for a city from saved coordinates, the offline gazetteer or
+    a close spelling of a saved city, then geopy if needed.
 
     Args:
         city (str): City name
@@ -30,54 +42,126 @@ def get_city_coordinates(city: str, state: str, cache_legacy=None, timeout: int
         print(f"📦 Using saved coordinates for {city}, {state}")
         return cached_coords
 
-    # If not in JSON file, make API call to geopy
+    # Then the bundled offline gazetteer
+    gazetteer = get_gazetteer()
+    coords = gazetteer.lookup(city, state) if gazetteer is not None else None
+    if coords is not None:
+        print(f"📚 Using gazetteer coordinates for {city}, {state}")
+        return coords
+
+    # Then a near-miss spelling of a saved city
+    matched = get_coordinate_index().match(city, state)
+    if matched is not None:
+        print(f"🔎 Using saved coordinates for {matched[0]}, {state} (matched {city}, {matched[1]:.0%})")
+        return get_city_coordinates_from_json(matched[0], state)
+
+    # Skip cities that recently failed
+    negative_cache = get_negative_cache()
+    failure = negative_cache.lookup(city, state)
+    if failure is not None:
+        print(f"🚫 Skipping {city}, {state}: lookup failed recently ({failure['reason']})")
+        return None
+
+    # If not found offline, geocode through the shared rate-limited engine
     print(f"🌐 Geocoding {city}, {state} via API...")
+    result = get_geocoding_engine().resolve(city, state, timeout, max_retries)
+    if result.coords is None:
+        negative_cache.record(city, state, result.reason, result.detail)
+        return None
+
+    # Store in JSON file for future use
+    store_city_coordinates_to_json(city, state, result.coords[0], result.coords[1])
+    return result.coords
+
+
+@instrument('geocode_many', count_rows=lambda args, kwargs, result: len(result[0]))
+def geocode_many(pairs: Iterable[Tuple[str, str]], offline: bool = False, timeout: int = 10,
+                 max_retries: int = 2, engine: Optional[GeocodingEngine] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get coordinates for many (city, state) pairs at once.
 
-    for attempt in range(max_retries + 1):
-        try:
-            from geopy.geocoders import Nominatim
-
-            # Exponential backoff for retries
-            if attempt > 0:
-                delay = 0.5 * (2 ** attempt)  # 0.5s, 1s, 2s delays
-                time.sleep(delay)
-                print(f"🔄 Retry {attempt} for {city}, {state}")
-            else:
-                time.sleep(0.1)  # Base rate limiting
-
-            # Configure explicit timeout
-            geolocator = Nominatim(
-                user_agent="cfb_dynasty_analysis",
-                timeout=timeout
-            )
-            location = geolocator.geocode(f"{city}, {state}, USA")
-
-            if location:
-                coords = (location.latitude, location.longitude)
-
-                # Store in JSON file for future use
-                store_city_coordinates_to_json(city, state, coords[0], coords[1])
-
-                if attempt > 0:
-                    print(f"✅ Successfully geocoded {city}, {state} on retry {attempt}")
-                return coords
-            else:
-                print(f"⚠️  Could not find coordinates for {city}, {state}")
-                return None
-
-        except Exception as e:
-            error_msg = str(e).lower()
-            if ("timed out" in error_msg or "timeout" in error_msg) and attempt < max_retries:
-                print(f"⏱️ Timeout for {city}, {state} - retrying in {0.5 * (2 ** (attempt + 1))}s...")
+    Pairs are normalized and deduplicated, cache hits are resolved from the
+    coordinate index, the offline gazetteer and then near-miss spellings of
+    saved cities, cities that failed recently are skipped (see
+    ``geography.negative_cache``), only the remaining cities are geocoded,
+    and every new coordinate is saved in a single write. Misses are geocoded
+    concurrently under the engine's rate limit.
+
+    Args:
+        pairs (iterable): (city, state) pairs; missing or blank values are skipped
+        offline (bool): Only use saved coordinates and the gazetteer, never call the API
+        timeout (int): Timeout in seconds for geocoding requests
+        max_retries (int): Maximum number of retry attempts per city
+        engine (GeocodingEngine): Engine for misses (default: the shared engine)
+
+    Returns:
+        tuple: (latitudes, longitudes) float arrays aligned to the input, NaN
+        where a city could not be resolved
+    """
+    pairs = list(pairs)
+    index = get_coordinate_index()
+
+    # Map every input row to a unique normalized key
+    unique: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    row_keys = []
+    for city, state in pairs:
+        if not isinstance(city, str) or not isinstance(state, str) or not city.strip() or not state.strip():
+            row_keys.append(None)
+            continue
+        key = (normalize_state_name(state), city_key(city))
+        unique.setdefault(key, (city.strip(), state.strip()))
+        row_keys.append(key)
+
+    resolved = {key: index.get(city, state) for key, (city, state) in unique.items()}
+    misses = [key for key, coords in resolved.items() if coords is None]
+    print(f"📦 {len(unique) - len(misses)} of {len(unique)} unique cities found in saved coordinates")
+
+    gazetteer = get_gazetteer()
+    if misses and gazetteer is not None:
+        for key, coords in zip(misses, gazetteer.lookup_many([unique[key] for key in misses])):
+            resolved[key] = coords
+        found = sum(resolved[key] is not None for key in misses)
+        misses = [key for key in misses if resolved[key] is None]
+        if found:
+            print(f"📚 {found} more found in the offline gazetteer")
+
+    fuzzy_found = 0
+    for key in misses:
+        resolved[key] = index.get_fuzzy(*unique[key])
+        fuzzy_found += resolved[key] is not None
+    misses = [key for key in misses if resolved[key] is None]
+    if fuzzy_found:
+        print(f"🔎 {fuzzy_found} more matched to saved cities by similar spelling")
+
+    negative_cache = get_negative_cache()
+    known_bad = {key for key in misses if negative_cache.lookup(*unique[key]) is not None}
+    if known_bad:
+        print(f"🚫 Skipping {len(known_bad)} cities that failed recently")
+        misses = [key for key in misses if key not in known_bad]
+
+    if misses and not offline:
+        print(f"🌐 Geocoding {len(misses)} cities via API...")
+        engine = engine or get_geocoding_engine()
+        results = engine.resolve_all([unique[key] for key in misses], timeout, max_retries)
+        new_entries = []
+        for key, result in zip(misses, results):
+            city, state = unique[key]
+            if result.coords is None:
+                negative_cache.record(city, state, result.reason, result.detail)
                 continue
-            elif attempt == max_retries:
-                print(f"⚠️  Failed to geocode {city}, {state} after {max_retries + 1} attempts: {e}")
-                break
-            else:
-                print(f"⚠️  Could not geocode {city}, {state}: {e}")
-                break
-
-    return None
+            resolved[key] = result.coords
+            new_entries.append((city, state, result.coords[0], result.coords[1]))
+        negative_cache.flush()
+        if new_entries and index.put_many(new_entries):
+            print(f"💾 Saved coordinates for {len(new_entries)} new cities")
+
+    latitudes = np.full(len(pairs), np.nan)
+    longitudes = np.full(len(pairs), np.nan)
+    for row, key in enumerate(row_keys):
+        coords = resolved.get(key) if key is not None else None
+        if coords is not None:
+            latitudes[row], longitudes[row] = coords
+    return latitudes, longitudes
 
 
 def clear_coordinate_cache() -> bool:
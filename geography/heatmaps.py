@@ -5,10 +5,11 @@ This module provides functions to create interactive geographic visualizations
 including state heatmaps and city-level analysis.
 """
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from .geocoding import get_city_coordinates
+from .geocoding import geocode_many
 
 
 def create_geographic_heatmap(df):
@@ -59,24 +60,20 @@ def create_geographic_heatmap(df):
 
         # Add city pins using automatic geocoding with enhanced timeout handling
         if df['CITY'].notna().sum() > 0:
-            city_state_counts = df.groupby(['CITY', 'STATE']).size().reset_index(name='player_count')
+            city_state_counts = df.groupby(['CITY', 'STATE'], observed=True).size().reset_index(name='player_count')
 
-            # Get coordinates for all cities automatically
-            city_lats, city_lons, city_names, city_counts, city_texts = [], [], [], [], []
+            # Resolve every city in one batched lookup
             print(f"🗺️ Geocoding {len(city_state_counts)} cities...")
+            lats, lons = geocode_many(zip(city_state_counts['CITY'], city_state_counts['STATE']))
+            found = ~np.isnan(lats)
+            located = city_state_counts[found]
 
-            for _, row in city_state_counts.iterrows():
-                city_name = row['CITY']
-                state_name = row['STATE']
-                coords = get_city_coordinates(city_name, state_name)
-
-                if coords:
-                    lat, lon = coords
-                    city_lats.append(lat)
-                    city_lons.append(lon)
-                    city_names.append(f"{city_name}, {state_name}")
-                    city_counts.append(row['player_count'])
-                    city_texts.append(f"{city_name}, {state_name}<br>{row['player_count']} player(s)")
+            city_lats, city_lons = lats[found].tolist(), lons[found].tolist()
+            city_counts = located['player_count'].tolist()
+            city_texts = [
+                f"{city}, {state}<br>{count} player(s)"
+                for city, state, count in zip(located['CITY'], located['STATE'], city_counts)
+            ]
 
             # Add city pins to the map
             if city_lats:
@@ -132,7 +129,7 @@ def create_city_bar_chart(df):
     """
     try:
         if df['CITY'].notna().sum() > 0:
-            city_state_counts = df.groupby(['CITY', 'STATE']).size().reset_index(name='player_count')
+            city_state_counts = df.groupby(['CITY', 'STATE'], observed=True).size().reset_index(name='player_count')
             city_state_counts = city_state_counts.sort_values('player_count', ascending=False).head(20)
 
             fig2 = px.bar(
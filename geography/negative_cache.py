@@ -0,0 +1,153 @@
+"""
+Negative cache for cities that could not be geocoded.
+
+Failed lookups are remembered in ``data/unresolved_cities.json`` with the
+reason and time of the failure, so later runs skip known-bad hometowns
+instead of repeating the same requests and retries. Entries expire after a
+per-reason TTL: cities the provider could not find are retried after
+``NOT_FOUND_TTL``, transient errors (timeouts, rate limits) after the much
+shorter ``ERROR_TTL`` so an outage does not blacklist a roster's hometowns.
+Changes are written in batches (every ``flush_every`` records, on
+``flush()``, and at interpreter exit).
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from cfb_dynasty.utils.export_writer import write_json_atomic
+from .simple_cache import city_key, get_coordinates_file_path, normalize_state_name
+
+NOT_FOUND = 'not_found'
+ERROR = 'error'
+
+NOT_FOUND_TTL = 30 * 24 * 3600
+ERROR_TTL = 15 * 60
+
+# Recorded failures buffered before the cache writes itself back to disk
+DEFAULT_FLUSH_EVERY = 25
+
+
+def get_negative_cache_path() -> str:
+    """Get the path to the unresolved cities file."""
+    return os.path.join(os.path.dirname(get_coordinates_file_path()), 'unresolved_cities.json')
+
+
+class NegativeCache:
+    """Persistent record of failed lookups with a TTL per failure reason."""
+
+    def __init__(self, file_path: Optional[str] = None, ttl: Optional[Dict[str, float]] = None,
+                 clock: Callable[[], float] = time.time, flush_every: int = DEFAULT_FLUSH_EVERY):
+        """
+        Args:
+            file_path (str): JSON file (default: data/unresolved_cities.json)
+            ttl (dict): Failure reason -> seconds before the city is retried
+            clock (callable): Returns the current Unix time
+            flush_every (int): Write to disk after this many unsaved changes
+        """
+        self.file_path = file_path or get_negative_cache_path()
+        self.ttl = {NOT_FOUND: NOT_FOUND_TTL, ERROR: ERROR_TTL, **(ttl or {})}
+        self.clock = clock
+        self.flush_every = max(1, flush_every)
+        self._lock = threading.RLock()
+        self._unsaved = 0
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                self._entries: Dict[str, dict] = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    @staticmethod
+    def _key(city: str, state: str) -> str:
+        return f"{normalize_state_name(state)}|{city_key(city)}"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def lookup(self, city: str, state: str) -> Optional[dict]:
+        """
+        Return the failure entry for a city if it has not expired.
+
+        Returns:
+            dict or None: ``reason``, ``detail``, ``failed`` (Unix time) and ``attempts``
+        """
+        key = self._key(city, state)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.clock() - entry['failed'] >= self.ttl.get(entry['reason'], ERROR_TTL):
+                return None
+            return dict(entry)
+
+    def record(self, city: str, state: str, reason: str, detail: str = '') -> None:
+        """Remember a failed lookup; the file is written once ``flush_every`` changes are unsaved."""
+        key = self._key(city, state)
+        with self._lock:
+            previous = self._entries.get(key, {})
+            self._entries[key] = {
+                'city': city,
+                'state': state,
+                'reason': reason,
+                'detail': detail,
+                'failed': self.clock(),
+                'attempts': previous.get('attempts', 0) + 1,
+            }
+            self._unsaved += 1
+            if self._unsaved >= self.flush_every:
+                self.flush()
+
+    def forget(self, city: str, state: str) -> None:
+        """Drop a city so its next lookup tries the provider again."""
+        with self._lock:
+            if self._entries.pop(self._key(city, state), None) is not None:
+                self._unsaved += 1
+
+    def clear(self) -> None:
+        """Drop every entry so all cities are tried again (written on the next ``flush``)."""
+        with self._lock:
+            self._entries = {}
+            self._unsaved += 1
+
+    def flush(self) -> bool:
+        """
+        Write the cache to disk if it changed, dropping expired entries.
+
+        Returns:
+            bool: True if successful (or nothing changed), False otherwise
+        """
+        with self._lock:
+            if not self._unsaved:
+                return True
+            now = self.clock()
+            self._entries = {
+                key: entry for key, entry in self._entries.items()
+                if now - entry['failed'] < self.ttl.get(entry['reason'], ERROR_TTL)
+            }
+            try:
+                os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+                write_json_atomic(self.file_path, self._entries, ensure_ascii=False)
+            except IOError as e:
+                print(f"❌ Error saving unresolved cities file: {e}")
+                return False
+            self._unsaved = 0
+            return True
+
+
+_negative_cache: Optional[NegativeCache] = None
+_negative_cache_lock = threading.Lock()
+
+
+def get_negative_cache() -> NegativeCache:
+    """Return the process-wide negative cache, loading it on first use."""
+    global _negative_cache
+    if _negative_cache is None:
+        with _negative_cache_lock:
+            if _negative_cache is None:
+                _negative_cache = NegativeCache()
+                atexit.register(_negative_cache.flush)
+    return _negative_cache
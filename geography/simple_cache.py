@@ -1,13 +1,27 @@
 """
 Simple JSON-based coordinate lookup for CFB Dynasty geography module.
 
-This module provides direct JSON file lookup for city coordinates,
-eliminating the need for in-memory caching.
+This module keeps the coordinates in ``data/city_coordinates.json`` in a
+process-wide index that is loaded once and keyed by normalized state and
+canonical city name (see ``city_key``), so lookups are a single dict access
+and spelling variants share an entry. Near misses can be resolved with a
+per-state trigram index (``CoordinateIndex.match``). New coordinates are buffered and written
+back in batches (every ``flush_every`` new cities, on ``flush()``, and at
+interpreter exit) instead of rewriting the file for every city.
 """
 
+import atexit
 import json
 import os
-from typing import Dict, Optional, Tuple
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+from cfb_dynasty.config.constants import STATE_ABBREVIATIONS
+from cfb_dynasty.utils.export_writer import write_json_atomic
+
+# Buffered new cities before the index writes itself back to disk
+DEFAULT_FLUSH_EVERY = 25
 
 
 def get_coordinates_file_path() -> str:
@@ -18,24 +32,290 @@ def get_coordinates_file_path() -> str:
     return os.path.join(data_dir, 'city_coordinates.json')
 
 
-def load_coordinates() -> Dict:
-    """
-    Load coordinates from JSON file.
-
-    Returns:
-        dict: Coordinates dictionary or empty dict if file doesn't exist
-    """
-    file_path = get_coordinates_file_path()
-
+def _read_coordinates_file(file_path: str) -> Dict:
     if os.path.exists(file_path):
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except (json.JSONDecodeError, IOError) as e:
             print(f"⚠️  Error loading coordinates file: {e}")
-            return {}
-    else:
-        return {}
+    return {}
+
+
+def _write_coordinates_file(file_path: str, coordinates: Dict) -> None:
+    """Write the coordinates file atomically (temp file, then rename)."""
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    write_json_atomic(file_path, coordinates, ensure_ascii=False)
+
+
+# Abbreviations expanded anywhere in a city name ("PORT ST LUCIE", "FT. WORTH")
+CITY_ABBREVIATIONS = {'ST': 'SAINT', 'STE': 'SAINTE', 'FT': 'FORT', 'MT': 'MOUNT', 'PT': 'POINT'}
+
+# Compass abbreviations, only expanded as the first word ("N LITTLE ROCK")
+LEADING_DIRECTIONS = {'N': 'NORTH', 'S': 'SOUTH', 'E': 'EAST', 'W': 'WEST'}
+
+# Minimum trigram similarity for a fuzzy match to count as the same city
+DEFAULT_FUZZY_THRESHOLD = 0.75
+
+_PUNCTUATION = re.compile(r"[.'`’]")
+_SEPARATORS = re.compile(r"[-,/]+")
+
+
+@lru_cache(maxsize=8192)
+def city_key(city: str) -> str:
+    """
+    Canonicalize a city name for index lookups.
+
+    Upper-cases, drops periods and apostrophes, treats hyphens as spaces,
+    collapses whitespace and expands common abbreviations, so "St. Louis",
+    "SAINT LOUIS" and " saint  louis" share one key.
+    """
+    city = _SEPARATORS.sub(' ', _PUNCTUATION.sub('', city.upper()))
+    words = city.split()
+    if len(words) > 1 and words[0] in LEADING_DIRECTIONS:
+        words[0] = LEADING_DIRECTIONS[words[0]]
+    return ' '.join(CITY_ABBREVIATIONS.get(word, word) for word in words)
+
+
+def trigrams(key: str) -> frozenset:
+    """Return the padded character trigrams of a canonical city key."""
+    padded = f"  {key} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def differs_by_whole_words(key: str, other: str) -> bool:
+    """
+    Return True when one canonical key is the other plus extra words.
+
+    "NORTH RICHLAND HILLS" and "RICHLAND HILLS" score high on trigrams but
+    are different towns; spelling variants never add or drop a whole word.
+    """
+    words, other_words = set(key.split()), set(other.split())
+    return words != other_words and (words <= other_words or other_words <= words)
+
+
+class CoordinateIndex:
+    """
+    In-memory index over a coordinates JSON file.
+
+    The file keeps its ``{state: {city: {latitude, longitude}}}`` layout; the
+    index adds an O(1) lookup keyed by (normalized state, canonical city) and,
+    per state, a trigram index over city keys for near-miss lookups.
+    """
+
+    def __init__(self, file_path: Optional[str] = None, flush_every: int = DEFAULT_FLUSH_EVERY):
+        """
+        Args:
+            file_path (str): Coordinates JSON file (default: data/city_coordinates.json)
+            flush_every (int): Write to disk after this many new cities
+        """
+        self.file_path = file_path or get_coordinates_file_path()
+        self.flush_every = max(1, flush_every)
+        self._lock = threading.RLock()
+        self._data: Dict[str, Dict[str, dict]] = {}
+        self._index: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._names: Dict[Tuple[str, str], str] = {}
+        self._trigrams: Optional[Dict[str, Dict[str, set]]] = None
+        self._pending: Dict[Tuple[str, str], Tuple[str, str, float, float]] = {}
+        self.reload()
+
+    def reload(self) -> None:
+        """Re-read the file, dropping anything not yet flushed."""
+        with self._lock:
+            self._data = _read_coordinates_file(self.file_path)
+            self._pending = {}
+            self._index = {}
+            self._names = {}
+            self._trigrams = None
+            for state, cities in self._data.items():
+                state_key = normalize_state_name(state)
+                for city, coords in cities.items():
+                    key = (state_key, city_key(city))
+                    self._index[key] = (coords['latitude'], coords['longitude'])
+                    self._names.setdefault(key, city)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def pending(self) -> int:
+        """Number of new cities not yet written to disk."""
+        return len(self._pending)
+
+    def get(self, city: str, state: str) -> Optional[Tuple[float, float]]:
+        """Return (latitude, longitude) for a city, or None if it is not indexed."""
+        return self._index.get((normalize_state_name(state), city_key(city)))
+
+    def _trigram_index(self) -> Dict[str, Dict[str, set]]:
+        """State -> trigram -> city keys, built on first fuzzy lookup."""
+        if self._trigrams is None:
+            self._trigrams = {}
+            for state_key, key in self._index:
+                self._index_trigrams(state_key, key)
+        return self._trigrams
+
+    def _index_trigrams(self, state_key: str, key: str) -> None:
+        postings = self._trigrams.setdefault(state_key, {})
+        for gram in trigrams(key):
+            postings.setdefault(gram, set()).add(key)
+
+    def match(self, city: str, state: str,
+              threshold: float = DEFAULT_FUZZY_THRESHOLD) -> Optional[Tuple[str, float]]:
+        """
+        Find the closest indexed city in the same state by trigram similarity.
+
+        Only spelling variants match: a candidate that adds or drops whole
+        words ("NEW BRAUNFELS" vs "BRAUNFELS") is a different city.
+
+        Args:
+            city (str): City name
+            state (str): State name or abbreviation
+            threshold (float): Minimum similarity (0-1) to accept a match
+
+        Returns:
+            tuple: (stored city name, similarity), or None if nothing is close enough
+        """
+        state_key = normalize_state_name(state)
+        key = city_key(city)
+        if (state_key, key) in self._index:
+            return self._names[(state_key, key)], 1.0
+
+        with self._lock:
+            postings = self._trigram_index().get(state_key, {})
+            grams = trigrams(key)
+            shared: Dict[str, int] = {}
+            for gram in grams:
+                for candidate in postings.get(gram, ()):
+                    shared[candidate] = shared.get(candidate, 0) + 1
+
+        # Dice coefficient over trigram sets
+        best, best_score = None, 0.0
+        for candidate, count in shared.items():
+            if differs_by_whole_words(key, candidate):
+                continue
+            score = 2 * count / (len(grams) + len(trigrams(candidate)))
+            if score > best_score or (score == best_score and best is not None and candidate < best):
+                best, best_score = candidate, score
+        if best is None or best_score < threshold:
+            return None
+        return self._names[(state_key, best)], best_score
+
+    def get_fuzzy(self, city: str, state: str,
+                  threshold: float = DEFAULT_FUZZY_THRESHOLD) -> Optional[Tuple[float, float]]:
+        """Return coordinates for the closest indexed city (see ``match``), or None."""
+        matched = self.match(city, state, threshold)
+        return self.get(matched[0], state) if matched else None
+
+    def _add(self, city: str, state: str, latitude: float, longitude: float) -> None:
+        state_key = normalize_state_name(state)
+        key = (state_key, city_key(city))
+        # Store under the name already on file so spelling variants don't duplicate a city
+        city = self._names.setdefault(key, city)
+        self._data.setdefault(state_key, {})[city] = {'latitude': latitude, 'longitude': longitude}
+        if key not in self._index and self._trigrams is not None:
+            self._index_trigrams(state_key, key[1])
+        self._index[key] = (latitude, longitude)
+        self._pending[key] = (state_key, city, latitude, longitude)
+
+    def put(self, city: str, state: str, latitude: float, longitude: float) -> None:
+        """Add or update a city; the file is written once ``flush_every`` cities are pending."""
+        with self._lock:
+            self._add(city, state, latitude, longitude)
+            if len(self._pending) >= self.flush_every:
+                self.flush()
+
+    def put_many(self, entries: Iterable[Tuple[str, str, float, float]]) -> bool:
+        """
+        Add several cities and write them to disk in a single flush.
+
+        Args:
+            entries (iterable): (city, state, latitude, longitude) tuples
+
+        Returns:
+            bool: True if the write succeeded
+        """
+        with self._lock:
+            for city, state, latitude, longitude in entries:
+                self._add(city, state, latitude, longitude)
+            return self.flush()
+
+    def flush(self) -> bool:
+        """
+        Write pending cities to disk in one atomic write.
+
+        Pending entries are merged into the current file contents, so cities
+        saved by another process since this index loaded are kept.
+
+        Returns:
+            bool: True if successful (or nothing was pending), False otherwise
+        """
+        with self._lock:
+            if not self._pending:
+                return True
+            coordinates = _read_coordinates_file(self.file_path)
+            for state_key, city, latitude, longitude in self._pending.values():
+                coordinates.setdefault(state_key, {})[city] = {'latitude': latitude, 'longitude': longitude}
+            try:
+                _write_coordinates_file(self.file_path, coordinates)
+            except IOError as e:
+                print(f"❌ Error saving coordinates file: {e}")
+                return False
+            self._pending = {}
+            return True
+
+    def replace(self, coordinates: Dict) -> bool:
+        """Replace the file and the index with a full coordinates dictionary."""
+        with self._lock:
+            try:
+                _write_coordinates_file(self.file_path, coordinates)
+            except IOError as e:
+                print(f"❌ Error saving coordinates file: {e}")
+                return False
+            self.reload()
+            return True
+
+    def to_dict(self) -> Dict:
+        """Return a copy of the coordinates, including pending cities."""
+        with self._lock:
+            return {state: dict(cities) for state, cities in self._data.items()}
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of states and cities indexed, including pending cities."""
+        with self._lock:
+            return {
+                'total_states': len(self._data),
+                'total_cities': sum(len(cities) for cities in self._data.values()),
+            }
+
+
+_index: Optional[CoordinateIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_coordinate_index() -> CoordinateIndex:
+    """Return the process-wide coordinate index, loading it on first use."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = CoordinateIndex()
+                atexit.register(_index.flush)
+    return _index
+
+
+def flush_coordinates() -> bool:
+    """Write any buffered coordinates to disk now."""
+    return _index.flush() if _index is not None else True
+
+
+def load_coordinates() -> Dict:
+    """
+    Load coordinates, including cities not yet written to disk.
+
+    Returns:
+        dict: Coordinates dictionary or empty dict if file doesn't exist
+    """
+    return get_coordinate_index().to_dict()
 
 
 def save_coordinates(coordinates: Dict) -> bool:
@@ -48,21 +328,12 @@ def save_coordinates(coordinates: Dict) -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
-    file_path = get_coordinates_file_path()
-
-    try:
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(coordinates, f, indent=2, ensure_ascii=False)
-        return True
-    except IOError as e:
-        print(f"❌ Error saving coordinates file: {e}")
-        return False
+    return get_coordinate_index().replace(coordinates)
 
 
 def get_city_coordinates_from_json(city: str, state: str) -> Optional[Tuple[float, float]]:
     """
-    Get coordinates for a city from JSON file.
+    Get coordinates for a city from the coordinate index.
 
     Args:
         city (str): City name
@@ -71,19 +342,15 @@ def get_city_coordinates_from_json(city: str, state: str) -> Optional[Tuple[floa
     Returns:
         tuple: (latitude, longitude) if found, None if not found
     """
-    coordinates = load_coordinates()
-    state_key = normalize_state_name(state)
-
-    if state_key in coordinates and city in coordinates[state_key]:
-        coords = coordinates[state_key][city]
-        return (coords['latitude'], coords['longitude'])
-
-    return None
+    return get_coordinate_index().get(city, state)
 
 
 def store_city_coordinates_to_json(city: str, state: str, latitude: float, longitude: float) -> bool:
     """
-    Store coordinates for a city in JSON file.
+    Store coordinates for a city in the coordinate index.
+
+    The city is available to lookups immediately; the JSON file is written in
+    batches (see ``CoordinateIndex.flush``).
 
     Args:
         city (str): City name
@@ -94,27 +361,12 @@ def store_city_coordinates_to_json(city: str, state: str, latitude: float, longi
     Returns:
         bool: True if successfully stored, False otherwise
     """
-    coordinates = load_coordinates()
-    state_key = normalize_state_name(state)
-
-    # Initialize state if not exists
-    if state_key not in coordinates:
-        coordinates[state_key] = {}
-
-    # Store coordinates
-    coordinates[state_key][city] = {
-        'latitude': latitude,
-        'longitude': longitude
-    }
-
-    # Save to file
-    success = save_coordinates(coordinates)
-    if success:
-        print(f"💾 Saved coordinates for {city}, {state}")
-
-    return success
+    get_coordinate_index().put(city, state, latitude, longitude)
+    print(f"💾 Saved coordinates for {city}, {state}")
+    return True
 
 
+@lru_cache(maxsize=1024)
 def normalize_state_name(state: str) -> str:
     """
     Normalize state name/abbreviation to full state name.
@@ -125,25 +377,10 @@ def normalize_state_name(state: str) -> str:
     Returns:
         str: Normalized state name
     """
-    state_mapping = {
-        'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas',
-        'CA': 'California', 'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware',
-        'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho',
-        'IL': 'Illinois', 'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas',
-        'KY': 'Kentucky', 'LA': 'Louisiana', 'ME': 'Maine', 'MD': 'Maryland',
-        'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota', 'MS': 'Mississippi',
-        'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
-        'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
-        'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma',
-        'OR': 'Oregon', 'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina',
-        'SD': 'South Dakota', 'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah',
-        'VT': 'Vermont', 'VA': 'Virginia', 'WA': 'Washington', 'WV': 'West Virginia',
-        'WI': 'Wisconsin', 'WY': 'Wyoming', 'DC': 'District of Columbia'
-    }
-
+    state = state.strip()
     state_upper = state.upper()
-    if state_upper in state_mapping:
-        return state_mapping[state_upper]
+    if state_upper in STATE_ABBREVIATIONS:
+        return STATE_ABBREVIATIONS[state_upper]
     else:
         return state.title()
 
@@ -155,14 +392,11 @@ def get_coordinates_stats() -> Dict[str, int]:
     Returns:
         dict: Statistics including total cities and states
     """
-    coordinates = load_coordinates()
-    total_cities = sum(len(cities) for cities in coordinates.values())
-    total_states = len(coordinates)
-
+    index = get_coordinate_index()
     return {
-        'total_states': total_states,
-        'total_cities': total_cities,
-        'file_path': get_coordinates_file_path()
+        **index.stats(),
+        'pending_writes': index.pending,
+        'file_path': index.file_path
     }
 
 
@@ -0,0 +1,330 @@
+"""
+Spatial index for radius, nearest-city and bounding-box queries.
+
+Points are bucketed into a latitude/longitude grid and stored sorted by cell,
+so a query only gathers the contiguous runs of points in the cells it can
+reach and then measures exact distances for those candidates with NumPy.
+The ``*_many`` queries gather and measure the candidates of a whole batch of
+locations at once.
+Distances are great-circle miles, computed from the chord between points as
+unit vectors in Earth-centered (ECEF) coordinates.
+"""
+
+import math
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+EARTH_RADIUS_MILES = 3958.8
+MILES_PER_DEGREE_LAT = math.pi * EARTH_RADIUS_MILES / 180
+HALF_CIRCUMFERENCE_MILES = math.pi * EARTH_RADIUS_MILES
+
+DEFAULT_CELL_DEGREES = 1.0
+
+# Query locations searched together by the *_many queries
+QUERY_BATCH = 256
+
+# Memory budget for measuring leftover nearest_many queries against every point
+BRUTE_FORCE_BYTES = 32 * 1024 * 1024
+
+
+def to_unit_vectors(latitudes, longitudes) -> np.ndarray:
+    """Convert latitudes/longitudes in degrees to (n, 3) ECEF unit vectors."""
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def chord_to_miles(chord) -> np.ndarray:
+    """Convert chord length between unit vectors to great-circle miles."""
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.clip(np.asarray(chord) / 2, 0.0, 1.0))
+
+
+class SpatialIndex:
+    """Grid index over points given as latitude/longitude arrays."""
+
+    def __init__(self, latitudes, longitudes, labels: Optional[Sequence] = None,
+                 cell_degrees: float = DEFAULT_CELL_DEGREES):
+        """
+        Args:
+            latitudes (array-like): Latitudes in degrees; NaN points are skipped
+            longitudes (array-like): Longitudes in degrees
+            labels (sequence): Optional label per point (e.g. "Allen, TX")
+            cell_degrees (float): Grid cell size in degrees
+        """
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        if latitudes.shape != longitudes.shape:
+            raise ValueError("Latitudes and longitudes must have the same length")
+
+        self.labels = np.asarray(labels, dtype=object) if labels is not None else None
+        self.cell_degrees = cell_degrees
+        self._lat_cells = int(math.ceil(180 / cell_degrees))
+        self._lon_cells = int(math.ceil(360 / cell_degrees))
+
+        valid = ~(np.isnan(latitudes) | np.isnan(longitudes))
+        cells = self._cell_ids(latitudes[valid], longitudes[valid])
+        order = np.argsort(cells, kind='stable')
+
+        # Points sorted by cell; _source maps back to positions in the input
+        self._cells = cells[order]
+        self._source = np.flatnonzero(valid)[order]
+        self._lat = latitudes[self._source]
+        self._lon = longitudes[self._source]
+        self._xyz = to_unit_vectors(self._lat, self._lon)
+
+    @classmethod
+    def from_coordinates(cls, coordinates: dict, cell_degrees: float = DEFAULT_CELL_DEGREES) -> 'SpatialIndex':
+        """
+        Build an index over a ``{state: {city: {latitude, longitude}}}`` dictionary,
+        labelled "City, State".
+        """
+        rows = [
+            (f"{city}, {state}", c['latitude'], c['longitude'])
+            for state, cities in coordinates.items()
+            for city, c in cities.items()
+        ]
+        labels, lats, lons = zip(*rows) if rows else ((), (), ())
+        return cls(lats, lons, labels, cell_degrees)
+
+    @classmethod
+    def from_hometowns(cls, df: pd.DataFrame, offline: bool = True,
+                       cell_degrees: float = DEFAULT_CELL_DEGREES) -> 'SpatialIndex':
+        """
+        Build an index over a roster or recruiting board's hometowns.
+
+        Query results are row positions in ``df``; rows whose hometown cannot be
+        resolved are left out.
+
+        Args:
+            df (pd.DataFrame): Frame with 'CITY' and 'STATE' columns
+            offline (bool): Resolve hometowns without API calls (see ``geocode_many``)
+            cell_degrees (float): Grid cell size in degrees
+        """
+        from .geocoding import geocode_many
+
+        latitudes, longitudes = geocode_many(zip(df['CITY'], df['STATE']), offline=offline)
+        labels = [f"{city}, {state}" for city, state in zip(df['CITY'], df['STATE'])]
+        return cls(latitudes, longitudes, labels, cell_degrees)
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    # Grid helpers
+
+    def _lat_bins(self, latitudes) -> np.ndarray:
+        bins = np.floor((np.asarray(latitudes) + 90) / self.cell_degrees).astype(np.int64)
+        return np.clip(bins, 0, self._lat_cells - 1)
+
+    def _lon_bins(self, longitudes) -> np.ndarray:
+        return np.floor((np.asarray(longitudes) + 180) / self.cell_degrees).astype(np.int64) % self._lon_cells
+
+    def _cell_ids(self, latitudes, longitudes) -> np.ndarray:
+        return self._lat_bins(latitudes) * self._lon_cells + self._lon_bins(longitudes)
+
+    def _cell_intervals(self, south, north, west, east, all_lons) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return (query, first cell, last cell) runs of cell ids covering each
+        query's latitude range and longitude range. A range whose west edge is
+        east of its east edge (in degrees) crosses the antimeridian;
+        ``all_lons`` marks queries covering every longitude.
+        """
+        first, last = self._lat_bins(south), self._lat_bins(north)
+        n_rows = last - first + 1
+        query = np.repeat(np.arange(len(first)), n_rows)
+        rows = np.repeat(first, n_rows) + np.arange(n_rows.sum()) - np.repeat(np.cumsum(n_rows) - n_rows, n_rows)
+
+        west_bin, east_bin = self._lon_bins(west)[query], self._lon_bins(east)[query]
+        all_lons = all_lons[query]
+        # Decide on the degrees: both edges can share a cell when the range
+        # wraps, and an east edge of +180 bins to the first cell
+        wraps = ~all_lons & ((west > east)[query] | (west_bin > east_bin))
+        lows = np.where(all_lons, 0, west_bin)
+        highs = np.where(all_lons | wraps, self._lon_cells - 1, east_bin)
+
+        base = rows * self._lon_cells
+        return (np.concatenate([query, query[wraps]]),
+                np.concatenate([base + lows, base[wraps]]),
+                np.concatenate([base + highs, (base + east_bin)[wraps]]))
+
+    def _expand(self, query: np.ndarray, lows: np.ndarray, highs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (query, sorted-array position) for every point in the cell runs."""
+        starts = np.searchsorted(self._cells, lows, side='left')
+        lengths = np.searchsorted(self._cells, highs, side='right') - starts
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return np.repeat(query, lengths), np.repeat(starts, lengths) + offsets
+
+    def _gather(self, lat_range: Tuple[float, float], lon_range: Optional[Tuple[float, float]]) -> np.ndarray:
+        """
+        Return sorted-array positions of every point in the grid cells covering
+        a latitude range and a longitude range (None for all longitudes).
+        Longitude ranges may cross the antimeridian (west > east).
+        """
+        west, east = lon_range if lon_range is not None else (-180.0, 180.0)
+        _, positions = self._expand(*self._cell_intervals(
+            np.array([lat_range[0]]), np.array([lat_range[1]]),
+            np.array([west], dtype=np.float64), np.array([east], dtype=np.float64),
+            np.array([lon_range is None])))
+        return np.sort(positions)
+
+    def _radius_candidates(self, latitudes: np.ndarray, longitudes: np.ndarray,
+                           miles: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (query, sorted-array position) for the points in cells each radius can reach."""
+        degrees = miles / MILES_PER_DEGREE_LAT
+        south, north = np.maximum(-90.0, latitudes - degrees), np.minimum(90.0, latitudes + degrees)
+        widest = np.maximum(np.abs(south), np.abs(north))
+        lon_degrees = degrees / np.cos(np.radians(np.minimum(widest, 89.9)))
+        all_lons = (widest >= 89.9) | (lon_degrees >= 180)
+        west = (longitudes - lon_degrees + 180) % 360 - 180
+        east = (longitudes + lon_degrees + 180) % 360 - 180
+        return self._expand(*self._cell_intervals(south, north, west, east, all_lons))
+
+    def _within_radius_batch(self, latitudes: np.ndarray, longitudes: np.ndarray,
+                             miles: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Measure every candidate of every query in one pass.
+
+        Returns:
+            tuple: (query, sorted-array position, miles) for the points within
+            ``miles``, ordered by query and then by distance
+        """
+        query, positions = self._radius_candidates(latitudes, longitudes, miles)
+        offsets = self._xyz[positions] - to_unit_vectors(latitudes, longitudes)[query]
+        distances = chord_to_miles(np.sqrt(np.einsum('ij,ij->i', offsets, offsets)))
+        inside = distances <= miles
+        query, positions, distances = query[inside], positions[inside], distances[inside]
+        order = np.lexsort((distances, query))
+        return query[order], positions[order], distances[order]
+
+    def _query_batches(self, latitudes, longitudes):
+        """Yield (query positions, latitudes, longitudes) for known locations, QUERY_BATCH at a time."""
+        latitudes = np.atleast_1d(np.asarray(latitudes, dtype=np.float64))
+        longitudes = np.atleast_1d(np.asarray(longitudes, dtype=np.float64))
+        known = np.flatnonzero(~(np.isnan(latitudes) | np.isnan(longitudes)))
+        for start in range(0, len(known), QUERY_BATCH):
+            batch = known[start:start + QUERY_BATCH]
+            yield batch, latitudes[batch], longitudes[batch]
+
+    # Queries
+
+    def within_radius(self, lat: float, lon: float, miles: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find every point within a distance of a location.
+
+        Args:
+            lat (float): Latitude in degrees
+            lon (float): Longitude in degrees
+            miles (float): Search radius in miles
+
+        Returns:
+            tuple: (input positions, distances in miles), nearest first
+        """
+        _, positions, distances = self._within_radius_batch(np.array([lat], dtype=np.float64),
+                                                            np.array([lon], dtype=np.float64), miles)
+        return self._source[positions], distances
+
+    def within_radius_many(self, latitudes, longitudes, miles: float) -> List[np.ndarray]:
+        """
+        Find the points within ``miles`` of each query location.
+
+        Candidates for a batch of queries are gathered and measured together,
+        so the work is a few NumPy passes per batch rather than per query.
+
+        Returns:
+            list: Input positions for each query, nearest first (empty for
+            queries without coordinates)
+        """
+        results = [np.empty(0, dtype=np.int64)] * len(np.atleast_1d(latitudes))
+        for batch, lats, lons in self._query_batches(latitudes, longitudes):
+            query, positions, _ = self._within_radius_batch(lats, lons, miles)
+            bounds = np.searchsorted(query, np.arange(len(batch) + 1))
+            found = self._source[positions]
+            for row, start, end in zip(batch, bounds[:-1], bounds[1:]):
+                results[row] = found[start:end]
+        return results
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the ``k`` points closest to a location.
+
+        The search radius doubles until it holds ``k`` points; every point
+        inside a radius is examined, so the result is exact.
+
+        Returns:
+            tuple: (input positions, distances in miles), nearest first
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        positions, distances = self.nearest_many([lat], [lon], k)
+        return positions[0], distances[0]
+
+    def nearest_many(self, latitudes, longitudes, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the ``k`` nearest points for each query location.
+
+        Each batch of queries searches the same doubling radius together;
+        queries with ``k`` points inside it are settled and the rest move on
+        to the next radius. Queries still short of ``k`` at half the Earth's
+        circumference are measured against every point.
+
+        Returns:
+            tuple: (positions, distances) arrays of shape (n_queries, k); rows
+            are padded with -1 / NaN when the index holds fewer than k points
+            and for queries without coordinates
+        """
+        n_queries = len(np.atleast_1d(latitudes))
+        positions = np.full((n_queries, k), -1, dtype=np.int64)
+        distances = np.full((n_queries, k), np.nan)
+        found = min(k, len(self))
+        if found <= 0:
+            return positions, distances
+
+        for batch, lats, lons in self._query_batches(latitudes, longitudes):
+            miles = self.cell_degrees * MILES_PER_DEGREE_LAT
+            while len(batch) and miles < HALF_CIRCUMFERENCE_MILES:
+                query, hits, hit_miles = self._within_radius_batch(lats, lons, miles)
+                counts = np.bincount(query, minlength=len(batch))
+                settled = counts >= found
+                take = (np.cumsum(counts) - counts)[settled, None] + np.arange(found)
+                positions[batch[settled], :found] = self._source[hits[take]]
+                distances[batch[settled], :found] = hit_miles[take]
+                batch, lats, lons = batch[~settled], lats[~settled], lons[~settled]
+                miles *= 2
+
+            # Rows sized so the (rows, points, 3) offsets stay within budget
+            rows = max(1, BRUTE_FORCE_BYTES // (len(self) * 3 * 8))
+            for start in range(0, len(batch), rows):
+                block = slice(start, start + rows)
+                offsets = self._xyz[None, :, :] - to_unit_vectors(lats[block], lons[block])[:, None, :]
+                all_miles = chord_to_miles(np.sqrt(np.einsum('qij,qij->qi', offsets, offsets)))
+                closest = np.argsort(all_miles, axis=1, kind='stable')[:, :found]
+                positions[batch[block], :found] = self._source[closest]
+                distances[batch[block], :found] = np.take_along_axis(all_miles, closest, axis=1)
+        return positions, distances
+
+    def bounding_box(self, south: float, north: float, west: float, east: float) -> np.ndarray:
+        """
+        Find points inside a latitude/longitude box.
+
+        ``west > east`` selects a box crossing the antimeridian.
+
+        Returns:
+            np.ndarray: Input positions, in index order
+        """
+        positions = self._gather((south, north), (west, east))
+        lat, lon = self._lat[positions], self._lon[positions]
+        inside = (lat >= south) & (lat <= north)
+        if west <= east:
+            inside &= (lon >= west) & (lon <= east)
+        else:
+            inside &= (lon >= west) | (lon <= east)
+        return self._source[positions[inside]]
+
+    def label(self, positions: Iterable[int]) -> List:
+        """Return the labels for input positions."""
+        if self.labels is None:
+            raise ValueError("This index has no labels")
+        return [self.labels[p] for p in positions]
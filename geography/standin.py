@@ -0,0 +1,134 @@
+"""
+Local stand-in for a Nominatim server.
+
+Serves ``/search`` in Nominatim's JSON format from a coordinates dictionary,
+with optional per-request latency, so the geocoding engine can be tested and
+benchmarked without network access or rate limits. Point a
+``NominatimBackend`` at it with ``domain=server.domain, scheme='http'``.
+
+Run ``python -m geography.standin`` to serve the bundled city coordinates.
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from .simple_cache import city_key, load_coordinates, normalize_state_name
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: 'StandInGeocoder'
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path.rstrip('/') != '/search':
+            self.send_error(404)
+            return
+
+        self.server.record_request()
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        query = parse_qs(parsed.query).get('q', [''])[0]
+        parts = [part.strip() for part in query.split(',')]
+        results = []
+        if len(parts) >= 2:
+            coords = self.server.lookup(parts[0], parts[1])
+            if coords is not None:
+                results.append({
+                    'lat': str(coords[0]),
+                    'lon': str(coords[1]),
+                    'display_name': f"{parts[0]}, {parts[1]}, United States",
+                })
+
+        body = json.dumps(results).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInGeocoder(ThreadingHTTPServer):
+    """Threaded HTTP server answering Nominatim ``/search`` queries from memory."""
+
+    daemon_threads = True
+
+    def __init__(self, coordinates: Optional[Dict] = None, latency: float = 0.0,
+                 host: str = '127.0.0.1', port: int = 0):
+        """
+        Args:
+            coordinates (dict): ``{state: {city: {latitude, longitude}}}``
+                (default: the bundled city coordinates)
+            latency (float): Seconds to wait before answering each request
+            host (str): Interface to bind
+            port (int): Port to bind (0 picks a free port)
+        """
+        super().__init__((host, port), _Handler)
+        coordinates = load_coordinates() if coordinates is None else coordinates
+        self.index = {
+            (normalize_state_name(state), city_key(city)): (c['latitude'], c['longitude'])
+            for state, cities in coordinates.items()
+            for city, c in cities.items()
+        }
+        self.latency = latency
+        self.request_times: List[float] = []
+        self._requests_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def domain(self) -> str:
+        """host:port to pass to ``NominatimBackend(domain=..., scheme='http')``."""
+        host, port = self.server_address[:2]
+        return f"{host}:{port}"
+
+    def lookup(self, city: str, state: str):
+        return self.index.get((normalize_state_name(state), city_key(city)))
+
+    def record_request(self) -> None:
+        with self._requests_lock:
+            self.request_times.append(time.monotonic())
+
+    def start(self) -> 'StandInGeocoder':
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name='standin-geocoder', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None) -> None:
+    """Serve the bundled coordinates until interrupted."""
+    parser = argparse.ArgumentParser(description="Local stand-in Nominatim server")
+    parser.add_argument('--port', type=int, default=8088)
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to each response")
+    args = parser.parse_args(argv)
+
+    server = StandInGeocoder(latency=args.latency, port=args.port)
+    print(f"🌐 Stand-in geocoder serving {len(server.index)} cities at http://{server.domain}/search")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
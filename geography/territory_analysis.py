@@ -24,7 +24,7 @@ def create_recruiting_territory_map(df):
 
     try:
         # Calculate recruiting metrics by state
-        state_metrics = df.groupby('STATE').agg({
+        state_metrics = df.groupby('STATE', observed=True).agg({
             'VALUE': ['count', 'mean', 'max'],
             'DEV TRAIT': lambda x: (x == 'ELITE').sum() + (x == 'STAR').sum()
         }).round(2)
@@ -47,6 +47,8 @@ setup(
         "console_scripts": [
             "cfb-dynasty=cfb_dynasty.analysis.roster_analysis:main",
             "cfb-roster-gen=cfb_dynasty.data.roster_generator:main",
+            "cfb-dynasty-bench=cfb_dynasty.bench:main",
+            "cfb-dynasty-watch=cfb_dynasty.watch:main",
         ],
     },
     include_package_data=True,
@@ -1,10 +1,13 @@
 # run with python3 -m unittest discover -s tests -p "test_*.py"
 import unittest
 import os
+import tempfile
+from unittest.mock import patch
 import pandas as pd
 
 from cfb_dynasty.config.constants import DEV_TRAIT_MULTIPLIERS, RS_DISCOUNT
-from cfb_dynasty.analysis.roster_analysis import calculate_player_value
+from cfb_dynasty.analysis import roster_analysis
+from cfb_dynasty.analysis.roster_analysis import calculate_player_value, process_roster_and_create_recruiting_plan
 from tests.utils import create_mock_roster, create_mock_recruits, add_player
 
 class TestRosterAnalysis(unittest.TestCase):
@@ -49,3 +52,37 @@ class TestRosterAnalysis(unittest.TestCase):
         roster_data.loc[(roster_data['FIRST NAME'] == 'CAMERON') & (roster_data['LAST NAME'] == 'THOMAS'), 'DEV TRAIT'] = 'ELITE'
         roster_data['VALUE'] = roster_data.apply(calculate_player_value, axis=1)
         self.assertGreater(roster_data.loc[(roster_data['FIRST NAME'] == 'CAMERON') & (roster_data['LAST NAME'] == 'THOMAS'), 'VALUE'].values[0], 179.38)
+
+    def test_recruiting_plan_keeps_extra_columns(self):
+        print('test_analysis.recruiting_plan_keeps_extra_columns')
+        roster_data = self.roster_data.copy()
+        roster_data['RATING'] = roster_data['OVERALL']
+        roster_data['NOTES'] = ['CAPTAIN', '', 'PRESEASON ALL-AMERICAN', '']
+        with tempfile.TemporaryDirectory() as folder:
+            roster_path = os.path.join(folder, 'Test_Roster.csv')
+            roster_data.to_csv(roster_path, index=False)
+            roster_df, _ = process_roster_and_create_recruiting_plan(roster_path)
+
+        self.assertIn('NOTES', roster_df.columns)
+        notes = dict(zip(roster_df['FIRST NAME'], roster_df['NOTES'].fillna('')))
+        self.assertEqual(notes, dict(zip(roster_data['FIRST NAME'], roster_data['NOTES'])))
+
+    def test_main_skips_every_unchanged_roster(self):
+        print('test_analysis.main_skips_every_unchanged_roster')
+        roster_data = self.roster_data.copy()
+        roster_data['RATING'] = roster_data['OVERALL']
+        with tempfile.TemporaryDirectory() as folder:
+            roster_data.to_csv(os.path.join(folder, 'A_Roster.csv'), index=False)
+            roster_data.head(3).to_csv(os.path.join(folder, 'B_Roster.csv'), index=False)
+
+            expanduser = os.path.expanduser
+            downloads = lambda path: folder if path == '~/Downloads' else expanduser(path)
+            with patch.object(roster_analysis.os.path, 'expanduser', side_effect=downloads):
+                with patch('builtins.print'):
+                    roster_analysis.main()
+                with patch('builtins.print') as printed:
+                    roster_analysis.main()
+
+            messages = [str(call.args[0]) for call in printed.call_args_list if call.args]
+            self.assertEqual(sum('Unchanged since last run' in m for m in messages), 2)
+            self.assertTrue(os.path.exists(os.path.join(folder, 'cfb_dynasty_data', 'B_Roster_recruiting_plan.csv')))
@@ -0,0 +1,111 @@
+# run with python3 -m unittest discover -s tests -p "test_*.py"
+import unittest
+import os
+import sys
+import tempfile
+import threading
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cfb_dynasty.analysis.roster_analysis import calculate_player_value
+from cfb_dynasty.data.database import DynastyDatabase
+from cfb_dynasty.models.player import Player, player_ids
+from tests.utils import create_mock_roster, create_mock_recruits
+
+
+class TestDynastyDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db = DynastyDatabase(os.path.join(self.temp_dir.name, 'dynasty.db'))
+        self.roster_df = create_mock_roster()
+        self.roster_df['VALUE'] = self.roster_df.apply(calculate_player_value, axis=1)
+        for season in (2025, 2026):
+            self.db.load_roster(self.roster_df, season, 'TEXAS TECH')
+            self.db.load_valuations(self.roster_df, season, 'TEXAS TECH')
+
+    def tearDown(self):
+        self.db.close()
+        self.temp_dir.cleanup()
+
+    def test_player_ids_match_player_model(self):
+        print('test_database.player_ids_match_player_model')
+        row = self.roster_df.iloc[0]
+        player = Player(row['FIRST NAME'], row['LAST NAME'], row['POSITION'], row['YEAR'],
+                        city=row['CITY'], state=row['STATE'])
+        self.assertEqual(player_ids(self.roster_df).iloc[0], player.player_id)
+
+    def test_player_ids_treat_missing_hometown_as_blank(self):
+        print('test_database.player_ids_treat_missing_hometown_as_blank')
+        roster_df = self.roster_df.head(1).copy()
+        roster_df['CITY'] = np.nan
+        row = roster_df.iloc[0]
+        player = Player(row['FIRST NAME'], row['LAST NAME'], row['POSITION'], row['YEAR'],
+                        city=row['CITY'], state=row['STATE'])
+        blank = Player(row['FIRST NAME'], row['LAST NAME'], row['POSITION'], row['YEAR'],
+                       city='', state=row['STATE'])
+        self.assertEqual(player_ids(roster_df).iloc[0], player.player_id)
+        self.assertEqual(player.player_id, blank.player_id)
+
+    def test_reload_replaces_season(self):
+        print('test_database.reload_replaces_season')
+        self.db.load_roster(self.roster_df.head(2), 2025, 'TEXAS TECH')
+
+        counts = self.db.query('SELECT season, COUNT(*) AS n FROM season_rosters GROUP BY season')
+        self.assertEqual(dict(zip(counts['season'], counts['n'])), {2025: 2, 2026: 4})
+        self.assertEqual(self.db.query('SELECT COUNT(*) AS n FROM players')['n'][0], 4)
+
+    def test_cross_season_queries(self):
+        print('test_database.cross_season_queries')
+        qbs = self.db.position_history('QB')
+        self.assertEqual(list(qbs['season']), [2025, 2026])
+        self.assertAlmostEqual(qbs['value'][0], self.roster_df['VALUE'][0])
+
+        history = self.db.player_history(qbs['player_id'][0])
+        self.assertEqual(len(history), 2)
+        self.assertEqual(history['overall'][0], 91)
+
+    def test_queries_use_indexes(self):
+        print('test_database.queries_use_indexes')
+        plan = self.db.query('EXPLAIN QUERY PLAN SELECT * FROM season_rosters WHERE team = ? AND season = ?',
+                             ('TEXAS TECH', 2025))
+        self.assertTrue(plan['detail'].str.contains('INDEX').any())
+        plan = self.db.query('EXPLAIN QUERY PLAN SELECT * FROM players WHERE position = ?', ('QB',))
+        self.assertTrue(plan['detail'].str.contains('idx_players_position').any())
+
+    def test_recruits_and_plans(self):
+        print('test_database.recruits_and_plans')
+        recruits_df = create_mock_recruits()
+        self.assertEqual(self.db.load_recruits(recruits_df, 2026, 'TEXAS TECH'), len(recruits_df))
+
+        plan = pd.DataFrame({
+            'Position': ['QB', 'CB'], 'Current Count': [1, 1], 'Min Required': [3, 5],
+            'Blended Value': [90.5, 70.0], 'Grade': ['A', 'C'], 'Priority': ['HIGH', 'MEDIUM'],
+        })
+        self.db.load_plan(plan, 2026, 'TEXAS TECH')
+        stored = self.db.query('SELECT position, priority FROM plans WHERE season = 2026 ORDER BY position')
+        self.assertEqual(list(stored['priority']), ['MEDIUM', 'HIGH'])
+
+    def test_pooled_connections_across_threads(self):
+        print('test_database.pooled_connections_across_threads')
+        errors = []
+
+        def read_history():
+            try:
+                self.assertEqual(len(self.db.position_history('CB')), 2)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read_history) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
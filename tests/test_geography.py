@@ -0,0 +1,598 @@
+# run with python3 -m unittest discover -s tests -p "test_*.py"
+import unittest
+import json
+import os
+import stat
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from geography import geocoding, simple_cache
+from geography import gazetteer as gazetteer_module
+from geography.engine import GeocodingEngine, NominatimBackend, TokenBucket
+from geography.distance import assign_nearest_school, distance_bands, haversine_matrix, nearest_school
+from geography.gazetteer import Gazetteer, build_gazetteer, read_census_places
+from geography.negative_cache import ERROR, NOT_FOUND, NegativeCache
+from geography.spatial import HALF_CIRCUMFERENCE_MILES, SpatialIndex, chord_to_miles, to_unit_vectors
+from geography.standin import StandInGeocoder
+from geography.simple_cache import CoordinateIndex, city_key, normalize_state_name
+from tests.utils import FakeClock
+
+
+class FakeBackend:
+    def __init__(self, coordinates, failures=0):
+        self.coordinates = coordinates
+        self.failures = failures
+        self.calls = []
+
+    def geocode(self, city, state, timeout=None):
+        self.calls.append((city, state))
+        if self.failures:
+            self.failures -= 1
+            raise TimeoutError("Service timed out")
+        return self.coordinates.get((city, state))
+
+
+class TestCoordinateIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'city_coordinates.json')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'Texas': {'ALLEN': {'latitude': 33.1, 'longitude': -96.67}}}, f)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def read_file(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_lookup_normalizes_state_and_city(self):
+        print('test_lookup_normalizes_state_and_city')
+        index = CoordinateIndex(self.path)
+        self.assertEqual(index.get('ALLEN', 'TX'), (33.1, -96.67))
+        self.assertEqual(index.get(' Allen ', 'texas'), (33.1, -96.67))
+        self.assertIsNone(index.get('ALLEN', 'OK'))
+
+    def test_new_cities_are_buffered_until_flush(self):
+        print('test_new_cities_are_buffered_until_flush')
+        index = CoordinateIndex(self.path, flush_every=10)
+        index.put('MIAMI', 'FL', 25.76, -80.19)
+
+        self.assertEqual(index.get('MIAMI', 'Florida'), (25.76, -80.19))
+        self.assertEqual(index.pending, 1)
+        self.assertNotIn('Florida', self.read_file())
+
+        self.assertTrue(index.flush())
+        self.assertEqual(index.pending, 0)
+        self.assertEqual(self.read_file()['Florida']['MIAMI'], {'latitude': 25.76, 'longitude': -80.19})
+        self.assertIn('ALLEN', self.read_file()['Texas'])
+
+    def test_flushes_automatically_after_batch(self):
+        print('test_flushes_automatically_after_batch')
+        index = CoordinateIndex(self.path, flush_every=2)
+        index.put('MIAMI', 'FL', 25.76, -80.19)
+        index.put('TAMPA', 'FL', 27.95, -82.46)
+
+        self.assertEqual(index.pending, 0)
+        self.assertEqual(set(self.read_file()['Florida']), {'MIAMI', 'TAMPA'})
+
+    def test_flush_keeps_cities_written_by_another_process(self):
+        print('test_flush_keeps_cities_written_by_another_process')
+        index = CoordinateIndex(self.path, flush_every=10)
+        other = CoordinateIndex(self.path)
+        other.replace({'Texas': {'ALLEN': {'latitude': 33.1, 'longitude': -96.67},
+                                 'PLANO': {'latitude': 33.02, 'longitude': -96.7}}})
+
+        index.put('MIAMI', 'FL', 25.76, -80.19)
+        index.flush()
+        self.assertEqual(set(self.read_file()['Texas']), {'ALLEN', 'PLANO'})
+
+    def test_module_functions_use_shared_index(self):
+        print('test_module_functions_use_shared_index')
+        index = CoordinateIndex(self.path, flush_every=10)
+        with patch.object(simple_cache, '_index', index):
+            with patch('builtins.print'):
+                simple_cache.store_city_coordinates_to_json('MIAMI', 'FL', 25.76, -80.19)
+            self.assertEqual(simple_cache.get_city_coordinates_from_json('MIAMI', 'FL'), (25.76, -80.19))
+            self.assertIn('MIAMI', simple_cache.load_coordinates()['Florida'])
+            self.assertEqual(simple_cache.get_coordinates_stats()['pending_writes'], 1)
+            self.assertTrue(simple_cache.flush_coordinates())
+
+            self.assertTrue(simple_cache.clear_coordinates())
+            self.assertIsNone(simple_cache.get_city_coordinates_from_json('ALLEN', 'TX'))
+        self.assertEqual(self.read_file(), {})
+
+    def test_city_key_canonicalizes_variants(self):
+        print('test_city_key_canonicalizes_variants')
+        self.assertEqual(city_key('St. Louis'), 'SAINT LOUIS')
+        self.assertEqual(city_key(' saint  louis '), 'SAINT LOUIS')
+        self.assertEqual(city_key('Ft. Worth'), 'FORT WORTH')
+        self.assertEqual(city_key('N Little Rock'), 'NORTH LITTLE ROCK')
+        self.assertEqual(city_key('Winston-Salem'), 'WINSTON SALEM')
+
+    def test_spelling_variants_share_one_entry(self):
+        print('test_spelling_variants_share_one_entry')
+        index = CoordinateIndex(self.path)
+        index.put('SAINT LOUIS', 'MO', 38.63, -90.19)
+        index.put('St. Louis', 'Missouri', 38.63, -90.19)
+        index.flush()
+
+        self.assertEqual(index.get('st louis', 'MO'), (38.63, -90.19))
+        self.assertEqual(list(self.read_file()['Missouri']), ['SAINT LOUIS'])
+
+    def test_flush_keeps_umask_mode_and_utf8(self):
+        print('test_flush_keeps_umask_mode_and_utf8')
+        index = CoordinateIndex(self.path)
+        index.put('CAÑON CITY', 'CO', 38.44, -105.24)
+        previous = os.umask(0o022)
+        try:
+            self.assertTrue(index.flush())
+        finally:
+            os.umask(previous)
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o644)
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self.assertIn('CAÑON CITY', f.read())
+        self.assertEqual(os.listdir(self.temp_dir.name), ['city_coordinates.json'])
+
+    def test_fuzzy_match_within_state(self):
+        print('test_fuzzy_match_within_state')
+        index = CoordinateIndex(self.path)
+        index.put('CARROLLTON', 'TX', 32.95, -96.9)
+
+        city, score = index.match('Carrolton', 'TX')
+        self.assertEqual(city, 'CARROLLTON')
+        self.assertGreaterEqual(score, 0.75)
+        self.assertEqual(index.get_fuzzy('Carrolton', 'TX'), (32.95, -96.9))
+        self.assertIsNone(index.match('Carrolton', 'GA'))
+        self.assertIsNone(index.match('Dallas', 'TX'))
+        self.assertIsNone(index.match('Carrolton', 'TX', threshold=0.95))
+
+    def test_fuzzy_match_rejects_different_towns(self):
+        print('test_fuzzy_match_rejects_different_towns')
+        index = CoordinateIndex(self.path)
+        index.put('RICHLAND HILLS', 'TX', 32.82, -97.23)
+        index.put('BRAUNFELS', 'TX', 29.70, -98.12)
+        index.put('NORTH LITTLE ROCK', 'AR', 34.77, -92.27)
+
+        self.assertIsNone(index.match('North Richland Hills', 'TX'))
+        self.assertIsNone(index.match('New Braunfels', 'TX'))
+        self.assertIsNone(index.match('Little Rock', 'AR'))
+        self.assertEqual(index.match('Richland Hils', 'TX')[0], 'RICHLAND HILLS')
+        self.assertEqual(index.match('N Little Rok', 'AR')[0], 'NORTH LITTLE ROCK')
+
+    def test_normalize_state_name(self):
+        print('test_normalize_state_name')
+        self.assertEqual(normalize_state_name('tx'), 'Texas')
+        self.assertEqual(normalize_state_name('new mexico'), 'New Mexico')
+
+
+class TestGeocodeMany(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'city_coordinates.json')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'Texas': {'ALLEN': {'latitude': 33.1, 'longitude': -96.67}}}, f)
+        self.index = CoordinateIndex(self.path)
+        self.gazetteer = None
+        self.negative_cache = NegativeCache(os.path.join(self.temp_dir.name, 'unresolved_cities.json'))
+        for patcher in (patch.object(simple_cache, '_index', self.index),
+                        patch.object(geocoding, 'get_gazetteer', lambda: self.gazetteer),
+                        patch.object(geocoding, 'get_negative_cache', lambda: self.negative_cache)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def test_resolves_hits_and_deduplicates_misses(self):
+        print('test_resolves_hits_and_deduplicates_misses')
+        backend = FakeBackend({('Miami', 'FL'): (25.76, -80.19)})
+        engine = GeocodingEngine(backend, rate=1000, burst=10)
+
+        pairs = [('ALLEN', 'TX'), ('Miami', 'FL'), ('MIAMI ', 'Florida'), ('Nowhere', 'ZZ'), (None, 'TX')]
+        with patch('builtins.print'):
+            with patch.object(self.index, 'flush', wraps=self.index.flush) as flush:
+                lats, lons = geocoding.geocode_many(pairs, engine=engine)
+
+        self.assertEqual(sorted(backend.calls), [('Miami', 'FL'), ('Nowhere', 'ZZ')])
+        self.assertEqual(flush.call_count, 1)
+        np.testing.assert_array_equal(lats, [33.1, 25.76, 25.76, np.nan, np.nan])
+        np.testing.assert_array_equal(lons, [-96.67, -80.19, -80.19, np.nan, np.nan])
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self.assertIn('Miami', json.load(f)['Florida'])
+
+    def test_offline_never_calls_api(self):
+        print('test_offline_never_calls_api')
+        backend = FakeBackend({})
+        with patch('builtins.print'):
+            lats, _ = geocoding.geocode_many([('ALLEN', 'TX'), ('Miami', 'FL')], offline=True,
+                                             engine=GeocodingEngine(backend))
+        self.assertEqual(backend.calls, [])
+        self.assertEqual(lats[0], 33.1)
+        self.assertTrue(np.isnan(lats[1]))
+
+    def test_gazetteer_resolves_before_api(self):
+        print('test_gazetteer_resolves_before_api')
+        gazetteer_path = os.path.join(self.temp_dir.name, 'gazetteer.bin')
+        build_gazetteer([('Miami', 'FL', 25.76, -80.19)], gazetteer_path)
+        self.gazetteer = Gazetteer(gazetteer_path)
+        backend = FakeBackend({})
+
+        with patch('builtins.print'):
+            lats, _ = geocoding.geocode_many([('MIAMI', 'Florida'), ('Nowhere', 'ZZ')],
+                                             engine=GeocodingEngine(backend, rate=1000))
+            single = geocoding.get_city_coordinates('Miami', 'FL')
+
+        self.assertEqual(backend.calls, [('Nowhere', 'ZZ')])
+        self.assertAlmostEqual(lats[0], 25.76, places=4)
+        self.assertAlmostEqual(single[1], -80.19, places=4)
+
+    def test_near_miss_spelling_skips_api(self):
+        print('test_near_miss_spelling_skips_api')
+        backend = FakeBackend({})
+        with patch('builtins.print'):
+            lats, _ = geocoding.geocode_many([('Alllen', 'TX'), ('St Allen', 'TX')],
+                                             engine=GeocodingEngine(backend, rate=1000))
+        self.assertEqual(lats[0], 33.1)
+        self.assertEqual(backend.calls, [('St Allen', 'TX')])
+
+    def test_failed_cities_are_not_retried(self):
+        print('test_failed_cities_are_not_retried')
+        backend = FakeBackend({})
+        engine = GeocodingEngine(backend, rate=1000)
+        with patch('builtins.print'):
+            geocoding.geocode_many([('Nowhere', 'ZZ')], engine=engine)
+            with patch.object(geocoding, 'get_geocoding_engine', return_value=engine):
+                self.assertIsNone(geocoding.get_city_coordinates('NOWHERE', 'ZZ'))
+            lats, _ = geocoding.geocode_many([('Nowhere', 'ZZ')], engine=engine)
+
+        self.assertEqual(backend.calls, [('Nowhere', 'ZZ')])
+        self.assertTrue(np.isnan(lats[0]))
+        reloaded = NegativeCache(self.negative_cache.file_path)
+        self.assertEqual(reloaded.lookup('Nowhere', 'ZZ')['reason'], NOT_FOUND)
+
+
+class TestGazetteer(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'gazetteer.bin')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_lookup_by_normalized_key(self):
+        print('test_lookup_by_normalized_key')
+        count = build_gazetteer([
+            ('Allen', 'TX', 33.1, -96.67),
+            ('Miami', 'Florida', 25.76, -80.19),
+            ('ALLEN', 'Texas', 0.0, 0.0),
+            ('X' * 80, 'TX', 1.0, 1.0),
+        ], self.path)
+        gazetteer = Gazetteer(self.path)
+
+        self.assertEqual(count, 2)
+        self.assertEqual(len(gazetteer), 2)
+        lat, lon = gazetteer.lookup(' allen ', 'tx')
+        self.assertAlmostEqual(lat, 33.1, places=4)
+        self.assertAlmostEqual(lon, -96.67, places=4)
+        self.assertIsNone(gazetteer.lookup('Allen', 'OK'))
+        results = gazetteer.lookup_many([('MIAMI', 'FL'), ('Zzyzx', 'WY'), ('X' * 80, 'TX')])
+        self.assertAlmostEqual(results[0][0], 25.76, places=4)
+        self.assertEqual(results[1:], [None, None])
+
+    def test_reads_census_places(self):
+        print('test_reads_census_places')
+        census_path = os.path.join(self.temp_dir.name, 'places.txt')
+        with open(census_path, 'w', encoding='utf-8') as f:
+            f.write("USPS\tGEOID\tNAME\tINTPTLAT\tINTPTLONG                    \n")
+            f.write("TX\t4801924\tAllen city\t33.10\t-96.67\n")
+            f.write("TX\t4812345\tCedar Hill CDP\t32.59\t-96.96\n")
+            f.write("PR\t7200001\tAdjuntas zona urbana\t18.16\t-66.72\n")
+
+        self.assertEqual(list(read_census_places(census_path)), [
+            ('Allen', 'TX', 33.10, -96.67),
+            ('Cedar Hill', 'TX', 32.59, -96.96),
+        ])
+
+    def test_build_command_adds_census_places(self):
+        print('test_build_command_adds_census_places')
+        census_path = os.path.join(self.temp_dir.name, 'places.txt')
+        with open(census_path, 'w', encoding='utf-8') as f:
+            f.write("USPS\tGEOID\tNAME\tINTPTLAT\tINTPTLONG\n")
+            f.write("TX\t4801924\tAllen city\t33.00\t-96.00\n")
+            f.write("TX\t4812345\tCedar Hill city\t32.59\t-96.96\n")
+        cached = {'Texas': {'ALLEN': {'latitude': 33.1, 'longitude': -96.67}}}
+
+        with patch.object(gazetteer_module, 'load_coordinates', return_value=cached), patch('builtins.print'):
+            gazetteer_module.main(['--census', census_path, '--output', self.path])
+
+        gazetteer = Gazetteer(self.path)
+        self.assertEqual(len(gazetteer), 2)
+        self.assertAlmostEqual(gazetteer.lookup('Allen', 'TX')[0], 33.1, places=4)
+        self.assertAlmostEqual(gazetteer.lookup('Cedar Hill', 'TX')[0], 32.59, places=4)
+
+    def test_missing_table_is_skipped(self):
+        print('test_missing_table_is_skipped')
+        with patch.object(gazetteer_module, 'get_gazetteer_path', return_value=self.path), \
+                patch.object(gazetteer_module, '_gazetteer_loaded', False), \
+                patch.object(gazetteer_module, '_gazetteer', None), patch('builtins.print') as printed:
+            self.assertIsNone(gazetteer_module.get_gazetteer())
+        printed.assert_not_called()
+
+    def test_rejects_other_files(self):
+        print('test_rejects_other_files')
+        with open(self.path, 'wb') as f:
+            f.write(b'not a gazetteer')
+        with self.assertRaises(ValueError):
+            Gazetteer(self.path)
+
+
+class TestNegativeCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'unresolved_cities.json')
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_entries_expire_by_reason(self):
+        print('test_entries_expire_by_reason')
+        cache = NegativeCache(self.path, ttl={NOT_FOUND: 100, ERROR: 10}, clock=self.clock)
+        cache.record('Nowhere', 'TX', NOT_FOUND)
+        cache.record('Slowtown', 'TX', ERROR, 'Service timed out')
+
+        self.clock.advance(50)
+        self.assertIsNotNone(cache.lookup('NOWHERE ', 'Texas'))
+        self.assertIsNone(cache.lookup('Slowtown', 'TX'))
+        self.clock.advance(50)
+        self.assertIsNone(cache.lookup('Nowhere', 'TX'))
+
+    def test_persists_reason_and_attempts(self):
+        print('test_persists_reason_and_attempts')
+        cache = NegativeCache(self.path, clock=self.clock)
+        cache.record('Slowtown', 'TX', ERROR, 'Service timed out')
+        cache.record('Slowtown', 'TX', ERROR, 'Service timed out')
+        self.assertTrue(cache.flush())
+
+        entry = NegativeCache(self.path, clock=self.clock).lookup('Slowtown', 'TX')
+        self.assertEqual(entry['attempts'], 2)
+        self.assertEqual(entry['detail'], 'Service timed out')
+
+        cache.forget('Slowtown', 'TX')
+        cache.flush()
+        self.assertIsNone(NegativeCache(self.path, clock=self.clock).lookup('Slowtown', 'TX'))
+
+    def test_transient_errors_expire_within_minutes(self):
+        print('test_transient_errors_expire_within_minutes')
+        cache = NegativeCache(self.path, clock=self.clock)
+        cache.record('Nowhere', 'TX', NOT_FOUND)
+        cache.record('Slowtown', 'TX', ERROR, 'Service timed out')
+
+        self.clock.advance(3600)
+        self.assertIsNone(cache.lookup('Slowtown', 'TX'))
+        self.assertIsNotNone(cache.lookup('Nowhere', 'TX'))
+
+    def test_writes_in_batches(self):
+        print('test_writes_in_batches')
+        cache = NegativeCache(self.path, clock=self.clock, flush_every=2)
+        cache.record('Nowhere', 'TX', NOT_FOUND)
+        self.assertFalse(os.path.exists(self.path))
+        cache.record('Elsewhere', 'TX', NOT_FOUND)
+        self.assertEqual(len(NegativeCache(self.path, clock=self.clock)), 2)
+
+    def test_failed_flush_leaves_no_temp_file(self):
+        print('test_failed_flush_leaves_no_temp_file')
+        cache = NegativeCache(self.path, clock=self.clock)
+        cache.record('Nowhere', 'TX', NOT_FOUND, object())
+
+        with self.assertRaises(TypeError):
+            cache.flush()
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+
+class TestGeocodingEngine(unittest.TestCase):
+
+    def test_token_bucket_paces_requests(self):
+        print('test_token_bucket_paces_requests')
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, burst=2, clock=clock, sleep=clock.advance)
+        for _ in range(6):
+            bucket.acquire()
+        # Two tokens up front, then one every half second
+        self.assertAlmostEqual(clock.now, 2.0)
+
+    def test_retries_timeouts_then_succeeds(self):
+        print('test_retries_timeouts_then_succeeds')
+        backend = FakeBackend({('Miami', 'FL'): (25.76, -80.19)}, failures=1)
+        engine = GeocodingEngine(backend, rate=1000, backoff=0)
+        with patch('builtins.print'):
+            self.assertEqual(engine.geocode('Miami', 'FL'), (25.76, -80.19))
+        self.assertEqual(len(backend.calls), 2)
+
+    def test_concurrent_engine_against_stand_in_server(self):
+        print('test_concurrent_engine_against_stand_in_server')
+        coordinates = {'Texas': {'ALLEN': {'latitude': 33.1, 'longitude': -96.67}},
+                       'Florida': {'MIAMI': {'latitude': 25.76, 'longitude': -80.19}}}
+        with StandInGeocoder(coordinates, latency=0.05) as server:
+            engine = GeocodingEngine(NominatimBackend(domain=server.domain, scheme='http', timeout=5),
+                                     rate=1000, burst=8, max_workers=8)
+            pairs = [('Allen', 'TX'), ('Miami', 'FL'), ('Nowhere', 'ZZ')] * 4
+            start = time.perf_counter()
+            with patch('builtins.print'):
+                results = engine.geocode_all(pairs)
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual(results[:3], [(33.1, -96.67), (25.76, -80.19), None])
+        self.assertEqual(results, results[:3] * 4)
+        self.assertEqual(len(server.request_times), 12)
+        # 12 requests at 50ms each would take 0.6s serially
+        self.assertLess(elapsed, 0.45)
+
+class TestSpatialIndex(unittest.TestCase):
+
+    CITIES = {
+        'Texas': {'ALLEN': {'latitude': 33.10, 'longitude': -96.67},
+                  'AUSTIN': {'latitude': 30.27, 'longitude': -97.74},
+                  'EL PASO': {'latitude': 31.76, 'longitude': -106.49}},
+        'Oklahoma': {'NORMAN': {'latitude': 35.22, 'longitude': -97.44}},
+        'Florida': {'MIAMI': {'latitude': 25.76, 'longitude': -80.19}},
+    }
+
+    def setUp(self):
+        self.index = SpatialIndex.from_coordinates(self.CITIES)
+
+    def test_radius_query_sorted_by_distance(self):
+        print('test_radius_query_sorted_by_distance')
+        # From Dallas: Allen ~25 mi, Norman ~170 mi, Austin ~180 mi
+        positions, miles = self.index.within_radius(32.78, -96.80, 250)
+        self.assertEqual(self.index.label(positions), ['ALLEN, Texas', 'NORMAN, Oklahoma', 'AUSTIN, Texas'])
+        self.assertTrue(np.all(np.diff(miles) >= 0))
+        self.assertAlmostEqual(miles[0], 22.8, delta=2)
+
+    def test_nearest_and_bounding_box(self):
+        print('test_nearest_and_bounding_box')
+        positions, _ = self.index.nearest(25.0, -80.0, k=2)
+        self.assertEqual(self.index.label(positions), ['MIAMI, Florida', 'AUSTIN, Texas'])
+
+        box = self.index.bounding_box(30.0, 34.0, -100.0, -95.0)
+        self.assertEqual(sorted(self.index.label(box)), ['ALLEN, Texas', 'AUSTIN, Texas'])
+
+        positions, miles = self.index.nearest_many([33.0, np.nan], [-97.0, -97.0], k=1)
+        self.assertEqual(self.index.label(positions[0]), ['ALLEN, Texas'])
+        self.assertEqual(positions[1, 0], -1)
+        self.assertTrue(np.isnan(miles[1, 0]))
+
+    def test_matches_brute_force(self):
+        print('test_matches_brute_force')
+        rng = np.random.default_rng(7)
+        lats, lons = rng.uniform(-85, 85, 2000), rng.uniform(-180, 180, 2000)
+        index = SpatialIndex(lats, lons, cell_degrees=2.0)
+        points = to_unit_vectors(lats, lons)
+
+        for lat, lon in [(33.0, -97.0), (60.0, 179.5), (-80.0, 10.0)]:
+            brute = chord_to_miles(np.linalg.norm(points - to_unit_vectors(lat, lon), axis=1))
+            positions, _ = index.within_radius(lat, lon, 500)
+            self.assertEqual(set(positions), set(np.flatnonzero(brute <= 500)))
+            _, miles = index.nearest(lat, lon, k=4)
+            np.testing.assert_allclose(miles, np.sort(brute)[:4])
+
+    def test_batched_queries_match_single_queries(self):
+        print('test_batched_queries_match_single_queries')
+        rng = np.random.default_rng(11)
+        point_lats, point_lons = rng.uniform(-85, 85, 1500), rng.uniform(-180, 180, 1500)
+        index = SpatialIndex(point_lats, point_lons, cell_degrees=2.0)
+        points = to_unit_vectors(point_lats, point_lons)
+        lats = np.append(rng.uniform(-89, 89, 40), [np.nan, 60.0, 0.0])
+        lons = np.append(rng.uniform(-180, 180, 40), [0.0, 179.9, -180.0])
+
+        with patch('geography.spatial.QUERY_BATCH', 7), patch('geography.spatial.BRUTE_FORCE_BYTES', 1):
+            radius = index.within_radius_many(lats, lons, 400)
+            positions, miles = index.nearest_many(lats, lons, k=3)
+            _, far = SpatialIndex([0.0], [0.0]).nearest_many([0.0, 10.0], [180.0, 170.0], k=1)
+
+        self.assertEqual(len(radius[40]), 0)
+        self.assertEqual(list(positions[40]), [-1, -1, -1])
+        for row in np.flatnonzero(~np.isnan(lats)):
+            brute = chord_to_miles(np.linalg.norm(points - to_unit_vectors(lats[row], lons[row]), axis=1))
+            self.assertEqual(set(radius[row]), set(np.flatnonzero(brute <= 400)))
+            self.assertTrue(np.all(np.diff(brute[radius[row]]) >= 0))
+            np.testing.assert_allclose(miles[row], np.sort(brute)[:3])
+        self.assertAlmostEqual(far[0, 0], HALF_CIRCUMFERENCE_MILES, delta=1)
+
+    def test_antimeridian_queries(self):
+        print('test_antimeridian_queries')
+        # Both edges of a wrapping box fall in the same grid cell
+        self.assertEqual(list(SpatialIndex([40, 40], [-100, 10.5]).bounding_box(30, 50, 10.6, 10.4)), [0])
+
+        index = SpatialIndex([40, 40, 40], [179.5, -179.5, 0])
+        self.assertEqual(sorted(index.bounding_box(30, 50, 179, -179)), [0, 1])
+        self.assertEqual(sorted(index.bounding_box(30, 50, 170, 180)), [0])
+        positions, _ = index.within_radius(40, 180, 50)
+        self.assertEqual(sorted(positions), [0, 1])
+
+        # A radius reaching nearly around the globe from the western edge
+        wide = SpatialIndex([0], [90], cell_degrees=10.0)
+        positions, _ = wide.within_radius(0, 5, 176 * 69.09)
+        self.assertEqual(list(positions), [0])
+
+    def test_hometown_index_uses_row_positions(self):
+        print('test_hometown_index_uses_row_positions')
+        roster_df = pd.DataFrame({'CITY': ['ALLEN', 'Nowhere', 'AUSTIN'], 'STATE': ['TX', 'ZZ', 'TX']})
+        lats, lons = np.array([33.10, np.nan, 30.27]), np.array([-96.67, np.nan, -97.74])
+        with patch('geography.geocoding.geocode_many', return_value=(lats, lons)):
+            index = SpatialIndex.from_hometowns(roster_df)
+
+        self.assertEqual(len(index), 2)
+        positions, _ = index.within_radius(30.27, -97.74, 50)
+        self.assertEqual(list(positions), [2])
+
+
+class TestDistance(unittest.TestCase):
+
+    # Dallas, Austin, Miami, unknown
+    RECRUIT_LATS = np.array([32.78, 30.27, 25.76, np.nan])
+    RECRUIT_LONS = np.array([-96.80, -97.74, -80.19, np.nan])
+    # Norman, Austin
+    SCHOOL_LATS = np.array([35.22, 30.28])
+    SCHOOL_LONS = np.array([-97.44, -97.73])
+
+    def test_matrix_is_float32_and_chunk_independent(self):
+        print('test_matrix_is_float32_and_chunk_independent')
+        matrix = haversine_matrix(self.RECRUIT_LATS, self.RECRUIT_LONS, self.SCHOOL_LATS, self.SCHOOL_LONS)
+        chunked = haversine_matrix(self.RECRUIT_LATS, self.RECRUIT_LONS, self.SCHOOL_LATS, self.SCHOOL_LONS,
+                                   chunk_bytes=1)
+
+        self.assertEqual(matrix.dtype, np.float32)
+        self.assertEqual(matrix.shape, (4, 2))
+        np.testing.assert_array_equal(matrix, chunked)
+        self.assertAlmostEqual(float(matrix[0, 1]), 182, delta=2)  # Dallas to Austin
+        self.assertTrue(np.isnan(matrix[3]).all())
+
+        expected = chord_to_miles(np.linalg.norm(
+            to_unit_vectors(self.RECRUIT_LATS[:3, None], self.RECRUIT_LONS[:3, None])
+            - to_unit_vectors(self.SCHOOL_LATS, self.SCHOOL_LONS), axis=-1))
+        np.testing.assert_allclose(matrix[:3], expected, rtol=1e-5)
+
+    def test_nearest_school_and_bands(self):
+        print('test_nearest_school_and_bands')
+        positions, miles = nearest_school(self.RECRUIT_LATS, self.RECRUIT_LONS, self.SCHOOL_LATS,
+                                          self.SCHOOL_LONS, chunk_bytes=1)
+        self.assertEqual(list(positions), [0, 1, 1, -1])
+        self.assertLess(miles[1], 1)
+        self.assertTrue(np.isnan(miles[3]))
+
+        bands = distance_bands(self.RECRUIT_LATS, self.RECRUIT_LONS, self.SCHOOL_LATS, self.SCHOOL_LONS,
+                               schools=['Oklahoma', 'Texas'], bands=(100, 250, 1000), chunk_bytes=1)
+        self.assertEqual(list(bands.columns), ['0-100', '100-250', '250-1000'])
+        self.assertEqual(bands.loc['Texas'].tolist(), [1, 1, 0])
+        # Miami is more than 1000 miles from both schools and is left out
+        self.assertEqual(bands.loc['Oklahoma'].tolist(), [0, 1, 1])
+
+    def test_assign_nearest_school(self):
+        print('test_assign_nearest_school')
+        recruits_df = pd.DataFrame({'CITY': ['DALLAS', 'Nowhere'], 'STATE': ['TX', 'ZZ']})
+        schools_df = pd.DataFrame({'SCHOOL': ['Oklahoma', 'Texas'],
+                                   'LATITUDE': self.SCHOOL_LATS, 'LONGITUDE': self.SCHOOL_LONS})
+        coords = (np.array([32.78, np.nan]), np.array([-96.80, np.nan]))
+        with patch('geography.geocoding.geocode_many', return_value=coords):
+            result = assign_nearest_school(recruits_df, schools_df)
+
+        self.assertEqual(result['NEAREST SCHOOL'].tolist(), ['Oklahoma', None])
+        self.assertAlmostEqual(result['DISTANCE'].iloc[0], 172.5, delta=1)
+        self.assertTrue(np.isnan(result['DISTANCE'].iloc[1]))
+        self.assertNotIn('DISTANCE', recruits_df.columns)
+
+
+if __name__ == '__main__':
+    unittest.main()
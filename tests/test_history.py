@@ -0,0 +1,82 @@
+# run with python3 -m unittest discover -s tests -p "test_*.py"
+import unittest
+import os
+import sys
+import tempfile
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cfb_dynasty.data.history import RosterHistory
+from cfb_dynasty.models.player import player_ids
+from tests.utils import create_mock_roster, create_mock_recruits
+
+
+class TestRosterHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.history = RosterHistory(self.temp_dir.name, snapshot_every=2)
+
+        self.week1 = create_mock_roster()
+        self.week2 = self.week1.copy()
+        self.week2.loc[0, 'OVERALL'] = 93
+        self.week2.loc[3, 'STATUS'] = 'CUT'
+        recruit = create_mock_recruits().head(1)[self.week1.columns.intersection(create_mock_recruits().columns)]
+        self.week3 = pd.concat([self.week2.drop(index=1), recruit], ignore_index=True)
+
+        self.history.record(self.week1, 2025, 1)
+        self.history.record(self.week2, 2025, 2)
+        self.history.record(self.week3, 2025, 3)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def assertRosterEqual(self, reconstructed, roster_df):
+        expected = roster_df.set_axis(player_ids(roster_df)).rename_axis('player_id')
+        pd.testing.assert_frame_equal(
+            reconstructed.sort_index(), expected.astype(object).where(expected.notna(), None).sort_index(),
+            check_dtype=False
+        )
+
+    def test_records_only_deltas(self):
+        print('test_history.records_only_deltas')
+        versions = self.history.versions()
+        self.assertEqual(list(versions['adds']), [4, 0, 1])
+        self.assertEqual(list(versions['updates']), [0, 2, 0])
+        self.assertEqual(list(versions['removes']), [0, 0, 1])
+        self.assertEqual(list(versions['snapshot']), [True, False, True])
+
+    def test_time_travel_reconstructs_each_week(self):
+        print('test_history.time_travel_reconstructs_each_week')
+        self.assertRosterEqual(self.history.as_of(2025, 1), self.week1)
+        self.assertRosterEqual(self.history.as_of(2025, 2), self.week2)
+        self.assertRosterEqual(self.history.as_of(2025), self.week3)
+
+        reopened = RosterHistory(self.temp_dir.name, snapshot_every=2)
+        self.assertRosterEqual(reopened.at_version(2), self.week2)
+
+    def test_history_is_append_only(self):
+        print('test_history.history_is_append_only')
+        events_path = os.path.join(self.temp_dir.name, 'events.jsonl')
+        before = open(events_path, 'rb').read()
+
+        reopened = RosterHistory(self.temp_dir.name, snapshot_every=2)
+        reopened.record(self.week3.head(2), 2026)
+        self.assertTrue(open(events_path, 'rb').read().startswith(before))
+        self.assertEqual(len(reopened.as_of(2026)), 2)
+
+        with self.assertRaises(ValueError):
+            reopened.record(self.week1, 2025, 4)
+
+    def test_player_changes(self):
+        print('test_history.player_changes')
+        qb_id = player_ids(self.week1).iloc[0]
+        changes = self.history.player_changes(qb_id)
+        self.assertEqual([c['op'] for c in changes], ['add', 'update'])
+        self.assertEqual(changes[1]['fields'], {'OVERALL': 93})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,254 @@
+# run with python3 -m unittest discover -s tests -p "test_*.py"
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cfb_dynasty.analysis.roster_analysis import scheme_fit, calculate_player_value
+from cfb_dynasty.bench import run_suite
+from cfb_dynasty.data.roster_generator import generate_roster
+from cfb_dynasty.utils.instrumentation import (
+    instrument,
+    enable_instrumentation,
+    disable_instrumentation,
+    reset_instrumentation,
+    get_instrumentation_report
+)
+from cfb_dynasty.utils.performance import (
+    DataFrameOptimizer,
+    stream_process_rosters,
+    batch_process_rosters,
+    optimized_value_calculation
+)
+from cfb_dynasty.utils.memory import (
+    MemoryAccountant,
+    column_memory,
+    column_memory_delta,
+    get_memory_accountant,
+    memory_stage,
+    record_copy,
+    track_memory
+)
+from tests.utils import create_mock_roster, create_mock_recruits
+
+
+def create_valued_roster():
+    "returns the mock roster with player values filled in"
+    roster_df = create_mock_roster()
+    roster_df['VALUE'] = roster_df.apply(calculate_player_value, axis=1)
+    return roster_df
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        reset_instrumentation()
+
+    def tearDown(self):
+        disable_instrumentation()
+        reset_instrumentation()
+
+    def test_disabled_by_default(self):
+        print('test_performance.disabled_by_default')
+        scheme_fit(create_valued_roster())
+        self.assertEqual(get_instrumentation_report(), {})
+
+    def test_records_latency_rows_and_memory(self):
+        print('test_performance.records_latency_rows_and_memory')
+        enable_instrumentation()
+        roster_df = create_valued_roster()
+        for _ in range(5):
+            scheme_fit(roster_df)
+
+        stats = get_instrumentation_report()['scheme_fit']
+        self.assertEqual(stats['calls'], 5)
+        self.assertEqual(stats['rows'], 5 * len(roster_df))
+        self.assertLessEqual(stats['p50_s'], stats['p99_s'])
+        self.assertGreater(stats['rows_per_sec'], 0)
+        self.assertGreater(stats['peak_memory_bytes'], 0)
+
+    def test_nested_peak_memory(self):
+        print('test_performance.nested_peak_memory')
+
+        @instrument('inner')
+        def inner():
+            return bytearray(100_000)
+
+        @instrument('outer')
+        def outer():
+            big = bytearray(1_000_000)
+            del big
+            inner()
+
+        enable_instrumentation()
+        outer()
+        report = get_instrumentation_report()
+
+        # The outer peak must include the allocation made before the nested call
+        self.assertGreaterEqual(report['outer']['peak_memory_bytes'], 1_000_000)
+        self.assertLess(report['inner']['peak_memory_bytes'], 1_000_000)
+
+
+class TestStreamProcessRosters(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.roster_files = []
+        for i in range(6):
+            path = os.path.join(self.temp_dir.name, f"Season_{i}_Roster.csv")
+            create_mock_roster().to_csv(path, index=False)
+            self.roster_files.append(path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_yields_in_order_and_skips_bad_files(self):
+        print('test_performance.stream_yields_in_order')
+        files = self.roster_files[:2] + [os.path.join(self.temp_dir.name, 'missing.csv')] + self.roster_files[2:]
+        results = list(stream_process_rosters(files, max_in_flight=2))
+
+        self.assertEqual([path for path, _ in results], self.roster_files)
+        self.assertTrue(all('VALUE' in df.columns for _, df in results))
+        self.assertEqual(len(batch_process_rosters(files, batch_size=3)), len(self.roster_files))
+
+    def test_backpressure_limits_files_in_flight(self):
+        print('test_performance.stream_backpressure')
+        pulled = []
+
+        def lazy_files():
+            for path in self.roster_files:
+                pulled.append(path)
+                yield path
+
+        stream = stream_process_rosters(lazy_files(), max_in_flight=2)
+        next(stream)
+        # One result consumed: at most the in-flight limit plus one refill was requested
+        self.assertLessEqual(len(pulled), 3)
+        stream.close()
+
+    def test_writes_results_to_disk(self):
+        print('test_performance.stream_writes_results')
+        output_dir = os.path.join(self.temp_dir.name, 'valued')
+        results = list(stream_process_rosters(self.roster_files, output_dir=output_dir))
+
+        for _, output_path in results:
+            self.assertTrue(os.path.exists(output_path))
+            self.assertIn('VALUE', pd.read_csv(output_path).columns)
+
+
+class TestDataFrameOptimizer(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'RATING': [70, 85, 99],
+            'RANK': [-5, 300, 1200],
+            'VALUE': [101.5, 120.25, 99.0],
+            'CUT': ['True', 'False', 'False'],
+            'NAME': ['A', 'B', 'C'],
+        })
+
+    def test_dry_run_reports_plan_without_converting(self):
+        print('test_performance.optimizer_dry_run')
+        plan = DataFrameOptimizer.optimize_datatypes(self.df, dry_run=True)
+        planned = {conversion['column']: conversion['to_dtype'] for conversion in plan}
+
+        self.assertEqual(planned, {'RATING': 'uint8', 'RANK': 'int16', 'VALUE': 'float32', 'CUT': 'bool'})
+        self.assertEqual(self.df['RATING'].dtype, 'int64')
+        self.assertTrue(all(c['bytes_after'] < c['bytes_before'] for c in plan))
+
+    def test_inplace_converts_same_frame(self):
+        print('test_performance.optimizer_inplace')
+        result = DataFrameOptimizer.optimize_datatypes(self.df, inplace=True)
+
+        self.assertIsNone(result)
+        self.assertEqual(self.df['RATING'].dtype, 'uint8')
+        self.assertEqual(self.df['RANK'].dtype, 'int16')
+
+    def test_float_columns_downcast_once(self):
+        print('test_performance.optimizer_float_downcast_once')
+        with patch('cfb_dynasty.utils.performance.pd.to_numeric', wraps=pd.to_numeric) as to_numeric:
+            optimized = DataFrameOptimizer.optimize_datatypes(self.df)
+
+        self.assertEqual(to_numeric.call_count, 1)
+        self.assertEqual(optimized['VALUE'].dtype, 'float32')
+        self.assertEqual(list(optimized['VALUE']), [101.5, 120.25, 99.0])
+
+    def test_value_calculation_leaves_input_untouched(self):
+        print('test_performance.value_calculation_input_untouched')
+        roster_df = create_mock_roster()
+        original = roster_df.copy()
+        valued_df = optimized_value_calculation(roster_df)
+
+        pd.testing.assert_frame_equal(roster_df, original)
+        self.assertEqual(valued_df['OVERALL'].dtype, 'uint8')
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_run_suite_smoke(self):
+        print('test_performance.run_suite_smoke')
+        results = run_suite(scales=[1, 2], repeat=1, trace_memory=False,
+                            benchmarks=['scheme_fit', 'optimized_value_calculation'])
+
+        self.assertEqual(len(results['results']), 4)
+        for result in results['results']:
+            self.assertGreater(result['p50_s'], 0)
+            self.assertGreater(result['rows'], 0)
+        self.assertIn('pandas', results['meta'])
+
+
+class TestMemoryAccounting(unittest.TestCase):
+
+    def test_markers_are_noops_when_inactive(self):
+        print('test_performance.markers_are_noops_when_inactive')
+        self.assertIsNone(get_memory_accountant())
+        with memory_stage('unused'):
+            record_copy('unused', create_mock_roster())
+        self.assertIsNone(get_memory_accountant())
+
+    def test_generate_roster_stages_and_copies(self):
+        print('test_performance.generate_roster_stages_and_copies')
+        roster_df = create_valued_roster()
+        recruits_df = create_mock_recruits()
+
+        with track_memory() as accountant:
+            generate_roster(roster_df, recruits_df, 'TEXAS TECH')
+
+        stages = accountant.stage_frame()
+        self.assertIn('generate_roster.advance_years', list(stages['stage']))
+        self.assertIn('generate_roster.combine', list(stages['stage']))
+        self.assertTrue((stages['peak_bytes'] >= 0).all())
+
+        copies = accountant.copy_frame()
+        self.assertIn('generate_roster.roster_copy', list(copies['copy']))
+        self.assertTrue((copies['bytes'] > 0).all())
+        self.assertIsNone(get_memory_accountant())
+
+    def test_value_calculation_records_column_savings(self):
+        print('test_performance.value_calculation_records_column_savings')
+        accountant = MemoryAccountant()
+        with track_memory(accountant):
+            optimized_value_calculation(create_valued_roster())
+
+        columns = accountant.column_frame()
+        overall = columns[columns['column'] == 'OVERALL'].iloc[0]
+        self.assertEqual(overall['dtype_after'], 'uint8')
+        self.assertGreater(overall['bytes_saved'], 0)
+        self.assertIn('value_calculation.optimize_datatypes',
+                      [stage['stage'] for stage in accountant.report()['stages']])
+
+    def test_column_memory_delta(self):
+        print('test_performance.column_memory_delta')
+        before = pd.DataFrame({'A': [1, 2, 3], 'B': ['x', 'y', 'x']})
+        after = before.astype({'A': 'uint8'})
+
+        usage = column_memory(before)
+        self.assertEqual(list(usage.columns), ['column', 'dtype', 'bytes'])
+        delta = column_memory_delta(before, after).set_index('column')
+        self.assertGreater(delta.loc['A', 'bytes_saved'], 0)
+        self.assertEqual(delta.loc['B', 'bytes_saved'], 0)
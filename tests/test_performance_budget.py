@@ -0,0 +1,102 @@
+# run with python3 -m unittest discover -s tests -p "test_*.py"
+# Set CFB_PERF_GATE=1 to also check timings against tests/performance_baseline.json
+# and how they scale with league size.
+# Refresh the baseline on the reference machine with:
+#   python -m cfb_dynasty.bench --scales 1 10 --repeat 5 --no-memory --save-baseline tests/performance_baseline.json
+import unittest
+import os
+import sys
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cfb_dynasty.analysis.roster_analysis import process_roster_and_create_recruiting_plan, scheme_fit
+from cfb_dynasty.bench import run_suite, compare_to_baseline, scaling_exponent
+from cfb_dynasty.bench.regression import format_regressions, load_results
+from cfb_dynasty.bench.suite import build_league_inputs
+from cfb_dynasty.data.roster_generator import generate_roster
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'performance_baseline.json')
+TOLERANCE = float(os.environ.get('CFB_PERF_TOLERANCE', '0.25'))
+
+# Linear work fits an exponent near 1; quadratic work fits near 2
+MAX_SCALING_EXPONENT = 1.4
+SCALING_TEAMS = (16, 32)
+
+
+def result_set(timings):
+    "builds a benchmark result payload from {(benchmark, teams): seconds}"
+    return {'results': [
+        {'benchmark': name, 'teams': teams, 'min_s': seconds}
+        for (name, teams), seconds in timings.items()
+    ]}
+
+
+class TestBaselineComparison(unittest.TestCase):
+
+    def test_flags_only_slowdowns_beyond_tolerance(self):
+        print('test_performance_budget.flags_slowdowns')
+        baseline = result_set({('scheme_fit', 10): 1.0, ('export_files', 10): 1.0, ('tiny', 1): 0.001})
+        current = result_set({('scheme_fit', 10): 1.5, ('export_files', 10): 1.1, ('tiny', 1): 0.01,
+                              ('new_benchmark', 1): 9.0})
+
+        regressions = compare_to_baseline(current, baseline, tolerance=0.25)
+
+        self.assertEqual([(r['benchmark'], r['teams']) for r in regressions], [('scheme_fit', 10)])
+        self.assertIn('scheme_fit @ 10 teams', format_regressions(regressions))
+
+
+@unittest.skipUnless(os.environ.get('CFB_PERF_GATE'), "set CFB_PERF_GATE=1 to run timing budget checks")
+class TestPerformanceBudget(unittest.TestCase):
+
+    def test_benchmarks_within_baseline(self):
+        print('test_performance_budget.benchmarks_within_baseline')
+        baseline = load_results(BASELINE_FILE)
+        scales = sorted({r['teams'] for r in baseline['results']})
+        results = run_suite(scales=scales, repeat=5, trace_memory=False)
+
+        regressions = compare_to_baseline(results, baseline, tolerance=TOLERANCE)
+        self.assertEqual(regressions, [], format_regressions(regressions, TOLERANCE))
+
+
+@unittest.skipUnless(os.environ.get('CFB_PERF_GATE'), "set CFB_PERF_GATE=1 to run scaling checks")
+class TestScaling(unittest.TestCase):
+    """Doubling the league should roughly double the work, never quadruple it."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.inputs = {teams: build_league_inputs(teams) for teams in SCALING_TEAMS}
+        cls.temp_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def assert_linear(self, func_for_size):
+        exponent = scaling_exponent(func_for_size, SCALING_TEAMS)
+        self.assertLess(exponent, MAX_SCALING_EXPONENT, f"runtime grows as n^{exponent:.2f}")
+
+    def test_generate_roster_scales_linearly(self):
+        print('test_performance_budget.generate_roster_scaling')
+
+        def work(teams):
+            inputs = self.inputs[teams]
+            roster_df = inputs['roster'].drop(columns=['RATING'])
+            return lambda: generate_roster(roster_df, inputs['recruits'], inputs['school'])
+
+        self.assert_linear(work)
+
+    def test_scheme_fit_scales_linearly(self):
+        print('test_performance_budget.scheme_fit_scaling')
+        self.assert_linear(lambda teams: lambda: scheme_fit(self.inputs[teams]['roster']))
+
+    def test_recruiting_plan_scales_linearly(self):
+        print('test_performance_budget.recruiting_plan_scaling')
+
+        def work(teams):
+            roster_path = os.path.join(self.temp_dir.name, f'{teams}_Roster.csv')
+            self.inputs[teams]['roster'].to_csv(roster_path, index=False)
+            return lambda: process_roster_and_create_recruiting_plan(roster_path)
+
+        self.assert_linear(work)
@@ -0,0 +1,87 @@
+# run with python3 -m unittest discover -s tests -p "test_*.py"
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cfb_dynasty.config.constants import DEFAULT_POSITION_REQUIREMENTS
+from cfb_dynasty.data.snapshot import load_or_build_analysis, load_snapshot, save_snapshot, snapshot_folder
+from tests.utils import create_mock_roster
+
+
+class TestSnapshots(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.snapshot_dir = os.path.join(self.temp_dir.name, 'snapshots')
+        self.roster_path = os.path.join(self.temp_dir.name, 'Test_Roster.csv')
+        roster_df = create_mock_roster()
+        roster_df['RATING'] = roster_df['OVERALL']
+        roster_df.to_csv(self.roster_path, index=False)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_second_load_comes_from_snapshot(self):
+        print('test_snapshot.second_load_comes_from_snapshot')
+        built = load_or_build_analysis(self.roster_path, folder=self.snapshot_dir)
+        loaded = load_snapshot(self.roster_path, self.snapshot_dir,
+                               params={'position_requirements': DEFAULT_POSITION_REQUIREMENTS})
+
+        self.assertIsNotNone(loaded)
+        self.assertEqual(set(loaded), {'roster', 'plan', 'positions'})
+        pd.testing.assert_frame_equal(loaded['plan'], built['plan'].reset_index(drop=True))
+        self.assertEqual(list(loaded['roster']['VALUE']), list(built['roster']['VALUE']))
+        self.assertEqual(loaded['roster']['POSITION'].dtype, 'category')
+
+    def test_snapshot_invalidated_by_size_or_mtime(self):
+        print('test_snapshot.snapshot_invalidated_by_size_or_mtime')
+        save_snapshot(self.roster_path, {'roster': create_mock_roster()}, self.snapshot_dir)
+        self.assertIsNotNone(load_snapshot(self.roster_path, self.snapshot_dir))
+
+        with open(self.roster_path, 'a', encoding='utf-8') as f:
+            f.write('\n')
+        self.assertIsNone(load_snapshot(self.roster_path, self.snapshot_dir))
+
+    def test_snapshot_invalidated_by_content_hash(self):
+        print('test_snapshot.snapshot_invalidated_by_content_hash')
+        save_snapshot(self.roster_path, {'roster': create_mock_roster()}, self.snapshot_dir)
+        stat = os.stat(self.roster_path)
+
+        # Same size and mtime, different contents
+        with open(self.roster_path, 'r+', encoding='utf-8') as f:
+            contents = f.read()
+            f.seek(0)
+            f.write(contents.replace('THOMAS', 'THOMPS'))
+        os.utime(self.roster_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertIsNotNone(load_snapshot(self.roster_path, self.snapshot_dir, verify_hash=False))
+        self.assertIsNone(load_snapshot(self.roster_path, self.snapshot_dir))
+
+    def test_snapshot_requires_matching_params(self):
+        print('test_snapshot.snapshot_requires_matching_params')
+        save_snapshot(self.roster_path, {'roster': create_mock_roster()}, self.snapshot_dir,
+                      params={'positions': ('QB', 'CB')})
+        self.assertIsNotNone(load_snapshot(self.roster_path, self.snapshot_dir, params={'positions': ['QB', 'CB']}))
+        self.assertIsNone(load_snapshot(self.roster_path, self.snapshot_dir, params={'positions': ['QB']}))
+
+    def test_same_name_in_other_folder_gets_own_snapshot(self):
+        print('test_snapshot.same_name_in_other_folder_gets_own_snapshot')
+        other_path = os.path.join(self.temp_dir.name, 'other', 'Test_Roster.csv')
+        os.makedirs(os.path.dirname(other_path))
+        shutil.copy2(self.roster_path, other_path)
+
+        save_snapshot(self.roster_path, {'roster': create_mock_roster()}, self.snapshot_dir)
+        self.assertNotEqual(snapshot_folder(self.roster_path, self.snapshot_dir),
+                            snapshot_folder(other_path, self.snapshot_dir))
+        self.assertIsNone(load_snapshot(other_path, self.snapshot_dir))
+        self.assertIsNotNone(load_snapshot(self.roster_path, self.snapshot_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# run with python3 -m unittest discover -s tests -p "test_*.py"
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+import pandas as pd
+import pyarrow.dataset as ds
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cfb_dynasty.data.roster_generator import generate_roster
+from cfb_dynasty.data.store import DynastyStore
+from cfb_dynasty.data.synthetic import generate_league
+from tests.utils import create_mock_recruits, create_mock_roster
+
+
+class TestDynastyStore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = DynastyStore(self.temp_dir.name)
+        self.league = generate_league(teams=3, seasons=3, seed=11)
+        self.store.write('rosters', self.league['roster'])
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_layout_is_partitioned_by_season_and_team(self):
+        print('test_store.layout_is_partitioned_by_season_and_team')
+        self.assertEqual(self.store.seasons('rosters'), [2025, 2026, 2027])
+        season_dir = os.path.join(self.temp_dir.name, 'rosters', 'SEASON=2026')
+        self.assertEqual(len(os.listdir(season_dir)), 3)
+
+    def test_read_prunes_columns_and_filters_rows(self):
+        print('test_store.read_prunes_columns_and_filters_rows')
+        qbs = self.store.read('rosters', columns=['FIRST NAME', 'LAST NAME', 'POSITION', 'SEASON'],
+                              filters=[('POSITION', '==', 'QB'), ('SEASON', '>=', 2026)])
+
+        roster_df = self.league['roster']
+        expected = roster_df[(roster_df['POSITION'] == 'QB') & (roster_df['SEASON'] >= 2026)]
+        self.assertEqual(list(qbs.columns), ['FIRST NAME', 'LAST NAME', 'POSITION', 'SEASON'])
+        self.assertEqual(len(qbs), len(expected))
+        self.assertEqual(set(qbs['SEASON']), {2026, 2027})
+        self.assertEqual(qbs['POSITION'].dtype, 'category')
+
+    def test_partition_filter_skips_other_files(self):
+        print('test_store.partition_filter_skips_other_files')
+        dataset = self.store._dataset('rosters')
+        self.assertEqual(len(list(dataset.get_fragments())), 9)
+        season_fragments = list(dataset.get_fragments(filter=ds.field('SEASON') == 2025))
+        self.assertEqual(len(season_fragments), 3)
+
+    def test_write_replaces_only_matching_partitions(self):
+        print('test_store.write_replaces_only_matching_partitions')
+        team = self.league['roster']['TEAM'].iloc[0]
+        before = len(self.store.read('rosters'))
+        team_roster = self.league['roster'][(self.league['roster']['TEAM'] == team) &
+                                            (self.league['roster']['SEASON'] == 2025)]
+
+        written = self.store.write('rosters', team_roster.head(10).drop(columns=['SEASON', 'TEAM']),
+                                   season=2025, team=team)
+
+        self.assertEqual(written, 10)
+        after = self.store.read('rosters')
+        self.assertEqual(len(after), before - len(team_roster) + 10)
+        self.assertEqual(len(self.store.read('rosters', filters=[('TEAM', '==', team), ('SEASON', '==', 2025)])), 10)
+
+    def test_write_requires_season_and_team(self):
+        print('test_store.write_requires_season_and_team')
+        with self.assertRaises(ValueError):
+            self.store.write('recruits', self.league['recruits'].drop(columns=['SEASON']))
+        with self.assertRaises(ValueError):
+            self.store.write('transfers', self.league['roster'])
+        self.assertEqual(self.store.seasons('plans'), [])
+        self.assertTrue(self.store.read('plans').empty)
+
+    def test_generated_roster_round_trips(self):
+        print('test_store.generated_roster_round_trips')
+        recruits_df = create_mock_recruits()
+        recruits_df.loc[0, 'COMMITTED TO'] = 'TEXAS TECH'
+        with patch('builtins.print'):
+            new_roster = generate_roster(create_mock_roster(), recruits_df, 'TEXAS TECH')
+        self.assertIn('', set(new_roster['OVERALL']))
+
+        with tempfile.TemporaryDirectory() as folder:
+            store = DynastyStore(folder)
+            self.assertEqual(store.write('rosters', new_roster, season=2028, team='TEXAS TECH'), len(new_roster))
+            stored = store.read('rosters')
+
+        self.assertEqual(len(stored), len(new_roster))
+        self.assertEqual(stored['OVERALL'].dtype, 'UInt8')
+        blanks = (new_roster['OVERALL'] == '').to_numpy()
+        self.assertTrue(stored['OVERALL'][blanks].isna().all())
+        self.assertEqual(stored['OVERALL'][~blanks].astype(int).tolist(),
+                         new_roster['OVERALL'][~blanks].astype(int).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
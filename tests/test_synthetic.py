@@ -0,0 +1,59 @@
+# run with python3 -m unittest discover -s tests -p "test_*.py"
+import unittest
+import os
+import sys
+import glob
+import tempfile
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cfb_dynasty.config.constants import DEFAULT_POSITION_REQUIREMENTS
+from cfb_dynasty.data.roster_generator import generate_roster
+from cfb_dynasty.data.synthetic import generate_league, write_league, load_hometowns
+
+
+class TestSyntheticLeague(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.league = generate_league(teams=4, seasons=2, seed=7)
+
+    def test_seeded_output_is_reproducible(self):
+        print('test_synthetic.seeded_output_is_reproducible')
+        again = generate_league(teams=4, seasons=2, seed=7)
+        pd.testing.assert_frame_equal(self.league['roster'], again['roster'])
+        pd.testing.assert_frame_equal(self.league['recruits'], again['recruits'])
+
+    def test_values_come_from_game_data(self):
+        print('test_synthetic.values_come_from_game_data')
+        roster_df = self.league['roster']
+        recruits_df = self.league['recruits']
+
+        self.assertEqual(len(roster_df), 4 * 85 * 2)
+        self.assertTrue(roster_df['POSITION'].isin(DEFAULT_POSITION_REQUIREMENTS.keys()).all())
+        for position, players in roster_df.groupby('POSITION'):
+            archetypes = DEFAULT_POSITION_REQUIREMENTS[position]['archetypes']
+            self.assertTrue(players['ARCHETYPE'].isin(archetypes.keys()).all())
+
+        hometowns = load_hometowns()
+        self.assertTrue(roster_df['CITY'].isin(hometowns['CITY']).all())
+        self.assertEqual(recruits_df.groupby('SEASON')['NATIONAL RANKING'].max().tolist(), [100, 100])
+
+    def test_written_files_feed_roster_generation(self):
+        print('test_synthetic.written_files_feed_roster_generation')
+        with tempfile.TemporaryDirectory() as folder:
+            write_league(self.league, folder)
+            roster_files = sorted(glob.glob(os.path.join(folder, '*[Rr]oster.csv')))
+            recruiting_files = sorted(glob.glob(os.path.join(folder, '*[Rr]ecruiting*.csv')))
+            self.assertEqual(len(roster_files), 2)
+            self.assertEqual(len(recruiting_files), 2)
+
+            roster_df = pd.read_csv(roster_files[0]).drop(columns=['RATING', 'SEASON'])
+            recruits_df = pd.read_csv(recruiting_files[0]).drop(columns=['SEASON'])
+            school = roster_df['TEAM'].iloc[0]
+            new_roster_df = generate_roster(roster_df, recruits_df, school)
+
+            commits = (recruits_df['COMMITTED TO'] == school).sum()
+            self.assertGreaterEqual(len(new_roster_df), commits)
@@ -8,12 +8,24 @@ experimental code not used by the main package functionality.
 
 import unittest
 import os
+import stat
 import sys
+import tempfile
+import pandas as pd
+from unittest import mock
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from cfb_dynasty.models.player import Player
+from cfb_dynasty.config.schema import GENERATION_COLUMNS, ROSTER_SCHEMA, RECRUIT_SCHEMA
+from cfb_dynasty.config.constants import DEFAULT_POSITION_REQUIREMENTS
+from cfb_dynasty.analysis.roster_analysis import calculate_player_value
+from cfb_dynasty.utils.export_writer import verify_exports, write_exports, write_json_atomic
+from cfb_dynasty.utils.file_utils import build_position_analysis, export_files, ingest_csv
+from cfb_dynasty.data.roster_generator import generate_roster, save_roster_to_csv
+from cfb_dynasty.utils.manifest import InputManifest
+from tests.utils import create_mock_roster, create_mock_recruits
 
 
 class TestUtilityFunctions(unittest.TestCase):
@@ -23,4 +35,308 @@ class TestUtilityFunctions(unittest.TestCase):
         """Placeholder test to maintain test structure."""
         # This test ensures the test file runs without errors
         # Future utility function tests can be added here
-        self.assertTrue(True)
\ No newline at end of file
+        self.assertTrue(True)
+
+
+class TestReadCsvWithSchema(unittest.TestCase):
+    """Test suite for schema-driven CSV reads."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.roster_path = os.path.join(self.temp_dir.name, 'Test_Roster.csv')
+        self.recruits_path = os.path.join(self.temp_dir.name, 'Test_Recruiting_Hub.csv')
+        create_mock_roster().to_csv(self.roster_path, index=False)
+        create_mock_recruits().to_csv(self.recruits_path, index=False)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_dtypes_applied_at_read(self):
+        """Categorical, small-int and string dtypes are set by the reader."""
+        roster_df = ingest_csv(self.roster_path, schema=ROSTER_SCHEMA)
+
+        self.assertIsInstance(roster_df['POSITION'].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(roster_df['YEAR'].dtype, pd.CategoricalDtype)
+        self.assertEqual(str(roster_df['OVERALL'].dtype), 'UInt8')
+        self.assertIsInstance(roster_df['FIRST NAME'].dtype, pd.StringDtype)
+
+    def test_falls_back_when_values_do_not_fit(self):
+        """A rating that doesn't fit the schema falls back to inferred dtypes."""
+        roster_df = create_mock_roster()
+        roster_df['OVERALL'] = ['91', '90', 'N/A*', '75']
+        roster_df.to_csv(self.roster_path, index=False)
+
+        loaded_df = ingest_csv(self.roster_path, schema=ROSTER_SCHEMA)
+        self.assertEqual(len(loaded_df), 4)
+        self.assertEqual(loaded_df['OVERALL'].dtype, object)
+
+    def test_generate_roster_with_schema_frames(self):
+        """Roster generation gives the same players for schema-typed inputs."""
+        expected = generate_roster(create_mock_roster(), create_mock_recruits(), 'TEXAS TECH')
+        result = generate_roster(
+            ingest_csv(self.roster_path, schema=ROSTER_SCHEMA),
+            ingest_csv(self.recruits_path, schema=RECRUIT_SCHEMA),
+            'TEXAS TECH'
+        )
+
+        self.assertEqual(list(result['FIRST NAME']), list(expected['FIRST NAME']))
+        self.assertEqual(list(result['YEAR']), list(expected['YEAR']))
+
+
+class TestIngestCsv(unittest.TestCase):
+    """Test suite for the shared CSV ingest path."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'Test_Recruiting_Hub.csv')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_header_variants_are_aliased(self):
+        """BASE RATING and national_rank load under their canonical names."""
+        recruits_df = create_mock_recruits().rename(columns={'BASE OVERALL': 'BASE RATING'})
+        recruits_df = recruits_df.rename(columns={'NATIONAL RANKING': 'national_rank'})
+        recruits_df.to_csv(self.path, index=False)
+
+        loaded_df = ingest_csv(self.path, schema=RECRUIT_SCHEMA)
+
+        self.assertIn('BASE OVERALL', loaded_df.columns)
+        self.assertIn('NATIONAL RANKING', loaded_df.columns)
+        self.assertEqual(str(loaded_df['NATIONAL RANKING'].dtype), 'UInt16')
+
+    def test_canonical_column_wins_over_alias(self):
+        """An alias is ignored when the file already has the canonical column."""
+        roster_df = create_mock_roster()
+        roster_df['BASE RATING'] = 1
+        roster_df.to_csv(self.path, index=False)
+
+        loaded_df = ingest_csv(self.path, schema=ROSTER_SCHEMA)
+
+        self.assertEqual(list(loaded_df['BASE OVERALL']), list(create_mock_roster()['BASE OVERALL']))
+        self.assertNotIn('BASE RATING', loaded_df.columns)
+
+    def test_projects_consumer_columns(self):
+        """Only the requested columns are parsed, so extra exports don't reach Player."""
+        roster_df = create_mock_roster()
+        roster_df['RATING'] = roster_df['OVERALL']
+        roster_df['SEASON'] = 2025
+        roster_df.to_csv(self.path, index=False)
+
+        loaded_df = ingest_csv(self.path, GENERATION_COLUMNS, ROSTER_SCHEMA)
+
+        self.assertNotIn('RATING', loaded_df.columns)
+        self.assertNotIn('SEASON', loaded_df.columns)
+        result = generate_roster(loaded_df, create_mock_recruits(), 'TEXAS TECH')
+        self.assertEqual(len(result), len(generate_roster(create_mock_roster(), create_mock_recruits(), 'TEXAS TECH')))
+
+    def test_matches_schema_read(self):
+        """The ingest path loads the same frame as a plain schema read."""
+        create_mock_roster().to_csv(self.path, index=False)
+        pd.testing.assert_frame_equal(ingest_csv(self.path, schema=ROSTER_SCHEMA),
+                                      pd.read_csv(self.path, dtype=ROSTER_SCHEMA))
+
+
+class TestPositionAnalysis(unittest.TestCase):
+    """Test suite for the grouped position summary and export."""
+
+    def setUp(self):
+        self.roster_df = pd.concat([create_mock_roster()] * 3, ignore_index=True)
+        self.roster_df['VALUE'] = self.roster_df.apply(calculate_player_value, axis=1)
+        self.roster_df.loc[4, 'VALUE'] = 500.0
+        self.roster_df.loc[4, 'FIRST NAME'] = 'TOP'
+
+    def test_matches_per_position_filters(self):
+        """Each summary row matches filtering the roster to that position."""
+        summary = build_position_analysis(self.roster_df, DEFAULT_POSITION_REQUIREMENTS).set_index('Position')
+
+        self.assertEqual(list(summary.index), [p for p in DEFAULT_POSITION_REQUIREMENTS
+                                               if p in set(self.roster_df['POSITION'])])
+        for pos, row in summary.iterrows():
+            pos_data = self.roster_df[self.roster_df['POSITION'] == pos]
+            top = pos_data.loc[pos_data['VALUE'].idxmax()]
+            self.assertEqual(row['Total_Players'], len(pos_data))
+            self.assertAlmostEqual(row['Avg_Value'], pos_data['VALUE'].mean())
+            self.assertEqual(row['Top_Player_Name'], f"{top['FIRST NAME']} {top['LAST NAME']}")
+            self.assertEqual(row['Graduating_Count'], (pos_data['STATUS'] == 'GRADUATING').sum())
+        self.assertEqual(summary.loc['QB', 'Top_Player_Name'], 'TOP THOMAS')
+
+    def test_export_writes_all_outputs(self):
+        """export_files writes the roster and position summary."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.assertTrue(export_files(folder=temp_dir, roster_df=self.roster_df,
+                                         position_requirements=DEFAULT_POSITION_REQUIREMENTS))
+            data_folder = os.path.join(temp_dir, 'cfb_dynasty_data')
+            self.assertEqual(sorted(os.listdir(data_folder)),
+                             ['export_manifest.json', 'player_values_analysis.csv',
+                              'position_analysis_detailed.csv'])
+
+
+class TestExportWriter(unittest.TestCase):
+    """Test suite for the atomic export writer."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = self.temp_dir.name
+        self.outputs = {'roster.csv': create_mock_roster(), 'recruits.csv': create_mock_recruits()}
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_manifest_records_rows_and_checksums(self):
+        """Every written file appears in the manifest and verifies."""
+        entries = write_exports(self.outputs, self.folder)
+
+        self.assertEqual(entries['roster.csv']['rows'], 4)
+        self.assertEqual(entries['recruits.csv']['rows'], 3)
+        self.assertEqual(verify_exports(self.folder), {'roster.csv': True, 'recruits.csv': True})
+        self.assertEqual(list(pd.read_csv(os.path.join(self.folder, 'roster.csv'))['LAST NAME']),
+                         list(create_mock_roster()['LAST NAME']))
+
+        with open(os.path.join(self.folder, 'roster.csv'), 'a', encoding='utf-8') as f:
+            f.write('tampered\n')
+        self.assertFalse(verify_exports(self.folder)['roster.csv'])
+
+    def test_compressed_exports_round_trip(self):
+        """gzip and zstd exports read back to the same rows."""
+        import pyarrow.csv as pa_csv
+
+        write_exports(self.outputs, self.folder, compression='gzip')
+        gz_df = pd.read_csv(os.path.join(self.folder, 'roster.csv.gz'))
+        self.assertEqual(list(gz_df['FIRST NAME']), list(create_mock_roster()['FIRST NAME']))
+
+        write_exports(self.outputs, self.folder, compression='zstd')
+        zst_table = pa_csv.read_csv(os.path.join(self.folder, 'recruits.csv.zst'))
+        self.assertEqual(zst_table.num_rows, 3)
+        self.assertTrue(all(verify_exports(self.folder).values()))
+
+    def test_failed_write_leaves_previous_files(self):
+        """If any output fails, no file is replaced and no temp files remain."""
+        write_exports(self.outputs, self.folder)
+        before = open(os.path.join(self.folder, 'roster.csv'), encoding='utf-8').read()
+
+        class Unwritable(pd.DataFrame):
+            def to_csv(self, *args, **kwargs):
+                raise OSError('disk full')
+
+        with self.assertRaises(OSError):
+            write_exports({'roster.csv': create_mock_roster().head(1), 'recruits.csv': Unwritable()},
+                          self.folder)
+
+        self.assertEqual(open(os.path.join(self.folder, 'roster.csv'), encoding='utf-8').read(), before)
+        self.assertEqual(sorted(os.listdir(self.folder)), ['export_manifest.json', 'recruits.csv', 'roster.csv'])
+
+    def test_exports_get_umask_permissions(self):
+        """Exports get the mode a plain open() would give, not mkstemp's 0600."""
+        previous = os.umask(0o022)
+        try:
+            write_exports(self.outputs, self.folder)
+        finally:
+            os.umask(previous)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.join(self.folder, 'roster.csv')).st_mode), 0o644)
+
+    def test_failed_json_write_removes_temp_file(self):
+        """An unserializable payload leaves neither a temp file nor a partial JSON file."""
+        path = os.path.join(self.folder, 'index.json')
+        with self.assertRaises(TypeError):
+            write_json_atomic(path, {'bad': object()})
+        self.assertEqual(os.listdir(self.folder), [])
+
+
+class TestInputManifest(unittest.TestCase):
+    """Test suite for input change detection."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = self.temp_dir.name
+        self.input_path = os.path.join(self.folder, 'Test_Roster.csv')
+        self.output_path = os.path.join(self.folder, 'out.csv')
+        create_mock_roster().to_csv(self.input_path, index=False)
+        create_mock_roster().to_csv(self.output_path, index=False)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_unchanged_inputs_are_current(self):
+        """A recorded run stays current across reloads and content-preserving touches."""
+        manifest = InputManifest(self.folder)
+        self.assertFalse(manifest.is_current('analysis', [self.input_path]))
+        manifest.record('analysis', [self.input_path], [self.output_path])
+        manifest.save()
+
+        reloaded = InputManifest(self.folder)
+        self.assertTrue(reloaded.is_current('analysis', [self.input_path]))
+        self.assertFalse(reloaded.is_current('rollover', [self.input_path]))
+
+        stat = os.stat(self.input_path)
+        os.utime(self.input_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertTrue(reloaded.is_current('analysis', [self.input_path]))
+
+    def test_changed_input_or_missing_output_is_stale(self):
+        """Edited inputs and deleted outputs force reprocessing."""
+        manifest = InputManifest(self.folder)
+        manifest.record('analysis', [self.input_path], [self.output_path])
+
+        with open(self.input_path, 'a', encoding='utf-8') as f:
+            f.write('\n')
+        self.assertFalse(manifest.is_current('analysis', [self.input_path]))
+
+        manifest.record('analysis', [self.input_path], [self.output_path])
+        os.remove(self.output_path)
+        self.assertFalse(manifest.is_current('analysis', [self.input_path]))
+
+    def test_rollover_skips_unchanged_files(self):
+        """A second save_roster_to_csv run skips rosters it already rolled over."""
+        create_mock_recruits().to_csv(os.path.join(self.folder, 'Test_Recruiting_Hub.csv'), index=False)
+        data_folder = os.path.join(self.folder, 'cfb_dynasty_data')
+
+        with mock.patch('cfb_dynasty.data.roster_generator.generate_roster',
+                        wraps=generate_roster) as rollover:
+            with mock.patch('builtins.input', return_value='TEXAS TECH') as school_prompt:
+                save_roster_to_csv(self.folder, data_folder)
+                save_roster_to_csv(self.folder, data_folder)
+                self.assertEqual(school_prompt.call_count, 2)
+            self.assertEqual(rollover.call_count, 1)
+
+            save_roster_to_csv(self.folder, data_folder, school_name='TEXAS TECH')
+            self.assertEqual(rollover.call_count, 1)
+            save_roster_to_csv(self.folder, data_folder, incremental=False, school_name='TEXAS TECH')
+            self.assertEqual(rollover.call_count, 2)
+        self.assertTrue(os.path.exists(os.path.join(data_folder, 'Test_Roster_New_Roster.csv')))
+
+    def test_second_run_skips_every_roster(self):
+        """Rosters write their own outputs, so one roster's run keeps the other's entry current."""
+        create_mock_roster().head(3).to_csv(os.path.join(self.folder, 'Other_Roster.csv'), index=False)
+        create_mock_recruits().to_csv(os.path.join(self.folder, 'Test_Recruiting_Hub.csv'), index=False)
+        data_folder = os.path.join(self.folder, 'cfb_dynasty_data')
+
+        with mock.patch('cfb_dynasty.data.roster_generator.generate_roster',
+                        wraps=generate_roster) as rollover, mock.patch('builtins.print'):
+            save_roster_to_csv(self.folder, data_folder, school_name='TEXAS TECH')
+            self.assertEqual(rollover.call_count, 2)
+            save_roster_to_csv(self.folder, data_folder, school_name='TEXAS TECH')
+            self.assertEqual(rollover.call_count, 2)
+
+        for name in ('Test_Roster_New_Roster.csv', 'Other_Roster_New_Roster.csv'):
+            self.assertTrue(os.path.exists(os.path.join(data_folder, name)))
+
+    def test_changed_params_are_stale(self):
+        """A different school or plan requirement reruns the stage."""
+        manifest = InputManifest(self.folder)
+        manifest.record('rollover', [self.input_path], [self.output_path], {'school': 'TEXAS TECH'})
+
+        self.assertTrue(manifest.is_current('rollover', [self.input_path], {'school': 'TEXAS TECH'}))
+        self.assertFalse(manifest.is_current('rollover', [self.input_path], {'school': 'BAYLOR'}))
+        self.assertFalse(manifest.is_current('rollover', [self.input_path]))
+
+        with mock.patch('cfb_dynasty.data.roster_generator.generate_roster',
+                        wraps=generate_roster) as rollover, mock.patch('builtins.print'):
+            create_mock_recruits().to_csv(os.path.join(self.folder, 'Test_Recruiting_Hub.csv'), index=False)
+            data_folder = os.path.join(self.folder, 'cfb_dynasty_data')
+            save_roster_to_csv(self.folder, data_folder, school_name='TEXAS TECH')
+            save_roster_to_csv(self.folder, data_folder, school_name='BAYLOR')
+            self.assertEqual(rollover.call_count, 2)
+
+
+
+
@@ -0,0 +1,138 @@
+# run with python3 -m unittest discover -s tests -p "test_*.py"
+import unittest
+import os
+import sys
+import tempfile
+import pandas as pd
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cfb_dynasty.analysis import roster_analysis
+from cfb_dynasty.watch import DirectoryWatcher, DynastyPipeline, watch
+from tests.utils import FakeClock, create_mock_roster, create_mock_recruits
+
+
+def write_roster(path):
+    roster_df = create_mock_roster()
+    roster_df['RATING'] = roster_df['OVERALL']
+    roster_df.to_csv(path, index=False)
+
+
+class TestDirectoryWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.clock = FakeClock()
+        self.watcher = DirectoryWatcher(self.temp_dir.name, ['*[Rr]oster.csv'], debounce=2.0, clock=self.clock)
+        self.path = os.path.join(self.temp_dir.name, 'Week1_Roster.csv')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_reports_file_once_after_it_settles(self):
+        print('test_watch.reports_file_once_after_it_settles')
+        write_roster(self.path)
+        open(os.path.join(self.temp_dir.name, 'notes.txt'), 'w').close()
+
+        self.assertEqual(self.watcher.poll(), [])
+        self.clock.now = 1.0
+        self.assertEqual(self.watcher.poll(), [])
+        self.clock.now = 2.5
+        self.assertEqual(self.watcher.poll(), [self.path])
+        self.clock.now = 10.0
+        self.assertEqual(self.watcher.poll(), [])
+
+    def test_changes_while_writing_restart_the_debounce(self):
+        print('test_watch.changes_while_writing_restart_the_debounce')
+        write_roster(self.path)
+        self.watcher.poll()
+
+        self.clock.now = 1.5
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('\n')
+        self.assertEqual(self.watcher.poll(), [])
+        self.clock.now = 3.0
+        self.assertEqual(self.watcher.poll(), [])
+        self.clock.now = 3.6
+        self.assertEqual(self.watcher.poll(), [self.path])
+
+
+class TestDynastyPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = self.temp_dir.name
+        self.roster_path = os.path.join(self.folder, 'Week1_Roster.csv')
+        self.recruits_path = os.path.join(self.folder, 'Week1_Recruiting_Hub.csv')
+        write_roster(self.roster_path)
+        create_mock_recruits().to_csv(self.recruits_path, index=False)
+        self.data_folder = os.path.join(self.folder, 'cfb_dynasty_data')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_runs_only_affected_stages(self):
+        print('test_watch.runs_only_affected_stages')
+        pipeline = DynastyPipeline(self.folder, school='TEXAS TECH')
+
+        ran = pipeline.run([self.roster_path, self.recruits_path])
+        self.assertEqual(ran, {'analysis': [self.roster_path], 'rollover': [self.roster_path]})
+        self.assertTrue(os.path.exists(os.path.join(self.data_folder, 'Week1_Roster_New_Roster.csv')))
+        self.assertTrue(os.path.exists(os.path.join(self.data_folder, 'Week1_Roster_recruiting_plan_analysis.csv')))
+
+        self.assertEqual(pipeline.run([self.roster_path]), {'analysis': [], 'rollover': []})
+
+        recruits_df = create_mock_recruits()
+        recruits_df.loc[0, 'COMMITTED TO'] = 'TEXAS TECH'
+        recruits_df.to_csv(self.recruits_path, index=False)
+        self.assertEqual(pipeline.run([self.recruits_path]), {'analysis': [], 'rollover': [self.roster_path]})
+
+    def test_new_export_leaves_earlier_exports_current(self):
+        print('test_watch.new_export_leaves_earlier_exports_current')
+        pipeline = DynastyPipeline(self.folder, school='TEXAS TECH')
+        pipeline.run([self.roster_path, self.recruits_path])
+
+        week2_path = os.path.join(self.folder, 'Week2_Roster.csv')
+        write_roster(week2_path)
+        ran = pipeline.run([week2_path])
+        self.assertEqual(ran, {'analysis': [week2_path], 'rollover': [week2_path]})
+
+        both = [self.roster_path, week2_path]
+        self.assertEqual(DynastyPipeline(self.folder, school='TEXAS TECH').run(both),
+                         {'analysis': [], 'rollover': []})
+
+    def test_restarted_pipeline_reuses_manifest(self):
+        print('test_watch.restarted_pipeline_reuses_manifest')
+        DynastyPipeline(self.folder, school='TEXAS TECH').run([self.roster_path])
+        restarted = DynastyPipeline(self.folder, school='TEXAS TECH')
+        self.assertEqual(restarted.run([self.roster_path]), {'analysis': [], 'rollover': []})
+
+    def test_watch_processes_dropped_files(self):
+        print('test_watch.watch_processes_dropped_files')
+        runs = []
+        watch(self.folder, interval=0, debounce=0, max_cycles=2, on_run=runs.append)
+
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(runs[0]['analysis'], [self.roster_path])
+        self.assertEqual(runs[0]['rollover'], [])
+
+    def test_watch_run_does_not_skip_command_line_analysis(self):
+        print('test_watch.watch_run_does_not_skip_command_line_analysis')
+        DynastyPipeline(self.folder).run([self.roster_path])
+
+        expanduser = os.path.expanduser
+        downloads = lambda path: self.folder if path == '~/Downloads' else expanduser(path)
+        with patch.object(roster_analysis.os.path, 'expanduser', side_effect=downloads), \
+                patch('builtins.print') as printed:
+            roster_analysis.main()
+
+        messages = ' '.join(str(call.args[0]) for call in printed.call_args_list if call.args)
+        self.assertNotIn('Unchanged since last run', messages)
+        self.assertTrue(os.path.exists(os.path.join(self.data_folder, 'Week1_Roster_player_values_corrected.csv')))
+        self.assertTrue(os.path.exists(os.path.join(self.data_folder, 'Week1_Roster_recruiting_plan.csv')))
+
+
+if __name__ == '__main__':
+    unittest.main()
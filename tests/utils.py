@@ -68,4 +68,15 @@ def add_player(roster_df, position=None, first_name=None, last_name=None,
         'REDSHIRT': [redshirt],
         'DRAFTED': [drafted]
     })
-    return pd.concat([roster_df, player], ignore_index=True)
\ No newline at end of file
+    return pd.concat([roster_df, player], ignore_index=True)
+
+class FakeClock:
+    "callable clock for time-dependent tests; returns a time moved only by advance()"
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds